@@ -0,0 +1,96 @@
+"""
+Community forum render benchmark: script time and element count per rerun
+
+Runs pages/community.py headlessly with streamlit.testing's AppTest and
+reports the median wall time of a full script run (a first visit) and of
+a rerun in the same session (what every Like, Reply or tab click costs),
+plus how many buttons and markdown blocks one run produces. Reads posts
+from the database DATABASE_URL points at; --seed bulk-inserts synthetic
+posts first, so use a scratch database:
+
+    python benchmarks/community_render.py --seed 1000
+    python benchmarks/community_render.py --load-more 3            # 60 posts loaded
+    python benchmarks/community_render.py --page pages/community.py pages/old_community.py
+
+Several --page versions are measured interleaved, so drift in machine load
+hits them alike. A page must sit in a directory next to the project root
+(like pages/) for its sys.path setup to find utils/ and config/.
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+os.environ.setdefault("GEMINI_WARM_UP", "false")
+
+from streamlit.testing.v1 import AppTest
+
+from config.settings import FORUM_CATEGORIES
+from utils import database
+
+
+def seed(count, rng):
+    words = ["career", "salary", "python", "health", "rights", "support", "mentor", "growth", "confidence"]
+    rows = ({"title": " ".join(rng.choices(words, k=6)), "content": " ".join(rng.choices(words, k=60)),
+             "category": rng.choice(FORUM_CATEGORIES), "likes": rng.randint(0, 500)} for _ in range(count))
+    inserted = database._bulk_insert("community_posts", rows)
+    print(f"🌱 Seeded {inserted:,} community posts", file=sys.stderr)
+
+
+def load_more(at, times):
+    """Click the forum's "Load older posts" button ``times`` times"""
+    for _ in range(times):
+        buttons = [b for b in at.button if b.label == "⬇️ Load older posts"]
+        if not buttons:
+            break
+        at = buttons[0].click().run()
+    return at
+
+
+def timed(run):
+    start = time.perf_counter()
+    at = run()
+    elapsed = (time.perf_counter() - start) * 1000
+    if at.exception:
+        raise RuntimeError(at.exception[0].value)
+    return at, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--page", nargs="+", default=[str(ROOT / "pages" / "community.py")])
+    parser.add_argument("--runs", type=int, default=30)
+    parser.add_argument("--load-more", type=int, default=0, help="Load this many extra pages of posts first")
+    parser.add_argument("--seed", type=int, default=0, help="Insert this many synthetic posts first")
+    args = parser.parse_args()
+
+    if args.seed:
+        seed(args.seed, random.Random(7))
+
+    results = {page: {"first": [], "rerun": []} for page in args.page}
+    for _ in range(args.runs):
+        for page in args.page:
+            at = AppTest.from_file(str(Path(page).resolve()), default_timeout=60)
+            at, elapsed = timed(at.run)
+            results[page]["first"].append(elapsed)
+            at = load_more(at, args.load_more)
+            at, elapsed = timed(at.run)
+            results[page]["rerun"].append(elapsed)
+            results[page]["elements"] = (len(at.button), len(at.markdown))
+
+    print(f"{'page':<32}{'first run (min/median)':>26}{'rerun (min/median)':>24}{'buttons':>9}{'markdown':>10}")
+    for page, result in results.items():
+        first, rerun = result["first"], result["rerun"]
+        buttons, markdown = result["elements"]
+        print(f"{Path(page).name:<32}{min(first):>13.1f} /{statistics.median(first):>7.1f} ms"
+              f"{min(rerun):>11.1f} /{statistics.median(rerun):>7.1f} ms{buttons:>9,}{markdown:>10,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+"""
+Query plan report: EXPLAIN (ANALYZE, BUFFERS) for every list and search helper
+
+Calls each helper in utils.database with representative arguments while a
+cursor wrapper runs EXPLAIN (ANALYZE, BUFFERS) on every statement it sends,
+then flags the plan nodes that defeat the indexes: sequential scans of app
+tables and explicit sorts. Run it against a database with realistic row
+counts; on a near-empty table the planner rightly prefers a sequential scan
+over any index, so --seed can bulk-insert synthetic rows first (into the
+database DATABASE_URL points at, so use a scratch database):
+
+    python benchmarks/explain_queries.py --seed 50000
+    python benchmarks/explain_queries.py --verbose      # print every plan
+
+Exits with status 1 when any helper's plan is flagged.
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+os.environ.setdefault("GEMINI_WARM_UP", "false")
+
+import psycopg2.extensions
+from psycopg2 import sql
+
+from config.settings import COURSE_CATEGORIES, COURSE_LEVELS, FORUM_CATEGORIES, LEGAL_CATEGORIES, STORY_CATEGORIES
+from utils import database
+
+# Helper name -> call; arguments mirror what the pages pass. The "(rare)"
+# cases filter on a value --seed never generates (it leaves out the last
+# entry of each category list): a selective filter is the
+# one a missing index hurts most, as the planner cannot just walk the order
+# index until it has a page of matches.
+CASES = {
+    "get_all_jobs": lambda: database.get_all_jobs(),
+    "get_all_jobs (page 2)": lambda: database.get_all_jobs(cursor=database.get_all_jobs()[1]),
+    "get_all_courses": lambda: database.get_all_courses(),
+    "get_all_courses (category)": lambda: database.get_all_courses("Technology"),
+    "get_success_stories": lambda: database.get_success_stories(),
+    "get_mentors": lambda: database.get_mentors(),
+    "get_community_posts": lambda: database.get_community_posts(),
+    "get_community_posts (category)": lambda: database.get_community_posts("Career Advice"),
+    "get_community_posts (hot)": lambda: database.get_community_posts(sort="hot"),
+    "get_community_posts (hot, page 2)": lambda: database.get_community_posts(
+        sort="hot", cursor=database.get_community_posts(sort="hot")[1]),
+    "get_community_posts (hot, category)": lambda: database.get_community_posts("Career Advice", sort="hot"),
+    "get_legal_rights": lambda: database.get_legal_rights(),
+    "get_legal_rights (category)": lambda: database.get_legal_rights("Workplace Rights"),
+    "search_jobs (text)": lambda: database.search_jobs("python remote"),
+    "search_jobs (job_type)": lambda: database.search_jobs(job_type="Full-time"),
+    "search_jobs (location)": lambda: database.search_jobs(location="Remote"),
+    "search_courses (text)": lambda: database.search_courses("data"),
+    "search_courses (level)": lambda: database.search_courses(level="Beginner"),
+    "search_stories (category)": lambda: database.search_stories(category="Career"),
+    "search_legal_rights (country)": lambda: database.search_legal_rights(country="India"),
+    "search_jobs (rare job_type)": lambda: database.search_jobs(job_type="Internship"),
+    "search_jobs (rare location)": lambda: database.search_jobs(location="Chennai"),
+    "search_courses (rare level)": lambda: database.search_courses(level=COURSE_LEVELS[-1]),
+    "search_stories (rare category)": lambda: database.search_stories(category=STORY_CATEGORIES[-1]),
+    "search_legal_rights (rare country)": lambda: database.search_legal_rights(country="Kenya"),
+    "get_legal_rights (rare category)": lambda: database.get_legal_rights(LEGAL_CATEGORIES[-1]),
+    "get_community_posts (rare category)": lambda: database.get_community_posts(FORUM_CATEGORIES[-1]),
+    "search_mentors (browse)": lambda: database.search_mentors(""),
+    "search_mentors (term)": lambda: database.search_mentors("software"),
+    "get_impact_metrics": lambda: database.get_impact_metrics(),
+}
+
+# Plan nodes worth a look, and what to say about them
+FLAGGED_NODES = {
+    "Seq Scan": "sequential scan",
+    "Sort": "sort",
+    "Incremental Sort": "incremental sort",
+}
+
+
+# Relations that are always one page, so a sequential scan is the best plan
+SINGLE_PAGE_RELATIONS = {"impact_metrics"}
+
+
+class ExplainCursor(psycopg2.extensions.cursor):
+    """Cursor that EXPLAIN ANALYZEs each SELECT before running it for real"""
+
+    plans = None  # Set per case: list collecting (statement, plan)
+
+    def execute(self, query, vars=None):
+        if isinstance(query, sql.Composable):
+            query = query.as_string(self)
+        statement = query.strip()
+        if ExplainCursor.plans is not None and statement.upper().startswith("SELECT") \
+                and "set_config(" not in statement:
+            super().execute("EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) " + statement, vars)
+            ExplainCursor.plans.append((statement, self.fetchone()[0][0]))
+        return super().execute(query, vars)
+
+
+_get_db_connection = database.get_db_connection
+
+
+@contextmanager
+def _explaining_connection(timeout_ms=None):
+    with _get_db_connection(timeout_ms=timeout_ms) as conn:
+        previous = conn.cursor_factory
+        conn.cursor_factory = ExplainCursor
+        try:
+            yield conn
+        finally:
+            conn.cursor_factory = previous
+
+
+def walk(node):
+    yield node
+    for child in node.get("Plans", []):
+        yield from walk(child)
+
+
+def findings(plan):
+    """Flagged nodes of one EXPLAIN plan as short descriptions"""
+    notes = []
+    for node in walk(plan["Plan"]):
+        kind = FLAGGED_NODES.get(node["Node Type"])
+        if kind is None:
+            continue
+        if node["Node Type"] == "Seq Scan":
+            target = node.get("Relation Name", "?")
+            if target.startswith("pg_") or node.get("Schema") == "information_schema" \
+                    or target in SINGLE_PAGE_RELATIONS:
+                continue
+        else:
+            target = ", ".join(node.get("Sort Key", []))
+        detail = f"{node.get('Actual Rows', 0):,} rows"
+        if node.get("Sort Method"):
+            detail += f", {node['Sort Method']}"
+        notes.append(f"{kind} on {target} ({detail})")
+    return notes
+
+
+def seed(count, rng):
+    """Bulk-insert ``count`` synthetic rows into every table the helpers read"""
+    words = ["python", "remote", "data", "career", "women", "leadership", "finance", "design",
+             "health", "rights", "workplace", "startup", "mentor", "growth", "skills", "legal"]
+
+    def text(n):
+        return " ".join(rng.choices(words, k=n))
+
+    def common(values):
+        return rng.choice(values[:-1])
+
+    rows = {
+        "jobs": lambda n: {"title": f"{text(2).title()} {n}", "company": f"Company {n % 500}",
+                           "location": rng.choice(["Bangalore", "Mumbai", "Delhi", "Pune", "Remote"]),
+                           "job_type": rng.choice(["Full-time", "Part-time", "Remote", "Contract"]),
+                           "description": text(60), "requirements": text(15)},
+        "courses": lambda n: {"title": f"{text(2).title()} {n}", "category": common(COURSE_CATEGORIES),
+                              "level": common(COURSE_LEVELS), "description": text(50), "instructor": text(2)},
+        "success_stories": lambda n: {"name": f"Member {n}", "title": text(4), "story": text(120),
+                                      "category": common(STORY_CATEGORIES)},
+        "mentors": lambda n: {"name": f"Mentor {n}", "email": f"seed-mentor-{n}-{rng.random():.12f}@example.com",
+                              "expertise": text(3), "bio": text(40), "rating": round(rng.uniform(3, 5), 2)},
+        "community_posts": lambda n: {"title": text(6), "content": text(80), "category": common(FORUM_CATEGORIES)},
+        "legal_rights": lambda n: {"title": text(5), "description": text(70), "category": common(LEGAL_CATEGORIES),
+                                   "country": rng.choice(["India", "USA", "UK"])},
+    }
+    for table, make in rows.items():
+        inserted = database._bulk_insert(table, (make(n) for n in range(count)))
+        print(f"🌱 Seeded {inserted:,} {table} rows", file=sys.stderr)
+
+    conn = database.get_db_connection_simple()
+    conn.autocommit = True
+    with conn.cursor() as cursor:
+        cursor.execute(sql.SQL("ANALYZE {}").format(sql.SQL(", ").join(map(sql.Identifier, rows))))
+    conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seed", type=int, default=0, help="Insert this many synthetic rows per table first")
+    parser.add_argument("--verbose", action="store_true", help="Print each statement and its full plan")
+    args = parser.parse_args()
+
+    if args.seed:
+        seed(args.seed, random.Random(7))
+
+    database.get_db_connection = _explaining_connection
+    flagged = 0
+    print(f"{'helper':<38}{'time':>10}{'buffers':>10}  findings")
+    for name, call in CASES.items():
+        ExplainCursor.plans = []
+        try:
+            call()
+        finally:
+            plans, ExplainCursor.plans = ExplainCursor.plans, None
+
+        for statement, plan in plans:
+            notes = findings(plan)
+            flagged += bool(notes)
+            buffers = plan["Plan"].get("Shared Hit Blocks", 0) + plan["Plan"].get("Shared Read Blocks", 0)
+            print(f"{name:<38}{plan['Execution Time']:>8.2f}ms{buffers:>10,}  "
+                  f"{'; '.join(notes) if notes else 'ok'}")
+            if args.verbose:
+                print(statement)
+                print(json.dumps(plan["Plan"], indent=2))
+        if not plans:
+            print(f"{name:<38}{'-':>10}{'-':>10}  no query ran (see errors above)")
+
+    print(f"\n{flagged} plan(s) flagged")
+    return 1 if flagged else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+"""
+Row memory benchmark: RealDictRow dicts vs utils.records vs card projection
+
+Generates synthetic job rows (deterministic for a given --seed) in three
+shapes and reports, per shape, the pickled size (what st.cache_data stores
+per entry) and the memory a session holds after a cache hit (st.cache_data
+unpickles a fresh copy for every caller):
+
+    dict    RealDictRow with every column, what the list helpers used to return
+    record  utils.records record with every column
+    card    record with CARD_PROJECTIONS["jobs"] columns plus the snippet
+
+    python benchmarks/row_memory.py --sizes 10 1000 100000
+"""
+
+import argparse
+import gc
+import os
+import pickle
+import random
+import sys
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+os.environ.setdefault("GEMINI_WARM_UP", "false")
+
+from psycopg2.extras import RealDictRow
+
+from config.database_config import CARD_PROJECTIONS
+from utils.records import make_records
+
+COLUMNS = ["id", "title", "company", "location", "job_type", "salary_range", "description",
+           "requirements", "posted_date", "is_active", "apply_link"]
+
+TITLES = ["Software Engineer", "Data Analyst", "Product Manager", "Content Writer", "HR Manager",
+          "UX Designer", "Marketing Lead", "Data Scientist", "Nurse", "Accountant", "Teacher"]
+COMPANIES = ["TechWomen", "EmpowerHer", "WomenFirst", "SheCodes", "RiseUp", "Shakti Labs"]
+LOCATIONS = ["Bangalore", "Mumbai", "Delhi", "Hyderabad", "Chennai", "Pune", "Remote"]
+WORDS = ["flexible", "remote", "team", "maternity", "benefits", "python", "java", "marketing",
+         "campaigns", "inclusive", "workplace", "growth", "mentorship", "hybrid", "analytics",
+         "design", "customers", "healthcare", "finance", "leadership", "startup", "training"]
+
+
+def make_tuples(count, seed):
+    """Job rows as a plain cursor returns them; descriptions of roughly 0.5-2 KB"""
+    rng = random.Random(seed)
+    start = datetime(2025, 1, 1)
+    rows = []
+    for n in range(count):
+        rows.append((
+            n,
+            rng.choice(TITLES),
+            rng.choice(COMPANIES),
+            rng.choice(LOCATIONS),
+            rng.choice(["Full-time", "Part-time", "Remote", "Contract"]),
+            f"₹{rng.randint(3, 20)}-{rng.randint(21, 40)} LPA",
+            " ".join(rng.choices(WORDS, k=rng.randint(60, 250))).capitalize() + ".",
+            " ".join(rng.choices(WORDS, k=rng.randint(20, 80))).capitalize() + ".",
+            start + timedelta(minutes=n),
+            True,
+            f"https://example.com/jobs/{n}/apply",
+        ))
+    return rows
+
+
+def shapes(tuples):
+    snippet_column, snippet_length = CARD_PROJECTIONS["jobs"]["snippet"]
+    card_columns = CARD_PROJECTIONS["jobs"]["columns"]
+    positions = [COLUMNS.index(column) for column in card_columns]
+    snippet_at = COLUMNS.index(snippet_column)
+    return {
+        "dict": lambda: [RealDictRow(zip(COLUMNS, row)) for row in tuples],
+        "record": lambda: make_records(COLUMNS, tuples),
+        "card": lambda: make_records(
+            card_columns + ["snippet"],
+            ([row[i] for i in positions] + [row[snippet_at][:snippet_length]] for row in tuples)
+        ),
+    }
+
+
+def held_bytes(payload):
+    """Bytes allocated by unpickling ``payload`` and keeping the result"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    rows = pickle.loads(payload)
+    held = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del rows
+    return held
+
+
+def run(size, seed):
+    tuples = make_tuples(size, seed)
+    print(f"\n== {size:,} rows")
+    print(f"{'shape':<8}{'pickled':>14}{'held after hit':>18}{'vs dict':>10}")
+
+    baseline = None
+    for name, build in shapes(tuples).items():
+        payload = pickle.dumps(build(), protocol=pickle.HIGHEST_PROTOCOL)
+        held = held_bytes(payload)
+        if baseline is None:
+            baseline = held
+        print(f"{name:<8}{len(payload) / 1024:>11,.1f} KB{held / 1024:>15,.1f} KB{baseline / held:>9.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 1_000, 100_000])
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        run(size, args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Search benchmark: utils.search.SearchIndex vs utils.helpers.search_filter
+
+Generates synthetic job rows (deterministic for a given --seed), builds an
+index over them, then times a fixed set of queries with both approaches.
+search_filter is what every rerun used to pay; the index pays its build
+once per data version and then only the per-query cost:
+
+    python benchmarks/search_index.py --sizes 1000 100000 1000000
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.helpers import search_filter
+from utils.search import build_index
+
+FIELDS = {"title": 3.0, "company": 2.0, "location": 1.0, "description": 1.0}
+
+TITLES = ["Software Engineer", "Data Analyst", "Product Manager", "Content Writer", "HR Manager",
+          "UX Designer", "Marketing Lead", "Data Scientist", "Nurse", "Accountant", "Teacher",
+          "Frontend Developer", "Backend Engineer", "Sales Executive", "Project Coordinator"]
+COMPANIES = ["TechWomen", "EmpowerHer", "WomenFirst", "SheCodes", "RiseUp", "Shakti Labs",
+             "Nari Finance", "BrightPath", "Udaan Health", "Kalpana Systems"]
+LOCATIONS = ["Bangalore", "Mumbai", "Delhi", "Hyderabad", "Chennai", "Pune", "Remote"]
+WORDS = ["flexible", "remote", "team", "maternity", "benefits", "python", "java", "marketing",
+         "campaigns", "inclusive", "workplace", "growth", "mentorship", "hybrid", "analytics",
+         "design", "customers", "healthcare", "finance", "leadership", "startup", "training",
+         "community", "research", "product", "sql", "cloud", "writing", "seo", "recruitment"]
+
+QUERIES = ["engineer", "data analyst", "mark", "python remote", "shakti", "maternity benefits pune", "zzzz"]
+
+
+def make_rows(count, seed):
+    rng = random.Random(seed)
+    # A long tail of rarer words so the vocabulary grows with the data
+    rare = [f"skill{n}" for n in range(max(count // 20, 50))]
+    rows = []
+    for n in range(count):
+        words = rng.choices(WORDS, k=rng.randint(8, 20)) + rng.choices(rare, k=2)
+        rows.append({
+            "id": n,
+            "title": rng.choice(TITLES),
+            "company": rng.choice(COMPANIES),
+            "location": rng.choice(LOCATIONS),
+            "description": " ".join(words).capitalize() + ".",
+        })
+    return rows
+
+
+def best_of(fn, repeats):
+    """Median seconds of ``repeats`` calls, plus the last result"""
+    samples = []
+    result = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples), result
+
+
+def run(size, seed):
+    rows = make_rows(size, seed)
+    repeats = 5 if size <= 100_000 else 3
+
+    start = time.perf_counter()
+    index = build_index(rows, FIELDS)
+    build_s = time.perf_counter() - start
+
+    extra = make_rows(100, seed + 1)
+    start = time.perf_counter()
+    for row in extra:
+        index.add(row, at_front=True)
+    add_ms = (time.perf_counter() - start) * 1000 / len(extra)
+    rows.extend(extra)
+
+    stats = index.stats()
+    print(f"\n== {size:,} rows  (build {build_s:.2f}s, add {add_ms:.3f} ms/row, "
+          f"{stats['terms']:,} terms, {stats['postings']:,} postings)")
+    print(f"{'query':<26}{'search_filter':>15}{'index':>12}{'speedup':>10}{'hits (filter/index)':>22}")
+
+    for query in QUERIES:
+        scan_s, scanned = best_of(
+            lambda: search_filter(rows, query, ["title", "company", "location", "description"]), repeats
+        )
+        index_s, found = best_of(lambda: index.search(query), repeats)
+        speedup = scan_s / index_s if index_s else float("inf")
+        print(f"{query!r:<26}{scan_s * 1000:>12.2f} ms{index_s * 1000:>9.2f} ms{speedup:>9.1f}x"
+              f"{len(scanned):>11,} / {len(found):,}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 100_000, 1_000_000])
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    print("search_filter matches the whole query as one substring; the index matches")
+    print("every word (or word prefix) anywhere in the row, so hit counts can differ.")
+    for size in args.sizes:
+        run(size, args.seed)
+
+
+if __name__ == "__main__":
+    main()
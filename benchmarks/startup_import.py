@@ -0,0 +1,93 @@
+"""
+Startup benchmark: wall-clock cost of `import utils.helpers`
+
+Every page imports utils.helpers, so its import time is paid on each cold
+start. Each run happens in a fresh interpreter. Pass --ref to also time an
+older revision of the tree (extracted with `git archive`) for comparison:
+
+    python benchmarks/startup_import.py --runs 5 --ref 992bdf5
+
+Set GEMINI_API_KEY to measure with a key configured (model probing only
+happens when a key is present).
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+IMPORT_SNIPPET = (
+    "import sys, time; sys.path.insert(0, {root!r}); "
+    "t = time.perf_counter(); import utils.helpers; "
+    "print(time.perf_counter() - t)"
+)
+
+
+def time_import(root, timeout):
+    """Seconds spent importing utils.helpers under `root`, or None on timeout"""
+    code = IMPORT_SNIPPET.format(root=str(root))
+    start = time.perf_counter()
+    try:
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=root,
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+        )
+    except subprocess.TimeoutExpired:
+        return None
+
+    if result.returncode != 0:
+        raise RuntimeError(f"import failed under {root}:\n{result.stderr[-2000:]}")
+    # Last stdout line is the measurement; anything before it is module prints
+    try:
+        return float(result.stdout.strip().splitlines()[-1])
+    except (IndexError, ValueError):
+        return time.perf_counter() - start
+
+
+def run_series(label, root, runs, timeout):
+    samples = []
+    for _ in range(runs):
+        elapsed = time_import(root, timeout)
+        if elapsed is None:
+            print(f"{label:>12}: timed out after {timeout}s")
+            return
+        samples.append(elapsed)
+
+    print(
+        f"{label:>12}: median {statistics.median(samples) * 1000:8.1f} ms   "
+        f"min {min(samples) * 1000:8.1f} ms   max {max(samples) * 1000:8.1f} ms   ({runs} runs)"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--timeout", type=float, default=60.0, help="per-run timeout in seconds")
+    parser.add_argument("--ref", help="git revision to compare against (e.g. the baseline commit)")
+    args = parser.parse_args()
+
+    print("⏱️  import utils.helpers")
+    print(f"   GEMINI_API_KEY set: {bool(os.getenv('GEMINI_API_KEY'))}")
+
+    if args.ref:
+        with tempfile.TemporaryDirectory() as tmp:
+            archive = subprocess.run(
+                ["git", "archive", args.ref], cwd=PROJECT_ROOT, capture_output=True, check=True
+            )
+            subprocess.run(["tar", "-x", "-C", tmp], input=archive.stdout, check=True)
+            run_series(args.ref, Path(tmp), args.runs, args.timeout)
+
+    run_series("working tree", PROJECT_ROOT, args.runs, args.timeout)
+
+
+if __name__ == "__main__":
+    main()
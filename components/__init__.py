@@ -32,6 +32,8 @@ from .navbar import (
     sidebar_menu
 )
 
+from .ai_response import ai_response_stream
+
 __all__ = [
     'feature_card',
     'job_card',
@@ -51,4 +53,5 @@ __all__ = [
     'achievement_badge',
     'custom_navbar',
     'sidebar_menu',
+    'ai_response_stream',
 ]
@@ -0,0 +1,29 @@
+"""
+AI Response Components
+"""
+
+import streamlit as st
+
+from utils.helpers import chatbot_response_stream
+
+
+def ai_response_stream(user_message, context, title=None, icon="🤖"):
+    """
+    Render an AI answer token by token as Gemini generates it
+
+    Args:
+        user_message: Prompt passed to chatbot_response_stream
+        context: Assistant context (also the response-cache namespace)
+        title: Optional heading shown above the answer
+        icon: Emoji shown before the title
+
+    Returns:
+        The full answer text once streaming has finished
+    """
+    with st.container(border=True):
+        if title:
+            st.markdown(f"#### {icon} {title}")
+        response = st.write_stream(chatbot_response_stream(user_message, context))
+
+    # write_stream returns a list only when a chunk was not a string
+    return response if isinstance(response, str) else "".join(map(str, response))
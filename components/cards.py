@@ -1,4 +1,13 @@
 import streamlit as st
+from config.database_config import CARD_PROJECTIONS
+
+def _snippet(row, table):
+    """Card preview text: the precomputed snippet of a card-projected row, else the long column cut to size"""
+    snippet = row.get('snippet')
+    if snippet is None:
+        column, length = CARD_PROJECTIONS[table]["snippet"]
+        snippet = (row.get(column) or 'N/A')[:length]
+    return snippet
 
 def feature_card(icon, title, description, link=None):
     """Display a feature card with icon, title, and description"""
@@ -23,7 +32,7 @@ def job_card(job):
                 💼 {job.get('job_type', 'N/A')} | 💰 {job.get('salary_range', 'N/A')}
             </p>
             <p style="color: #666; line-height: 1.6; margin-bottom: 15px;">
-                {job.get('description', 'N/A')[:150]}...
+                {_snippet(job, 'jobs')}...
             </p>
             <div style="display: flex; justify-content: space-between; align-items: center;">
                 <span style="color: #999; font-size: 12px;">Posted: {job.get('posted_date', 'N/A')}</span>
@@ -46,7 +55,7 @@ def course_card(course):
                 👨‍🏫 {course.get('instructor', 'N/A')} | ⏱️ {course.get('duration', 'N/A')}
             </p>
             <p style="color: #666; line-height: 1.6; margin-bottom: 15px;">
-                {course.get('description', 'N/A')[:120]}...
+                {_snippet(course, 'courses')}...
             </p>
             <div style="display: flex; justify-content: space-between; align-items: center;">
                 <span style="color: #667eea; font-size: 18px; font-weight: 600;">
@@ -64,7 +73,7 @@ def success_story_card(story):
             <h3 style="color: #667eea; margin-bottom: 5px;">{story.get('name', 'Anonymous')}</h3>
             <p style="color: #999; font-size: 14px; margin-bottom: 15px;">{story.get('title', 'N/A')}</p>
             <p style="color: #666; line-height: 1.8; font-style: italic; margin-bottom: 15px;">
-                "{story.get('story', 'N/A')[:200]}..."
+                "{_snippet(story, 'success_stories')}..."
             </p>
             <div style="display: flex; justify-content: space-between; align-items: center;">
                 <span style="background: #f0f2f6; padding: 5px 15px; border-radius: 15px; font-size: 12px; color: #667eea;">
@@ -84,7 +93,7 @@ def mentor_card(mentor):
                 💼 {mentor.get('expertise', 'N/A')}
             </p>
             <p style="color: #666; line-height: 1.6; margin-bottom: 15px;">
-                {mentor.get('bio', 'N/A')[:150]}...
+                {_snippet(mentor, 'mentors')}...
             </p>
             <div style="display: flex; justify-content: space-between; align-items: center;">
                 <span style="color: #f59e0b;">⭐ {mentor.get('rating', 0.0)} ({mentor.get('total_mentees', 0)} mentees)</span>
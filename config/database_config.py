@@ -28,6 +28,8 @@ POOL_CONFIG = {
     "min_connections": 1,
     "max_connections": 10,
     "connection_timeout": 30,
+    "health_check_interval": 30,  # Ping connections idle longer than this (seconds)
+    "max_idle_time": 300,  # Replace connections idle longer than this (seconds)
 }
 
 # Query timeout settings
@@ -35,6 +37,108 @@ QUERY_CONFIG = {
     "statement_timeout": 30000,  # 30 seconds
     "lock_timeout": 5000,  # 5 seconds
     "idle_in_transaction_session_timeout": 60000,  # 60 seconds
+    "page_read_timeout": 5000,  # 5 seconds, per-query override for page reads
+    "stream_itersize": 2000,  # Rows per round trip for server-side (streaming) cursors
+    "stream_idle_timeout": 600000,  # 10 minutes a streaming consumer may pause between batches
+    "bulk_page_size": 1000,  # Rows per multi-row INSERT statement in bulk loads
+}
+
+# Cross-process cache invalidation (LISTEN/NOTIFY). Opt-in: every replica
+# opens one extra, long-lived connection for the listener thread. The
+# triggers come from migrations/0002_notify_triggers.py; changing the
+# channel or tables later needs a new migration.
+NOTIFY_CONFIG = {
+    "enabled": os.getenv("DB_CACHE_LISTENER", "false").lower() == "true",
+    "channel": os.getenv("DB_CACHE_CHANNEL", "table_changes"),
+    "tables": ["users", "jobs", "courses", "success_stories", "mentors", "community_posts", "legal_rights"],
+    "reconnect_delay": 5,  # seconds
+}
+
+# Full-text search: each table gets a generated, weighted tsvector column
+# ("search_vector") with a GIN index (migrations/0003_full_text_search.py).
+# Weights run A (strongest) to D.
+FULL_TEXT_SEARCH = {
+    "language": "english",
+    "tables": {
+        "jobs": {
+            "weights": {"title": "A", "company": "B", "location": "C", "description": "C", "requirements": "D"},
+            "order_by": "posted_date",
+        },
+        "courses": {
+            "weights": {"title": "A", "category": "B", "instructor": "C", "description": "C"},
+            "order_by": "created_at",
+        },
+        "success_stories": {
+            "weights": {"title": "A", "category": "B", "name": "C", "story": "C"},
+            "order_by": "date_posted",
+        },
+        "legal_rights": {
+            "weights": {"title": "A", "category": "B", "law_reference": "B", "description": "C"},
+            "order_by": "created_at",
+        },
+    },
+}
+
+# Schema migrations (see utils/migrations.py). Concurrent runs serialize on
+# an advisory lock; DDL gives up on a busy table after lock_timeout rather
+# than stalling every query queued behind it, and is retried on the next run.
+MIGRATION_CONFIG = {
+    "lock_key": 7_261_830_518,  # Any bigint unique to this app's database
+    "lock_wait": 300,  # Seconds to wait for another instance's run
+    "statement_timeout": 0,  # No limit: index builds on big tables take a while
+    "lock_timeout": 5000,  # 5 seconds
+    # Apply pending migrations when a process first opens the pool
+    "run_on_startup": os.getenv("DB_MIGRATE_ON_STARTUP", "false").lower() == "true",
+}
+
+# Impact metrics materialized view (migrations/0007_impact_metrics.sql).
+# Each process refreshes it in the background every refresh_interval
+# seconds; an advisory lock and the view's own refreshed_at mean only one
+# replica actually recomputes it per interval. Set DB_METRICS_REFRESH=false
+# to refresh from cron with `python init_database.py refresh-metrics`.
+METRICS_CONFIG = {
+    "refresh_interval": int(os.getenv("DB_METRICS_REFRESH_INTERVAL", "300")),  # seconds
+    "refresh_in_app": os.getenv("DB_METRICS_REFRESH", "true").lower() == "true",
+    "retry_after": 30,  # Seconds the fallback numbers are served after a failed read
+    "lock_key": 7_261_830_519,
+}
+
+# Community likes are buffered per process and written in batches
+# (utils/write_behind.py). flush_interval is also the most a crash can lose.
+LIKES_CONFIG = {
+    "flush_interval": 2.0,  # seconds
+    "max_pending": 1000,  # Flush early once this many posts have unwritten likes
+}
+
+# Fuzzy mentor search (pg_trgm). Rows whose expertise or name has a word
+# sequence at least this similar to the search term match, so typos such
+# as "softwre engneering" still find "Software Engineering".
+MENTOR_SEARCH = {
+    "similarity_threshold": 0.4,
+    "limit": 50,
+}
+
+# Card projections: the columns each listing card shows, plus the long text
+# column it previews, cut to the card's length in SQL and returned as
+# "snippet". Cached page reads use these so full descriptions, stories and
+# bios never reach the Streamlit cache.
+CARD_PROJECTIONS = {
+    "jobs": {
+        "columns": ["id", "title", "company", "location", "job_type", "salary_range", "posted_date", "apply_link"],
+        "snippet": ("description", 150),
+    },
+    "courses": {
+        "columns": ["id", "title", "category", "level", "duration", "instructor", "price", "is_free", "rating"],
+        "snippet": ("description", 120),
+    },
+    "success_stories": {
+        "columns": ["id", "name", "title", "category", "date_posted"],
+        "snippet": ("story", 200),
+    },
+    "mentors": {
+        "columns": ["id", "name", "expertise", "available_slots", "rating", "total_mentees"],
+        "snippet": ("bio", 150),
+    },
 }
 
 # SSL Configuration
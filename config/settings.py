@@ -31,7 +31,12 @@ COLORS = {
     "gradient_end": "#764ba2",
 }
 
-# Impact metrics (mock data - replace with database queries in production)
+# Impact metrics shown when the database is unreachable, and the floor under
+# the live numbers from the impact_metrics materialized view
+# (utils.database.get_impact_metrics): the programme's figures predate the
+# app, which has no sign-ups yet and mostly anonymous posts, so women_helped
+# and community_members would otherwise read about 0. satisfaction_rate has
+# no source in the database and always comes from here.
 IMPACT_METRICS = {
     "women_helped": 50000,
     "jobs_posted": 1200,
@@ -187,7 +192,9 @@ PAGINATION = {
     "courses_per_page": 12,
     "stories_per_page": 9,
     "posts_per_page": 15,
+    "replies_per_page": 10,
     "mentors_per_page": 12,
+    "legal_rights_per_page": 20,
 }
 
 # API Configuration
@@ -196,6 +203,76 @@ API_CONFIG = {
     "openai_max_tokens": 300,
     "openai_temperature": 0.7,
     "request_timeout": 30,
+    # Gemini models, tried in order until one answers
+    "gemini_models": [
+        "gemini-2.5-flash",       # Most reliable (Free Tier Standard)
+        "gemini-2.5-pro",         # Standard Pro
+        "gemini-pro",             # Legacy Stable
+        "gemini-2.5-flash-exp",   # New lightweight
+    ],
+    "gemini_model_cache_file": os.getenv("GEMINI_MODEL_CACHE", ".gemini_model.json"),
+    "gemini_model_cache_ttl": 86400,  # Re-probe models once a day
+    "gemini_model_retry_after": 60,  # Seconds before retrying after no model could be selected
+    # Pick the model in a background thread at startup
+    "gemini_warm_up": os.getenv("GEMINI_WARM_UP", "true").lower() == "true",
+    # Model backend: "live", "record", "replay" or "fake" (see utils/llm_backends.py)
+    "llm_backend": os.getenv("LLM_BACKEND", "live").lower(),
+    "llm_cassette": os.getenv("LLM_CASSETTE", "llm_cassette.jsonl"),
+    "llm_fake_latency_ms": int(os.getenv("LLM_FAKE_LATENCY_MS", "0")),
+    "llm_fake_chunk_delay_ms": int(os.getenv("LLM_FAKE_CHUNK_DELAY_MS", "0")),
+}
+
+# LLM gateway (see utils/llm_gateway.py). Per-session limits come from RATE_LIMITS.
+LLM_GATEWAY_CONFIG = {
+    "max_concurrent_requests": int(os.getenv("LLM_MAX_CONCURRENCY", "8")),
+    "max_queue_depth": int(os.getenv("LLM_MAX_QUEUE", "32")),
+    "global_requests_per_minute": int(os.getenv("LLM_GLOBAL_RPM", "60")),
+}
+
+# Circuit breaker in front of the AI service (see utils/circuit_breaker.py)
+CIRCUIT_BREAKER_CONFIG = {
+    "failure_threshold": 5,  # Consecutive failures before serving fallbacks
+    "recovery_timeout": 30,  # Seconds between background recovery probes
+}
+
+# Operations page (pages/ops.py). It shows upstream error details and can
+# override the circuit breaker, so it stays locked unless OPS_ADMIN_TOKEN
+# is set, and then asks for that token.
+OPS_CONFIG = {
+    "admin_token": os.getenv("OPS_ADMIN_TOKEN", ""),
+}
+
+# AI response cache (see utils/ai_cache.py)
+AI_CACHE_CONFIG = {
+    "enabled": os.getenv("AI_CACHE_ENABLED", "true").lower() == "true",
+    "backend": os.getenv("AI_CACHE_BACKEND", "memory"),  # "memory" or "sqlite"
+    "sqlite_path": os.getenv("AI_CACHE_PATH", ".ai_cache.sqlite3"),
+    "max_entries": 2000,
+    "default_ttl": 3600,  # 1 hour
+    # Per-context TTL overrides in seconds (0 = never cache)
+    "context_ttl": {
+        "Interviewer": 86400,
+        "Safety Expert": 21600,
+        "Job Recommendation": 86400,
+        "Course Recommendation": 86400,
+        "Indian Legal Rights": 86400,
+        "Safety Analyst": 3600,
+    },
+    # Personal conversations and deliberately varied output always go to the model
+    "excluded_contexts": [
+        "Mental Health Support",
+        "Quiz Generator",
+    ],
+}
+
+# In-memory search index (see utils/search.py); weights favour title matches
+SEARCH_CONFIG = {
+    "k1": 1.2,
+    "b": 0.75,
+    "max_prefix_expansions": 50,
+    "fields": {
+        "courses": {"title": 3.0, "category": 2.0, "instructor": 1.0, "description": 1.0},
+    },
 }
 
 # Cache settings (for Streamlit caching)
@@ -251,6 +328,9 @@ SECURITY_CONFIG = {
     "max_login_attempts": 5,
     "password_min_length": 8,
     "require_email_verification": False,  # Future feature
+    # Reverse proxies in front of the app that append to X-Forwarded-For;
+    # 0 = clients connect directly and the socket address is used
+    "trusted_proxy_count": int(os.getenv("TRUSTED_PROXY_COUNT", "1")),
 }
 
 # Localization settings
@@ -278,6 +358,7 @@ DB_TABLES = {
     "resources": "resources",
     "mentors": "mentors",
     "community_posts": "community_posts",
+    "community_replies": "community_replies",
     "emergency_contacts": "emergency_contacts",
     "health_records": "health_records",
     "legal_rights": "legal_rights",
@@ -324,6 +405,7 @@ ERROR_MESSAGES = {
     "validation": "❌ Please fill in all required fields correctly.",
     "unauthorized": "❌ You need to log in to perform this action.",
     "not_found": "❌ Requested resource not found.",
+    "timeout": "⏳ This is taking longer than usual. Please refresh in a moment.",
 }
 
 # Info messages
@@ -1,21 +1,45 @@
 """
 Database Initialization Script
-Run this once to create all tables and populate with sample data
+Run this to create or upgrade the schema (migrations/) and load data
+
+Usage:
+    python init_database.py                                 # apply pending migrations
+    python init_database.py migrate --dry-run               # print pending SQL only
+    python init_database.py migrate --status
+    python init_database.py export jobs                     # CSV to stdout
+    python init_database.py export mentors -f ndjson -o mentors.ndjson
+    python init_database.py load                            # import assets/data/*.json
+    python init_database.py load catalogs/jobs.json
+    python init_database.py refresh-metrics                 # from cron, with DB_METRICS_REFRESH=false
 """
 
+import argparse
+import os
 import sys
+import time
 from pathlib import Path
 
 sys.path.append(str(Path(__file__).parent))
 
-from utils.database import init_database
+# These commands never call Gemini; skip the model warm-up (and its output,
+# which would otherwise land in an export streamed to stdout)
+os.environ.setdefault("GEMINI_WARM_UP", "false")
 
-def main():
+from utils.database import (
+    init_database, get_db_connection_simple, refresh_impact_metrics, STREAMING_READERS, BULK_LOADERS,
+)
+from utils.migrations import Migrator
+from utils.export import EXPORT_WRITERS
+from utils.json_stream import iter_json_items
+
+CATALOG_DIR = Path(__file__).parent / "assets" / "data"
+
+def run_init(args):
     print("🚀 Initializing Women Empowerment Hub Database...")
     print("=" * 60)
-    
+
     success = init_database()
-    
+
     if success:
         print("\n✅ Database initialized successfully!")
         print("\n📊 All tables created:")
@@ -26,12 +50,118 @@ def main():
         print("   - resources")
         print("   - mentors")
         print("   - community_posts")
+        print("   - community_replies")
         print("   - emergency_contacts")
         print("   - health_records")
         print("   - legal_rights")
         print("\n🎉 You're all set! Run 'streamlit run streamlit_app.py' to start the app.")
     else:
         print("\n❌ Database initialization failed. Please check your DATABASE_URL in .env file.")
+    return 0 if success else 1
+
+def run_migrate(args):
+    if args.status:
+        status = Migrator(connect=get_db_connection_simple).status()
+        if status is None:
+            return 1
+        for migration, applied_at in status:
+            state = f"applied {applied_at:%Y-%m-%d %H:%M}" if applied_at else "pending"
+            print(f"{migration.label:<40} {state}")
+        return 0
+
+    success = init_database(dry_run=args.dry_run, target=args.target)
+    return 0 if success else 1
+
+def run_export(args):
+    rows = STREAMING_READERS[args.table](itersize=args.itersize)
+    write = EXPORT_WRITERS[args.format]
+
+    start = time.perf_counter()
+    try:
+        if args.output == "-":
+            count = write(rows, sys.stdout)
+        else:
+            with open(args.output, "w", encoding="utf-8", newline="") as f:
+                count = write(rows, f)
+    except Exception as e:
+        print(f"❌ Export of {args.table} failed: {e}", file=sys.stderr)
+        return 1
+
+    # Progress goes to stderr so stdout stays a clean data stream
+    print(f"✅ Exported {count:,} {args.table} rows in {time.perf_counter() - start:.1f}s", file=sys.stderr)
+    return 0
+
+def run_load(args):
+    # Each file loads into the table named by its stem, e.g. jobs.json -> jobs
+    paths = [Path(p) for p in args.files] or sorted(CATALOG_DIR.glob("*.json"))
+    if not paths:
+        print(f"⚠️ No catalogs found in {CATALOG_DIR}")
+        return 0
+
+    failed = False
+    for path in paths:
+        table = path.stem
+        loader = BULK_LOADERS.get(table)
+        if loader is None:
+            print(f"⏭️ {path.name}: no bulk loader for a '{table}' table, skipped")
+            continue
+
+        start = time.perf_counter()
+        with open(path, encoding="utf-8") as f:
+            count = loader(iter_json_items(f), page_size=args.page_size)
+        if count is None:
+            print(f"❌ {path.name}: import failed, nothing loaded into {table}")
+            failed = True
+        else:
+            print(f"✅ {path.name}: {count:,} rows loaded into {table} in {time.perf_counter() - start:.1f}s")
+    return 1 if failed else 0
+
+def run_refresh_metrics(args):
+    start = time.perf_counter()
+    refreshed = refresh_impact_metrics()
+    if refreshed is None:
+        return 1
+    if refreshed:
+        print(f"✅ Impact metrics refreshed in {time.perf_counter() - start:.1f}s")
+    else:
+        print("⏭️ Impact metrics are being refreshed by another process, skipped")
+    return 0
+
+def main():
+    parser = argparse.ArgumentParser(description="Women Empowerment Hub database tools")
+    subparsers = parser.add_subparsers(dest="command")
+
+    subparsers.add_parser("init", help="Apply pending migrations (default)")
+
+    migrate_parser = subparsers.add_parser("migrate", help="Apply, preview or list schema migrations")
+    migrate_parser.add_argument("--dry-run", action="store_true", help="Print pending migrations' SQL without running it")
+    migrate_parser.add_argument("--target", type=int, default=None, help="Stop after this migration version")
+    migrate_parser.add_argument("--status", action="store_true", help="List migrations and when each was applied")
+
+    export_parser = subparsers.add_parser("export", help="Stream a table to CSV or NDJSON")
+    export_parser.add_argument("table", choices=sorted(STREAMING_READERS))
+    export_parser.add_argument("-f", "--format", choices=sorted(EXPORT_WRITERS), default="csv")
+    export_parser.add_argument("-o", "--output", default="-", help="Output file (default: stdout)")
+    export_parser.add_argument("--itersize", type=int, default=None,
+                               help="Rows fetched per round trip (default: QUERY_CONFIG['stream_itersize'])")
+
+    load_parser = subparsers.add_parser("load", help="Import JSON catalogs (default: assets/data/*.json)")
+    load_parser.add_argument("files", nargs="*", help="Catalog files named after their table, e.g. jobs.json")
+    load_parser.add_argument("--page-size", type=int, default=None,
+                             help="Rows per INSERT statement (default: QUERY_CONFIG['bulk_page_size'])")
+
+    subparsers.add_parser("refresh-metrics", help="Recompute the impact_metrics materialized view")
+
+    args = parser.parse_args()
+    if args.command == "migrate":
+        return run_migrate(args)
+    if args.command == "export":
+        return run_export(args)
+    if args.command == "load":
+        return run_load(args)
+    if args.command == "refresh-metrics":
+        return run_refresh_metrics(args)
+    return run_init(args)
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
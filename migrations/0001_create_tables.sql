@@ -0,0 +1,114 @@
+-- Baseline schema: the tables init_database() used to create directly.
+-- IF NOT EXISTS keeps this a no-op on databases created before migrations.
+
+CREATE TABLE IF NOT EXISTS users (
+    id SERIAL PRIMARY KEY,
+    email VARCHAR(255) UNIQUE NOT NULL,
+    name VARCHAR(255) NOT NULL,
+    phone VARCHAR(20),
+    location VARCHAR(255),
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS jobs (
+    id SERIAL PRIMARY KEY,
+    title VARCHAR(255) NOT NULL,
+    company VARCHAR(255) NOT NULL,
+    location VARCHAR(255),
+    job_type VARCHAR(50),
+    salary_range VARCHAR(100),
+    description TEXT,
+    requirements TEXT,
+    posted_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    is_active BOOLEAN DEFAULT TRUE,
+    apply_link VARCHAR(500)
+);
+
+CREATE TABLE IF NOT EXISTS courses (
+    id SERIAL PRIMARY KEY,
+    title VARCHAR(255) NOT NULL,
+    category VARCHAR(100),
+    level VARCHAR(50),
+    duration VARCHAR(100),
+    description TEXT,
+    instructor VARCHAR(255),
+    price DECIMAL(10, 2) DEFAULT 0.00,
+    is_free BOOLEAN DEFAULT TRUE,
+    enrollment_count INTEGER DEFAULT 0,
+    rating DECIMAL(3, 2) DEFAULT 0.00,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS success_stories (
+    id SERIAL PRIMARY KEY,
+    name VARCHAR(255) NOT NULL,
+    title VARCHAR(255),
+    story TEXT NOT NULL,
+    image_url VARCHAR(500),
+    category VARCHAR(100),
+    date_posted TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    is_approved BOOLEAN DEFAULT TRUE
+);
+
+CREATE TABLE IF NOT EXISTS resources (
+    id SERIAL PRIMARY KEY,
+    title VARCHAR(255) NOT NULL,
+    category VARCHAR(100),
+    resource_type VARCHAR(50),
+    description TEXT,
+    url VARCHAR(500),
+    file_path VARCHAR(500),
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS mentors (
+    id SERIAL PRIMARY KEY,
+    name VARCHAR(255) NOT NULL,
+    email VARCHAR(255) UNIQUE NOT NULL,
+    expertise VARCHAR(255),
+    bio TEXT,
+    linkedin_url VARCHAR(500),
+    available_slots INTEGER DEFAULT 5,
+    rating DECIMAL(3, 2) DEFAULT 0.00,
+    total_mentees INTEGER DEFAULT 0,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS community_posts (
+    id SERIAL PRIMARY KEY,
+    user_id INTEGER,
+    title VARCHAR(255) NOT NULL,
+    content TEXT NOT NULL,
+    category VARCHAR(100),
+    likes INTEGER DEFAULT 0,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS emergency_contacts (
+    id SERIAL PRIMARY KEY,
+    country VARCHAR(100),
+    service_name VARCHAR(255) NOT NULL,
+    phone_number VARCHAR(20) NOT NULL,
+    description TEXT,
+    is_active BOOLEAN DEFAULT TRUE
+);
+
+CREATE TABLE IF NOT EXISTS health_records (
+    id SERIAL PRIMARY KEY,
+    user_id INTEGER,
+    record_type VARCHAR(100),
+    record_date DATE,
+    notes TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS legal_rights (
+    id SERIAL PRIMARY KEY,
+    title VARCHAR(255) NOT NULL,
+    category VARCHAR(100),
+    description TEXT NOT NULL,
+    country VARCHAR(100),
+    law_reference VARCHAR(255),
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
@@ -0,0 +1,37 @@
+"""
+Statement-level triggers that announce every write on NOTIFY_CONFIG["channel"]
+so replicas running the cache listener can drop stale entries.
+
+Rendered from NOTIFY_CONFIG when applied; changing the channel or the table
+list later needs a new migration.
+"""
+
+from psycopg2 import sql
+
+from config.database_config import NOTIFY_CONFIG
+
+
+def statements():
+    queries = [
+        """
+        CREATE OR REPLACE FUNCTION notify_table_change() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify(TG_ARGV[0], TG_TABLE_NAME);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    ]
+    for table in NOTIFY_CONFIG["tables"]:
+        queries.extend([
+            sql.SQL("DROP TRIGGER IF EXISTS {} ON {}").format(
+                sql.Identifier(f"{table}_notify_change"), sql.Identifier(table)
+            ),
+            sql.SQL("""
+            CREATE TRIGGER {} AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {}
+            FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change({})
+            """).format(
+                sql.Identifier(f"{table}_notify_change"), sql.Identifier(table), sql.Literal(NOTIFY_CONFIG["channel"])
+            ),
+        ])
+    return queries
@@ -0,0 +1,33 @@
+"""
+Weighted tsvector columns maintained by Postgres itself, plus GIN indexes
+for the search_* helpers.
+
+Rendered from FULL_TEXT_SEARCH when applied; changing the weights later
+needs a new migration.
+"""
+
+from psycopg2 import sql
+
+from config.database_config import FULL_TEXT_SEARCH
+
+
+def statements():
+    language = sql.Literal(FULL_TEXT_SEARCH["language"])
+    queries = []
+    for table, search in FULL_TEXT_SEARCH["tables"].items():
+        document = sql.SQL(" || ").join(
+            sql.SQL("setweight(to_tsvector({}::regconfig, coalesce({}, '')), {})").format(
+                language, sql.Identifier(column), sql.Literal(weight)
+            )
+            for column, weight in search["weights"].items()
+        )
+        queries.extend([
+            sql.SQL("""
+            ALTER TABLE {} ADD COLUMN IF NOT EXISTS search_vector tsvector
+            GENERATED ALWAYS AS ({}) STORED
+            """).format(sql.Identifier(table), document),
+            sql.SQL("CREATE INDEX IF NOT EXISTS {} ON {} USING GIN (search_vector)").format(
+                sql.Identifier(f"{table}_search_idx"), sql.Identifier(table)
+            ),
+        ])
+    return queries
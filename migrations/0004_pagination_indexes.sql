@@ -0,0 +1,14 @@
+-- migrate: no-transaction
+-- Composite indexes matching each list helper's keyset order, so every page
+-- is a short index range scan. Built CONCURRENTLY so writes keep flowing
+-- while they build on a populated table.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS jobs_active_posted_idx ON jobs (posted_date, id) WHERE is_active = TRUE;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS courses_created_idx ON courses (created_at, id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS courses_category_created_idx ON courses (category, created_at, id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS success_stories_approved_posted_idx ON success_stories (date_posted, id) WHERE is_approved = TRUE;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS mentors_rating_idx ON mentors (rating, id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS community_posts_created_idx ON community_posts (created_at, id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS community_posts_category_created_idx ON community_posts (category, created_at, id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS legal_rights_created_idx ON legal_rights (created_at, id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS legal_rights_category_created_idx ON legal_rights (category, created_at, id);
@@ -0,0 +1,9 @@
+-- migrate: optional
+-- Trigram indexes for fuzzy mentor search; they also serve ILIKE '%term%'.
+-- Managed databases may not allow the extension: the migration is then
+-- skipped (and retried on the next run) and search_mentors falls back to
+-- plain ILIKE matching.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+CREATE INDEX IF NOT EXISTS mentors_expertise_trgm_idx ON mentors USING GIN (expertise gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS mentors_name_trgm_idx ON mentors USING GIN (name gin_trgm_ops);
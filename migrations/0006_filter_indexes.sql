@@ -0,0 +1,13 @@
+-- migrate: no-transaction
+-- Indexes for the equality filters of the search_* helpers, each leading
+-- with the filter column and ending with the helper's keyset order. Without
+-- them a filter value that matches few rows walks the whole order index (or
+-- the planner falls back to a sequential scan and sort). Partial where the
+-- helper always adds the same condition. Find gaps with
+-- benchmarks/explain_queries.py.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS jobs_active_type_posted_idx ON jobs (job_type, posted_date, id) WHERE is_active = TRUE;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS jobs_active_location_posted_idx ON jobs (location, posted_date, id) WHERE is_active = TRUE;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS courses_level_created_idx ON courses (level, created_at, id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS success_stories_approved_category_posted_idx ON success_stories (category, date_posted, id) WHERE is_approved = TRUE;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS legal_rights_country_created_idx ON legal_rights (country, created_at, id);
@@ -0,0 +1,21 @@
+-- Site-wide impact numbers for the home page and sidebar, computed once per
+-- refresh instead of on every page view. The unique index lets
+-- REFRESH MATERIALIZED VIEW CONCURRENTLY (see refresh_impact_metrics) swap
+-- in new numbers without blocking readers.
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS impact_metrics AS
+SELECT
+    1 AS id,
+    (SELECT COUNT(*) FROM users) AS women_helped,
+    (SELECT COUNT(*) FROM jobs) AS jobs_posted,
+    (SELECT COUNT(*) FROM courses) AS courses_available,
+    (SELECT COUNT(*) FROM mentors WHERE available_slots > 0) AS mentors_active,
+    (SELECT COUNT(*) FROM success_stories WHERE is_approved = TRUE) AS success_stories,
+    (SELECT COUNT(DISTINCT user_id) FROM community_posts) AS community_members,
+    -- Sign-ups in the last 30 days as a percentage of everyone before them
+    (SELECT COALESCE(ROUND(100.0 * COUNT(*) FILTER (WHERE created_at >= now() - INTERVAL '30 days')
+                           / NULLIF(COUNT(*) FILTER (WHERE created_at < now() - INTERVAL '30 days'), 0)), 0)::INTEGER
+     FROM users) AS monthly_growth,
+    now() AS refreshed_at;
+
+CREATE UNIQUE INDEX IF NOT EXISTS impact_metrics_id_idx ON impact_metrics (id);
@@ -0,0 +1,31 @@
+-- Replies to community posts. The (post_id, created_at, id) index serves a
+-- post's thread page by page; community_posts.reply_count is kept in step
+-- by a trigger so the forum list shows counts without touching this table.
+
+CREATE TABLE IF NOT EXISTS community_replies (
+    id SERIAL PRIMARY KEY,
+    post_id INTEGER NOT NULL REFERENCES community_posts(id) ON DELETE CASCADE,
+    user_id INTEGER,
+    content TEXT NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_community_replies_post_created
+    ON community_replies (post_id, created_at, id);
+
+ALTER TABLE community_posts ADD COLUMN IF NOT EXISTS reply_count INTEGER NOT NULL DEFAULT 0;
+
+CREATE OR REPLACE FUNCTION community_replies_count() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        UPDATE community_posts SET reply_count = reply_count + 1 WHERE id = NEW.post_id;
+    ELSE
+        UPDATE community_posts SET reply_count = reply_count - 1 WHERE id = OLD.post_id;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS community_replies_count ON community_replies;
+CREATE TRIGGER community_replies_count AFTER INSERT OR DELETE ON community_replies
+FOR EACH ROW EXECUTE FUNCTION community_replies_count();
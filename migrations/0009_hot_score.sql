@@ -0,0 +1,29 @@
+-- "Hot" ranking for community posts. Each post's score is
+--     log10(max(likes + 2 * replies, 1)) + created_at (epoch seconds) / 45000
+-- so every tenfold increase in engagement is worth 12.5 hours of recency.
+-- The age term is fixed per post, which lets the score be stored and
+-- indexed: ordering by it decays older posts without ever recomputing
+-- them. A trigger updates it only when likes, replies or created_at change
+-- (likes arrive in batches from the write-behind buffer, replies from the
+-- community_replies trigger). Existing rows are scored by
+-- 0010_hot_score_backfill.sql in batches, so this migration's ALTER TABLE
+-- lock is held only briefly.
+
+ALTER TABLE community_posts ADD COLUMN IF NOT EXISTS hot_score DOUBLE PRECISION NOT NULL DEFAULT 0;
+
+CREATE OR REPLACE FUNCTION community_hot_score(likes INTEGER, replies INTEGER, created_at TIMESTAMP)
+RETURNS DOUBLE PRECISION AS $$
+    SELECT log(GREATEST(COALESCE(likes, 0) + 2 * COALESCE(replies, 0), 1)::DOUBLE PRECISION)
+           + EXTRACT(EPOCH FROM COALESCE(created_at, LOCALTIMESTAMP))::DOUBLE PRECISION / 45000
+$$ LANGUAGE sql STABLE;
+
+CREATE OR REPLACE FUNCTION community_posts_hot_score() RETURNS trigger AS $$
+BEGIN
+    NEW.hot_score := community_hot_score(NEW.likes, NEW.reply_count, NEW.created_at);
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS community_posts_hot_score ON community_posts;
+CREATE TRIGGER community_posts_hot_score BEFORE INSERT OR UPDATE OF likes, reply_count, created_at ON community_posts
+FOR EACH ROW EXECUTE FUNCTION community_posts_hot_score();
@@ -0,0 +1,21 @@
+-- migrate: no-transaction
+-- Score the posts that existed before 0009_hot_score.sql, 10,000 ids per
+-- transaction, so each batch holds its row locks only briefly and vacuum
+-- can reclaim the old row versions as it goes. Rows the trigger already
+-- scored are skipped, so a rerun after a failure picks up where it stopped.
+
+DO $$
+DECLARE
+    batch_start INTEGER := 0;
+    last_id INTEGER;
+BEGIN
+    SELECT COALESCE(MAX(id), 0) INTO last_id FROM community_posts;
+    WHILE batch_start < last_id LOOP
+        UPDATE community_posts SET hot_score = community_hot_score(likes, reply_count, created_at)
+        WHERE id > batch_start AND id <= batch_start + 10000
+          AND hot_score IS DISTINCT FROM community_hot_score(likes, reply_count, created_at);
+        COMMIT;
+        batch_start := batch_start + 10000;
+    END LOOP;
+END
+$$;
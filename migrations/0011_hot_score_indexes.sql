@@ -0,0 +1,6 @@
+-- migrate: no-transaction
+-- Keyset indexes for get_community_posts(sort="hot"), overall and per
+-- category, so a hot page is a short index scan however many posts exist.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS community_posts_hot_idx ON community_posts (hot_score, id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS community_posts_category_hot_idx ON community_posts (category, hot_score, id);
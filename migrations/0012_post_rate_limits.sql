@@ -0,0 +1,11 @@
+-- Per-author post counters for the RATE_LIMITS["posts_per_day"] flood limit
+-- (utils.database.insert_community_post). One row per author per hour, so
+-- checking the sliding 24-hour window sums at most 24 primary-key rows
+-- instead of counting the author's posts.
+
+CREATE TABLE IF NOT EXISTS community_post_counters (
+    limiter_key VARCHAR(255) NOT NULL,
+    bucket TIMESTAMP NOT NULL,
+    posts INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (limiter_key, bucket)
+);
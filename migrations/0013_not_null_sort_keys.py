@@ -0,0 +1,45 @@
+"""
+NOT NULL on every keyset sort column.
+
+_keyset_page pages with ``(sort_key, id) < (last_key, last_id)`` under
+``ORDER BY sort_key DESC``: a NULL sort key sorts first and makes that
+comparison NULL, so the page after it came back empty. NULLs are replaced
+with the column's default, then the constraint is added the low-lock way:
+a NOT VALID check, validated without blocking writes, lets SET NOT NULL
+skip its own full-table scan.
+"""
+
+from psycopg2 import sql
+
+NO_TRANSACTION = True
+
+# (table, column, value for existing NULLs)
+SORT_COLUMNS = [
+    ("jobs", "posted_date", "CURRENT_TIMESTAMP"),
+    ("courses", "created_at", "CURRENT_TIMESTAMP"),
+    ("success_stories", "date_posted", "CURRENT_TIMESTAMP"),
+    ("mentors", "rating", "0"),
+    ("community_posts", "created_at", "CURRENT_TIMESTAMP"),
+    ("community_replies", "created_at", "CURRENT_TIMESTAMP"),
+    ("legal_rights", "created_at", "CURRENT_TIMESTAMP"),
+]
+
+
+def statements():
+    queries = []
+    for table, column, fill in SORT_COLUMNS:
+        names = {
+            "table": sql.Identifier(table),
+            "column": sql.Identifier(column),
+            "check": sql.Identifier(f"{table}_{column}_not_null"),
+            "fill": sql.SQL(fill),
+        }
+        queries.extend(query.format(**names) for query in [
+            sql.SQL("UPDATE {table} SET {column} = {fill} WHERE {column} IS NULL"),
+            sql.SQL("ALTER TABLE {table} DROP CONSTRAINT IF EXISTS {check}"),
+            sql.SQL("ALTER TABLE {table} ADD CONSTRAINT {check} CHECK ({column} IS NOT NULL) NOT VALID"),
+            sql.SQL("ALTER TABLE {table} VALIDATE CONSTRAINT {check}"),
+            sql.SQL("ALTER TABLE {table} ALTER COLUMN {column} SET NOT NULL"),
+            sql.SQL("ALTER TABLE {table} DROP CONSTRAINT {check}"),
+        ])
+    return queries
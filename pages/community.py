@@ -1,4 +1,5 @@
 import streamlit as st
+import html
 import sys
 from pathlib import Path
 from datetime import datetime
@@ -8,8 +9,14 @@ import time
 sys.path.append(str(Path(__file__).parent.parent))
 
 from utils.css_loader import load_css
-from utils.database import get_community_posts
-from utils.helpers import time_ago, show_success_message
+from utils.database import (
+    get_community_posts, get_replies, insert_reply, insert_community_post, increment_post_likes,
+    get_pending_post_likes, QueryTimeoutError, PostLimitError,
+)
+from utils.llm_gateway import current_session_id
+from utils.helpers import time_ago, show_success_message, fetch_pages, load_more_button
+from config.settings import ERROR_MESSAGES, RATE_LIMITS, SECURITY_CONFIG
+from config.database_config import QUERY_CONFIG
 
 # Load CSS
 load_css()
@@ -25,6 +32,23 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # ==================== SIDEBAR - CREATE POST ====================
+def post_limiter_key():
+    """
+    Who the daily post limit counts against when nobody is logged in: the
+    client IP, which, unlike the session id, survives a page reload.
+
+    Assumes SECURITY_CONFIG["trusted_proxy_count"] reverse proxies in front
+    of the app, each appending the address it saw to X-Forwarded-For. Only
+    the hops they appended can be trusted - anything further left is
+    whatever the client sent - so the client is the Nth hop from the right.
+    With no proxies, or fewer hops than proxies, the socket address is used.
+    """
+    trusted = SECURITY_CONFIG["trusted_proxy_count"]
+    hops = [hop.strip() for value in st.context.headers.get_all("X-Forwarded-For")
+            for hop in value.split(",") if hop.strip()]
+    client_ip = hops[-trusted] if 0 < trusted <= len(hops) else st.context.ip_address
+    return f"ip:{client_ip}" if client_ip else f"session:{current_session_id()}"
+
 st.sidebar.markdown("### ✍️ Create New Post")
 with st.sidebar.expander("➕ New Post", expanded=False):
     with st.form("create_post_form"):
@@ -39,19 +63,30 @@ with st.sidebar.expander("➕ New Post", expanded=False):
         
         if submitted:
             if post_title and post_content:
-                # In a real scenario, you would call insert_community_post() here
-                # db.insert_post(post_title, post_content, post_category)
-                st.success("Post published successfully! 🎉")
-                time.sleep(1)
-                st.rerun()
+                try:
+                    # Logged-in authors are limited by user id, everyone else by client
+                    user_id = st.session_state.get("user_id")
+                    post_id = insert_community_post(
+                        post_title, post_content, post_category, user_id=user_id,
+                        limiter_key=None if user_id else post_limiter_key()
+                    )
+                except PostLimitError:
+                    st.warning(f"You can publish up to {RATE_LIMITS['posts_per_day']} posts a day. Please try again later.")
+                else:
+                    if post_id:
+                        st.success("Post published successfully! 🎉")
+                        time.sleep(1)
+                        st.rerun()
+                    else:
+                        st.error(ERROR_MESSAGES["database"])
             else:
                 st.error("Please fill in all fields")
 
 # ==================== DATA LOADING ====================
-# 1. Define Sample Data (Fallback)
+# 1. Define Sample Data (Fallback) - id None: these aren't community_posts rows
 sample_posts = [
     {
-        "id": 101,
+        "id": None,
         "title": "How to negotiate salary as a woman in tech?",
         "author": "TechGirl23",
         "category": "Career Advice",
@@ -61,7 +96,7 @@ sample_posts = [
         "time": "2 hours ago"
     },
     {
-        "id": 102,
+        "id": None,
         "title": "Learning Python - Best resources for beginners?",
         "author": "CodeNewbie",
         "category": "Tech & Coding",
@@ -71,7 +106,7 @@ sample_posts = [
         "time": "5 hours ago"
     },
     {
-        "id": 103,
+        "id": None,
         "title": "Dealing with imposter syndrome",
         "author": "SelfDoubt101",
         "category": "Personal Growth",
@@ -81,7 +116,7 @@ sample_posts = [
         "time": "1 day ago"
     },
     {
-        "id": 104,
+        "id": None,
         "title": "PCOS management - natural remedies?",
         "author": "HealthyLiving",
         "category": "Health & Wellness",
@@ -92,27 +127,50 @@ sample_posts = [
     }
 ]
 
-# 2. Fetch Real Data from DB
-db_data = get_community_posts()
+# 2. Fetch Real Data from DB - one keyset query for the tab being viewed
+def forum_has_posts():
+    """Whether community_posts has any row, asked only when a category tab is empty"""
+    try:
+        rows, _ = get_community_posts(page_size=1, timeout_ms=QUERY_CONFIG["page_read_timeout"])
+    except QueryTimeoutError:
+        return True
+    return bool(rows)
 
-# 3. Process Data
-# If DB returns data, format it. If not, use sample_posts.
-posts_to_display = []
+def load_posts(state_key, category, sort):
+    """
+    Posts for one forum tab (category None = all), formatted for display_post.
+    Falls back to the matching sample_posts only while the forum has no posts
+    at all; an empty category of a live forum stays empty.
+    """
+    try:
+        db_data, next_cursor = fetch_pages(
+            state_key, get_community_posts, category=category, sort=sort,
+            timeout_ms=QUERY_CONFIG["page_read_timeout"]
+        )
+    except QueryTimeoutError:
+        st.warning(ERROR_MESSAGES["timeout"])
+        return [], None
 
-if db_data and len(db_data) > 0:
+    if not db_data:
+        if category is not None and forum_has_posts():
+            return [], None
+        return [p for p in sample_posts if category in (None, p['category'])], None
+
+    posts = []
     for p in db_data:
-        posts_to_display.append({
+        posts.append({
             "id": p.get('id'),
-            "title": p.get('title'),
-            "author": p.get('author_name', 'Anonymous'),
-            "category": p.get('category', 'General'),
-            "content": p.get('content'),
-            "likes": p.get('likes', 0),
-            "replies": 0, # Assuming no replies table yet
+            # `or`, not a .get default: imported rows can hold NULLs, and the
+            # card escapes each of these as a string
+            "title": p.get('title') or "",
+            "author": p.get('author_name') or 'Anonymous',
+            "category": p.get('category') or 'General',
+            "content": p.get('content') or "",
+            "likes": p.get('likes') or 0,
+            "replies": p.get('reply_count') or 0, # Maintained by trigger, read with the page itself
             "time": time_ago(p.get('created_at')) if p.get('created_at') else "Just now"
         })
-else:
-    posts_to_display = sample_posts
+    return posts, next_cursor
 
 # ==================== CORE DISPLAY FUNCTION ====================
 def display_post(post, tab_name=""):
@@ -123,10 +181,6 @@ def display_post(post, tab_name=""):
     unique_key = f"{tab_name}_{post['id']}"
     
     # --- 1. Initialize State for this Post ---
-    # Like Count
-    if f"likes_{unique_key}" not in st.session_state:
-        st.session_state[f"likes_{unique_key}"] = post['likes']
-    
     # Reply Box Visibility
     if f"show_reply_{unique_key}" not in st.session_state:
         st.session_state[f"show_reply_{unique_key}"] = False
@@ -135,8 +189,11 @@ def display_post(post, tab_name=""):
     if f"shared_{unique_key}" not in st.session_state:
         st.session_state[f"shared_{unique_key}"] = False
 
-    # Get current values from state
-    current_likes = st.session_state[f"likes_{unique_key}"]
+    # Stored likes plus any still waiting in the write-behind buffer, keyed by
+    # post id so the "all" tab and the category tab show the same count
+    current_likes = (post['likes'] or 0)
+    if post['id'] is not None:
+        current_likes += get_pending_post_likes(post['id'])
     
     # --- 2. Render HTML Card ---
     # Note: We inject 'current_likes' into the HTML so the visual number updates
@@ -153,17 +210,17 @@ def display_post(post, tab_name=""):
         <div style="{card_style}">
             <div style="display: flex; justify-content: space-between; align-items: start; margin-bottom: 10px;">
                 <div>
-                    <h3 style="color: #667eea; margin: 0 0 8px 0; font-size: 18px;">{post['title']}</h3>
+                    <h3 style="color: #667eea; margin: 0 0 8px 0; font-size: 18px;">{html.escape(post['title'])}</h3>
                     <p style="color: #999; font-size: 13px; margin: 0;">
-                        Posted by <b>{post['author']}</b> • {post['time']} • 
+                        Posted by <b>{html.escape(post['author'])}</b> • {post['time']} • 
                         <span style="background: #f0f2f6; padding: 4px 12px; border-radius: 12px; font-size: 11px; color: #555; margin-left: 10px;">
-                            {post['category']}
+                            {html.escape(post['category'])}
                         </span>
                     </p>
                 </div>
             </div>
             <p style="color: #555; line-height: 1.6; margin: 15px 0; font-size: 15px;">
-                {post['content']}
+                {html.escape(post['content'])}
             </p>
             <div style="display: flex; gap: 20px; align-items: center; margin-top: 15px; padding-top: 15px; border-top: 1px solid #f5f5f5;">
                 <span style="color: #667eea; font-weight: 600; font-size: 14px;">👍 {current_likes} Likes</span>
@@ -172,6 +229,11 @@ def display_post(post, tab_name=""):
             </div>
         </div>
     """, unsafe_allow_html=True)
+
+    # Sample posts have no row to like or reply to
+    if post['id'] is None:
+        st.caption("✨ Example post - share your own from the sidebar to get the conversation going")
+        return
     
     # --- 3. Interaction Buttons ---
     col1, col2, col3 = st.columns([1, 1, 1])
@@ -180,8 +242,7 @@ def display_post(post, tab_name=""):
         # LIKE BUTTON
         # Unique key ensures we identify exactly which button was clicked
         if st.button(f"👍 Like ({current_likes})", key=f"btn_like_{unique_key}", use_container_width=True):
-            st.session_state[f"likes_{unique_key}"] += 1
-            # In a real app, call db.increment_likes(post['id']) here
+            increment_post_likes(post['id'])
             st.rerun() # Forces a UI refresh to show the new number
             
     with col2:
@@ -204,10 +265,30 @@ def display_post(post, tab_name=""):
         # Optional: Reset share state after showing so it doesn't stay forever
         # st.session_state[f"shared_{unique_key}"] = False 
 
-    # Show Reply Form
+    # Show Thread and Reply Form
     if st.session_state[f"show_reply_{unique_key}"]:
         with st.container():
             st.markdown("<div style='margin-left: 20px; padding-left: 20px; border-left: 3px solid #eee;'>", unsafe_allow_html=True)
+            # Replies are only read for threads someone has opened
+            if post['replies']:
+                try:
+                    replies, next_replies_cursor = fetch_pages(
+                        f"replies_{unique_key}", get_replies, post_id=post['id'],
+                        timeout_ms=QUERY_CONFIG["page_read_timeout"]
+                    )
+                except QueryTimeoutError:
+                    st.warning(ERROR_MESSAGES["timeout"])
+                    replies, next_replies_cursor = [], None
+                for reply in replies:
+                    st.markdown(f"""
+                        <div style="background: #f9f9fb; padding: 12px 16px; border-radius: 10px; margin-bottom: 8px;">
+                            <p style="color: #999; font-size: 12px; margin: 0 0 6px 0;">
+                                <b>{html.escape(reply['author_name'] or 'Anonymous')}</b> • {time_ago(reply['created_at']) if reply['created_at'] else "Just now"}
+                            </p>
+                            <p style="color: #555; font-size: 14px; margin: 0;">{html.escape(reply['content'] or '')}</p>
+                        </div>
+                    """, unsafe_allow_html=True)
+                load_more_button(f"replies_{unique_key}", next_replies_cursor, "⬇️ Older replies")
             with st.form(key=f"form_reply_{unique_key}"):
                 reply_text = st.text_area("Write your reply...", height=100)
                 col_a, col_b = st.columns([1, 4])
@@ -216,11 +297,12 @@ def display_post(post, tab_name=""):
                 
                 if submit_reply:
                     if reply_text:
-                        st.success("Reply posted! 🎉")
-                        # db.insert_reply(post['id'], reply_text)
-                        st.session_state[f"show_reply_{unique_key}"] = False
-                        time.sleep(1)
-                        st.rerun()
+                        if insert_reply(post['id'], reply_text):
+                            st.success("Reply posted! 🎉")
+                            time.sleep(1)
+                            st.rerun()
+                        else:
+                            st.error(ERROR_MESSAGES["database"])
                     else:
                         st.warning("Please write something.")
             st.markdown("</div>", unsafe_allow_html=True)
@@ -231,50 +313,48 @@ def display_post(post, tab_name=""):
 st.markdown("## 🏷️ Forum Categories")
 st.markdown("<br>", unsafe_allow_html=True)
 
-tabs = st.tabs([
-    "🌟 All Posts",
-    "💼 Career",
-    "👩‍💻 Tech",
-    "💪 Growth",
-    "🏥 Health",
-    "⚖️ Legal",
-    "🤝 Support"
-])
-
-# Mapping tabs to category names in data
-category_map = {
-    1: "Career Advice",
-    2: "Tech & Coding",
-    3: "Personal Growth",
-    4: "Health & Wellness",
-    5: "Legal Advice",
-    6: "Support Group"
+sort_options = {"🔥 Hot": "hot", "🆕 Recent": "recent"}
+post_sort = st.radio("Sort posts by", list(sort_options), horizontal=True, key="community_sort")
+
+# Tab label -> category name in data (None = every category)
+tab_categories = {
+    "🌟 All Posts": None,
+    "💼 Career": "Career Advice",
+    "👩‍💻 Tech": "Tech & Coding",
+    "💪 Growth": "Personal Growth",
+    "🏥 Health": "Health & Wellness",
+    "⚖️ Legal": "Legal Advice",
+    "🤝 Support": "Support Group",
 }
 
-# --- Tab 1: All Posts ---
-with tabs[0]:
-    st.markdown("### 📌 Recent Discussions")
-    st.markdown("<br>", unsafe_allow_html=True)
-    for post in posts_to_display:
-        display_post(post, tab_name="all")
-
-# --- Tabs 2-7: Specific Categories ---
-for i in range(1, 7):
-    with tabs[i]:
-        cat_name = category_map[i]
-        st.markdown(f"### {cat_name} Discussions")
+# Lazy tabs: switching tabs reruns the page and only the open tab's posts
+# are queried and rendered, instead of every post once per tab
+tabs = st.tabs(list(tab_categories), key="community_tab", on_change="rerun")
+
+posts_to_display = []
+for tab, cat_name in zip(tabs, tab_categories.values()):
+    if not tab.open:
+        continue
+
+    with tab:
+        if cat_name:
+            st.markdown(f"### {cat_name} Discussions")
+        else:
+            st.markdown("### 📌 Recent Discussions")
         st.markdown("<br>", unsafe_allow_html=True)
-        
-        # Filter posts
-        filtered_posts = [p for p in posts_to_display if p['category'] == cat_name]
-        
-        if filtered_posts:
-            for post in filtered_posts:
-                # Use a prefix like "career" so session keys don't clash with "all" tab
-                display_post(post, tab_name=cat_name.lower().split()[0])
+
+        tab_name = cat_name.lower().split()[0] if cat_name else "all"
+        state_key = f"community_pages_{tab_name}"
+        posts_to_display, next_posts_cursor = load_posts(state_key, cat_name, sort_options[post_sort])
+
+        if posts_to_display:
+            for post in posts_to_display:
+                display_post(post, tab_name=tab_name)
         else:
             st.info(f"No posts in {cat_name} yet. Be the first to start a discussion!")
 
+        load_more_button(state_key, next_posts_cursor, "⬇️ Load older posts")
+
 st.markdown("<br><br>", unsafe_allow_html=True)
 
 # ==================== COMMUNITY GUIDELINES ====================
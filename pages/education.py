@@ -9,9 +9,11 @@ import re
 sys.path.append(str(Path(__file__).parent.parent))
 
 from components.cards import course_card
-from utils.database import get_courses_cached
+from components.ai_response import ai_response_stream
+from utils.database import get_courses_cached, get_courses_index, QueryTimeoutError, DatabaseError
 from utils.css_loader import load_css
-from utils.helpers import chatbot_response, search_filter
+from utils.helpers import chatbot_response, fetch_pages, load_more_button
+from config.settings import ERROR_MESSAGES
 
 # Load CSS
 load_css()
@@ -37,22 +39,14 @@ with st.container(border=True):
     
     if st.button("🚀 Generate Learning Path", type="primary", use_container_width=True):
         if current_role and target_role:
-            with st.spinner(f"AI is analyzing the gap between {current_role} and {target_role}..."):
-                # DYNAMIC AI CALL (USING GEMINI VIA HELPER)
-                prompt = f"""
-                I am a {current_role} wanting to become a {target_role}.
-                Create a step-by-step learning roadmap. 
-                List 3 key skills I need to learn and 1 project idea to build my portfolio.
-                Format as HTML with bullet points (<ul><li>...</li></ul>).
-                """
-                roadmap = chatbot_response(prompt, context="Career Coach")
-                
-                st.markdown(f"""
-                    <div style="background: #f0fdfa; padding: 20px; border-radius: 10px; border-left: 5px solid #0d9488;">
-                        <h3 style="color: #115e59; margin-top:0;">Your Personalized Roadmap</h3>
-                        <div style="color: #134e4a; line-height: 1.6;">{roadmap}</div>
-                    </div>
-                """, unsafe_allow_html=True)
+            # DYNAMIC AI CALL (USING GEMINI VIA HELPER, streamed as it is generated)
+            prompt = f"""
+            I am a {current_role} wanting to become a {target_role}.
+            Create a step-by-step learning roadmap. 
+            List 3 key skills I need to learn and 1 project idea to build my portfolio.
+            Format as Markdown bullet points.
+            """
+            ai_response_stream(prompt, context="Career Coach", title="Your Personalized Roadmap", icon="🛣️")
         else:
             st.warning("Please enter both roles.")
 
@@ -183,10 +177,14 @@ st.markdown("## 📂 Community Courses")
 st.write("Courses shared by the community.")
 
 # Load real data
-courses = get_courses_cached()
+try:
+    courses, next_courses_cursor = fetch_pages("courses_pages", get_courses_cached)
+except QueryTimeoutError:
+    st.warning(ERROR_MESSAGES["timeout"])
+    courses, next_courses_cursor = [], None
 
 # Dynamic Filtering
-col_f1, col_f2 = st.columns()[1][2]
+col_f1, col_f2 = st.columns([2, 1])
 with col_f1:
     search_q = st.text_input("Filter Courses", placeholder="Search DB...")
 with col_f2:
@@ -194,7 +192,12 @@ with col_f2:
 
 filtered_courses = courses
 if search_q:
-    filtered_courses = search_filter(filtered_courses, search_q, ['title', 'category'])
+    try:
+        filtered_courses = get_courses_index().search(search_q)
+    except QueryTimeoutError:
+        st.warning(ERROR_MESSAGES["timeout"])
+    except DatabaseError:
+        st.error(ERROR_MESSAGES["database"])
 if level_f != "All":
     filtered_courses = [c for c in filtered_courses if c.get('level') == level_f]
 
@@ -208,6 +211,9 @@ if filtered_courses:
 else:
     st.info("No courses found in database.")
 
+if not search_q:
+    load_more_button("courses_pages", next_courses_cursor, "⬇️ More courses")
+
 st.markdown("<br>", unsafe_allow_html=True)
 
 # ==================== DYNAMIC YOUTUBE RESOURCES ====================
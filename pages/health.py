@@ -10,6 +10,7 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 from utils.css_loader import load_css
 from utils.helpers import chatbot_response
+from components.ai_response import ai_response_stream
 
 # Load CSS
 load_css()
@@ -282,16 +283,8 @@ with tab3:
         
         if st.button("💙 Share & Get Support"):
             if vent_text:
-                with st.spinner("Listening and thinking..."):
-                    prompt = f"I am feeling {st.session_state.get('current_mood', 'unsure')}. Here is what's on my mind: '{vent_text}'. Please act as an empathetic, supportive friend/therapist. Validate my feelings and offer 1-2 gentle coping strategies. Keep it short and warm."
-                    support_msg = chatbot_response(prompt, context="Mental Health Support")
-                    
-                    st.markdown(f"""
-                        <div style="background-color: #f0f7ff; border-left: 5px solid #4facfe; padding: 20px; border-radius: 10px; margin-top: 15px;">
-                            <h4 style="color: #005cbf; margin-top:0;">Here for you 💙</h4>
-                            <p style="font-size: 16px; line-height: 1.6; color: #333;">{support_msg}</p>
-                        </div>
-                    """, unsafe_allow_html=True)
+                prompt = f"I am feeling {st.session_state.get('current_mood', 'unsure')}. Here is what's on my mind: '{vent_text}'. Please act as an empathetic, supportive friend/therapist. Validate my feelings and offer 1-2 gentle coping strategies. Keep it short and warm."
+                ai_response_stream(prompt, context="Mental Health Support", title="Here for you", icon="💙")
             else:
                 st.warning("Please write something first. We are here to listen.")
 
@@ -6,9 +6,11 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
 
 from components.cards import job_card
-from utils.database import get_jobs_cached, insert_job
-from utils.helpers import search_filter, generate_job_recommendation, chatbot_response
+from components.ai_response import ai_response_stream
+from utils.database import get_jobs_cached, search_jobs_cached, bulk_insert_jobs, QueryTimeoutError
+from utils.helpers import generate_job_recommendation, fetch_pages, load_more_button
 from utils.css_loader import load_css
+from config.settings import ERROR_MESSAGES
 
 # Load CSS
 load_css()
@@ -38,9 +40,15 @@ with col3:
 st.markdown("<br>", unsafe_allow_html=True)
 
 # ==================== DATA LOADING ====================
-jobs = get_jobs_cached()
-
-if not jobs:
+jobs_timed_out = False
+try:
+    jobs, _ = get_jobs_cached()
+except QueryTimeoutError:
+    st.warning(ERROR_MESSAGES["timeout"])
+    jobs, jobs_timed_out = [], True
+
+# Only seed a genuinely empty table, not one that was too slow to answer
+if not jobs and not jobs_timed_out:
     st.info("📊 Initializing job database with sample data...")
     
     sample_jobs = [
@@ -106,26 +114,31 @@ if not jobs:
         }
     ]
     
-    for job in sample_jobs:
-        insert_job(**job)
-    
-    st.cache_data.clear()
-    jobs = get_jobs_cached()
+    # One transaction for the whole batch; it invalidates only the jobs
+    # cache, so the listing below is fresh
+    bulk_insert_jobs(sample_jobs)
 
 # ==================== FILTERING LOGIC ====================
-filtered_jobs = jobs
-
-if search_query:
-    filtered_jobs = search_filter(filtered_jobs, search_query, ['title', 'company', 'description'])
-
-if job_type_filter != "All":
-    filtered_jobs = [j for j in filtered_jobs if j['job_type'] == job_type_filter]
-
-if location_filter != "All":
-    filtered_jobs = [j for j in filtered_jobs if j['location'] == location_filter]
+# Searches and filters run in Postgres so every job can be found, a page at
+# a time; "Load more" fetches the next page by cursor.
+filtered_jobs, next_jobs_cursor = [], None
+
+if not jobs_timed_out:
+    try:
+        if search_query or job_type_filter != "All" or location_filter != "All":
+            filtered_jobs, next_jobs_cursor = fetch_pages(
+                "jobs_pages", search_jobs_cached,
+                query=search_query or None,
+                job_type=None if job_type_filter == "All" else job_type_filter,
+                location=None if location_filter == "All" else location_filter,
+            )
+        else:
+            filtered_jobs, next_jobs_cursor = fetch_pages("jobs_pages", get_jobs_cached)
+    except QueryTimeoutError:
+        st.warning(ERROR_MESSAGES["timeout"])
 
 # ==================== JOB LISTING ====================
-st.markdown(f"## 📋 {len(filtered_jobs)} Jobs Found")
+st.markdown(f"## 📋 {len(filtered_jobs)}{'+' if next_jobs_cursor else ''} Jobs Found")
 
 if filtered_jobs:
     cols = st.columns(2)
@@ -138,6 +151,8 @@ if filtered_jobs:
 else:
     st.warning("No jobs found matching your criteria. Try adjusting your filters!")
 
+load_more_button("jobs_pages", next_jobs_cursor, "⬇️ Load more jobs")
+
 st.markdown("<br><br>", unsafe_allow_html=True)
 
 # ==================== FEATURE 1: AI RESUME SCANNER (GEMINI POWERED) ====================
@@ -154,29 +169,19 @@ with st.expander("🔍 **Check your Resume Match Score**"):
         
     if st.button("📊 Scan Resume", use_container_width=True):
         if resume_text and job_desc:
-            with st.spinner("AI is analyzing your profile..."):
-                prompt = f"""
-                Analyze the match between this Resume and Job Description.
-                Resume: {resume_text[:500]}...
-                Job Desc: {job_desc[:500]}...
-                
-                Provide:
-                1. Match Score (0-100%)
-                2. Missing Keywords
-                3. One specific improvement tip.
-                Keep it concise.
-                """
-                # USING GEMINI HELPER FUNCTION
-                analysis = chatbot_response(prompt, context="Career Coach")
-                
-                st.markdown(f"""
-                    <div style="background: linear-gradient(135deg, #a8edea 0%, #fed6e3 100%); padding: 25px; border-radius: 15px; margin-top: 20px;">
-                        <h3 style="color: #333; margin-top: 0;">Resume Analysis Report</h3>
-                        <div style="background: rgba(255,255,255,0.8); padding: 15px; border-radius: 10px; color: #333;">
-                            {analysis}
-                        </div>
-                    </div>
-                """, unsafe_allow_html=True)
+            prompt = f"""
+            Analyze the match between this Resume and Job Description.
+            Resume: {resume_text[:500]}...
+            Job Desc: {job_desc[:500]}...
+            
+            Provide:
+            1. Match Score (0-100%)
+            2. Missing Keywords
+            3. One specific improvement tip.
+            Keep it concise.
+            """
+            # USING GEMINI HELPER FUNCTION (streamed as it is generated)
+            ai_response_stream(prompt, context="Career Coach", title="Resume Analysis Report", icon="📊")
         else:
             st.warning("Please paste both resume text and job description.")
 
@@ -189,18 +194,10 @@ with st.expander("💬 **Practice Interview Questions**"):
     role_select = st.selectbox("Select Role to Practice", ["Software Engineer", "HR Manager", "Data Analyst", "Product Manager", "Marketing Specialist"])
     
     if st.button("🎲 Generate Interview Questions"):
-        with st.spinner(f"Generating questions for {role_select}..."):
-            prompt = f"Generate 3 tough interview questions for a {role_select} role. Focus on behavioral and technical aspects."
-            # USING GEMINI HELPER FUNCTION
-            questions = chatbot_response(prompt, context="Interviewer")
-            
-            st.markdown(f"""
-                <div style="background: #f0f7ff; border-left: 5px solid #007bff; padding: 20px; border-radius: 5px; margin-top: 20px;">
-                    <h4 style="margin-top:0; color: #007bff;">Mock Interview: {role_select}</h4>
-                    <div style="white-space: pre-line; line-height: 1.6;">{questions}</div>
-                </div>
-            """, unsafe_allow_html=True)
-            st.info("💡 Tip: Try answering these out loud or writing them down!")
+        prompt = f"Generate 3 tough interview questions for a {role_select} role. Focus on behavioral and technical aspects."
+        # USING GEMINI HELPER FUNCTION (streamed as it is generated)
+        ai_response_stream(prompt, context="Interviewer", title=f"Mock Interview: {role_select}", icon="🎙️")
+        st.info("💡 Tip: Try answering these out loud or writing them down!")
 
 st.markdown("<br>", unsafe_allow_html=True)
 
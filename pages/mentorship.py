@@ -6,9 +6,10 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
 
 from components.cards import mentor_card
-from utils.database import get_mentors_cached
-from utils.helpers import show_success_message, chatbot_response
+from utils.database import get_mentors_cached, search_mentors_cached, QueryTimeoutError
+from utils.helpers import show_success_message, chatbot_response, fetch_pages, load_more_button
 from utils.css_loader import load_css
+from config.settings import ERROR_MESSAGES
 
 # Load CSS
 load_css()
@@ -24,7 +25,12 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # ==================== DATA LOADING ====================
-mentors = get_mentors_cached()
+try:
+    mentors, _ = get_mentors_cached()
+except QueryTimeoutError:
+    st.warning(ERROR_MESSAGES["timeout"])
+    mentors = []
+using_sample_mentors = not mentors
 
 # If no mentors, add sample data
 if not mentors:
@@ -85,7 +91,7 @@ with st.expander("✨ Describe your goals, and AI will find the best mentor for
     if find_mentor_btn and user_goal:
         with st.spinner("AI is analyzing mentor profiles to find your match..."):
             # Prepare mentor data for context
-            mentor_list_text = "\n".join([f"- {m['name']} (Expertise: {m['expertise']}, Bio: {m['bio']})" for m in mentors])
+            mentor_list_text = "\n".join([f"- {m['name']} (Expertise: {m['expertise']}, Bio: {m.get('snippet') or m.get('bio')})" for m in mentors])
             
             prompt = f"""
             I am looking for a mentor. My goal is: "{user_goal}".
@@ -114,17 +120,31 @@ with col1:
     search_expertise = st.text_input("Search by expertise", placeholder="e.g., Software Engineering, Marketing", label_visibility="collapsed")
 
 with col2:
-    sort_by = st.selectbox("Sort By", ["Rating", "Experience", "Available"], label_visibility="collapsed")
+    sort_options = ["Rating", "Experience", "Available"]
+    if search_expertise:
+        sort_options = ["Best Match"] + sort_options
+    sort_by = st.selectbox("Sort By", sort_options, label_visibility="collapsed")
 
 st.markdown("<br>", unsafe_allow_html=True)
 
-# Filter mentors
+# Filter mentors (typo-tolerant search in Postgres once real mentors exist)
 filtered_mentors = mentors
-if search_expertise:
+next_mentors_cursor = None
+if search_expertise and using_sample_mentors:
     filtered_mentors = [m for m in filtered_mentors if search_expertise.lower() in m['expertise'].lower()]
+elif not using_sample_mentors:
+    try:
+        if search_expertise:
+            filtered_mentors = search_mentors_cached(search_expertise)
+        else:
+            filtered_mentors, next_mentors_cursor = fetch_pages("mentors_pages", get_mentors_cached)
+    except QueryTimeoutError:
+        st.warning(ERROR_MESSAGES["timeout"])
 
-# Sort mentors
-if sort_by == "Rating":
+# Sort mentors ("Best Match" keeps the search ranking)
+if sort_by == "Best Match":
+    pass
+elif sort_by == "Rating":
     filtered_mentors = sorted(filtered_mentors, key=lambda x: x.get('rating', 0), reverse=True)
 elif sort_by == "Experience":
     filtered_mentors = sorted(filtered_mentors, key=lambda x: x.get('total_mentees', 0), reverse=True)
@@ -214,6 +234,8 @@ if filtered_mentors:
 else:
     st.warning("No mentors found matching your search.")
 
+load_more_button("mentors_pages", next_mentors_cursor, "⬇️ More mentors")
+
 st.markdown("<br><br>", unsafe_allow_html=True)
 
 # ==================== BECOME A MENTOR ====================
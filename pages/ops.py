@@ -0,0 +1,107 @@
+import streamlit as st
+import hmac
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from utils.css_loader import load_css
+from utils.llm_gateway import get_llm_gateway
+from utils.ai_cache import get_response_cache
+from utils.database import get_pool_stats
+from config.settings import OPS_CONFIG
+
+# Load CSS
+load_css()
+
+# ==================== HERO SECTION ====================
+st.markdown("""
+    <div class="hero-section">
+        <h1 class="hero-title">🛠️ Operations</h1>
+        <p class="hero-subtitle">
+            Live health of the AI service, request gateway and database pool
+        </p>
+    </div>
+""", unsafe_allow_html=True)
+
+# ==================== ACCESS ====================
+if not OPS_CONFIG["admin_token"]:
+    st.info("The operations page is disabled. Set OPS_ADMIN_TOKEN to enable it.")
+    st.stop()
+
+if not st.session_state.get("ops_authorized"):
+    token = st.text_input("Admin token", type="password")
+    if token and hmac.compare_digest(token, OPS_CONFIG["admin_token"]):
+        st.session_state["ops_authorized"] = True
+        st.rerun()
+    if token:
+        st.error("Invalid admin token")
+    st.stop()
+
+if st.button("🔄 Refresh", use_container_width=True):
+    st.rerun()
+
+gateway = get_llm_gateway()
+
+# ==================== AI CIRCUIT BREAKER ====================
+st.markdown("## ⚡ AI Circuit Breaker")
+
+breaker = gateway.breaker.stats()
+state_badges = {
+    "closed": ("🟢 Closed", "Requests go to Gemini normally."),
+    "half_open": ("🟡 Half-open", "A recovery probe is checking whether Gemini is back."),
+    "open": ("🔴 Open", "Gemini is failing; users get the built-in fallback answers instantly."),
+}
+badge, explanation = state_badges[breaker["state"]]
+
+col1, col2, col3, col4 = st.columns(4)
+col1.metric("State", badge)
+col2.metric("Consecutive Failures", f"{breaker['consecutive_failures']} / {breaker['failure_threshold']}")
+col3.metric("Times Opened", breaker["times_opened"])
+col4.metric("Requests Short-circuited", breaker["rejected"])
+
+st.caption(explanation)
+if breaker["retry_in"] is not None:
+    st.info(f"Next recovery probe in {breaker['retry_in']:.0f}s")
+if breaker["last_error"]:
+    st.code(breaker["last_error"], language=None)
+
+if breaker["state"] != "closed" and st.button("Force close breaker"):
+    gateway.breaker.reset()
+    st.rerun()
+
+# ==================== LLM GATEWAY ====================
+st.markdown("## 🚦 LLM Gateway")
+
+gw = gateway.stats()
+col1, col2, col3, col4 = st.columns(4)
+col1.metric("Running", f"{gw['running']} / {gw['max_concurrent_requests']}")
+col2.metric("Queue Depth", f"{gw['queue_depth']} / {gw['max_queue_depth']}")
+col3.metric("Completed", gw["completed"])
+col4.metric("Failed / Timed Out", f"{gw['failed']} / {gw['timed_out']}")
+
+col1, col2, col3, col4 = st.columns(4)
+col1.metric("Shed (queue full)", gw["shed"])
+col2.metric("Rate Limited", gw["rate_limited"])
+col3.metric("Active Sessions", gw["tracked_sessions"])
+
+# ==================== AI RESPONSE CACHE ====================
+st.markdown("## 🧠 AI Response Cache")
+
+cache = get_response_cache().stats()
+col1, col2, col3, col4 = st.columns(4)
+col1.metric("Hit Rate", f"{cache['hit_rate']:.0%}")
+col2.metric("Hits / Misses", f"{cache['hits']} / {cache['misses']}")
+col3.metric("Not Cacheable", cache["bypassed"])
+col4.metric("Entries", cache["entries"])
+
+# ==================== DATABASE POOL ====================
+st.markdown("## 🗄️ Database Connection Pool")
+
+pool = get_pool_stats()
+col1, col2, col3, col4 = st.columns(4)
+col1.metric("Checked Out", f"{pool['checked_out']} / {pool['max_connections']}")
+col2.metric("Idle", pool["idle"])
+col3.metric("Recycled", pool["recycled"])
+col4.metric("Failed Health Checks", pool["health_check_failures"])
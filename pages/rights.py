@@ -8,6 +8,7 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 from utils.database import get_legal_rights
 from utils.helpers import chatbot_response
+from components.ai_response import ai_response_stream
 from utils.css_loader import load_css
 
 # Load CSS
@@ -199,16 +200,8 @@ with st.container(border=True):
         )
         
         if user_query:
-            with st.spinner("🤖 AI is processing your legal query..."):
-                # Call existing chatbot function (Gemini)
-                response = chatbot_response(user_query, context="Indian Legal Rights")
-                
-                st.markdown(f"""
-                    <div style="background-color: #f8fafc; border-left: 4px solid #3b82f6; padding: 15px; border-radius: 4px; margin-top: 10px;">
-                        <p style="margin: 0; font-weight: 500; color: #1e293b;">⚖️ AI Advice:</p>
-                        <p style="margin-top: 5px; color: #475569; line-height: 1.6;">{response}</p>
-                    </div>
-                """, unsafe_allow_html=True)
+            # Gemini answer streamed as it is generated
+            ai_response_stream(user_query, context="Indian Legal Rights", title="AI Advice", icon="⚖️")
 
 st.markdown("<br>", unsafe_allow_html=True)
 
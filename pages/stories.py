@@ -6,9 +6,11 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
 
 from components.cards import success_story_card
-from utils.database import get_stories_cached, insert_success_story
-from utils.helpers import show_success_message, chatbot_response
+from components.ai_response import ai_response_stream
+from utils.database import get_stories_cached, search_stories_cached, insert_success_story, QueryTimeoutError
+from utils.helpers import show_success_message, chatbot_response, fetch_pages, load_more_button
 from utils.css_loader import load_css
+from config.settings import ERROR_MESSAGES
 
 # Load CSS
 load_css()
@@ -24,7 +26,12 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # ==================== DATA LOADING ====================
-stories = get_stories_cached()
+try:
+    stories, _ = get_stories_cached()
+except QueryTimeoutError:
+    st.warning(ERROR_MESSAGES["timeout"])
+    stories = []
+using_sample_stories = not stories
 if not stories:
     st.info("📊 Initializing stories database...")
     # (Keeping your sample data structure for brevity, assuming existing logic works)
@@ -64,7 +71,7 @@ with st.container(border=True):
                     <div style="background: #fdf4ff; padding: 15px; border-radius: 10px; border-left: 5px solid #d946ef;">
                         <h4 style="margin:0; color: #86198f;">Recommended for you:</h4>
                         <p style="font-size: 18px; font-weight: bold; margin: 5px 0;">{match['title']}</p>
-                        <p style="font-style: italic; color: #555;">"{match['story'][:100]}..."</p>
+                        <p style="font-style: italic; color: #555;">"{(match.get('snippet') or match.get('story') or '')[:100]}..."</p>
                     </div>
                 """, unsafe_allow_html=True)
 
@@ -79,18 +86,35 @@ with col2:
 
 # Filter Logic
 filtered = stories
-if cat_filter != "All":
-    filtered = [s for s in filtered if s['category'] == cat_filter]
-if search_query:
-    filtered = [s for s in filtered if search_query.lower() in s['title'].lower() or search_query.lower() in s['story'].lower()]
+next_stories_cursor = None
+if using_sample_stories:
+    if cat_filter != "All":
+        filtered = [s for s in filtered if s['category'] == cat_filter]
+    if search_query:
+        filtered = [s for s in filtered if search_query.lower() in s['title'].lower() or search_query.lower() in s['story'].lower()]
+    filtered = filtered[:3] # Show top 3 to save space
+else:
+    # Ranked search in Postgres, 3 stories at a time to save space
+    try:
+        filtered, next_stories_cursor = fetch_pages(
+            "stories_pages", search_stories_cached,
+            query=search_query or None,
+            category=None if cat_filter == "All" else cat_filter,
+            page_size=3,
+        )
+    except QueryTimeoutError:
+        st.warning(ERROR_MESSAGES["timeout"])
+        filtered = []
 
 # Display Stories
 st.markdown(f"### 💫 Showing {len(filtered)} Stories")
 if filtered:
-    for story in filtered[:3]: # Show top 3 to save space
+    for story in filtered:
         success_story_card(story)
         st.markdown("<br>", unsafe_allow_html=True)
 
+load_more_button("stories_pages", next_stories_cursor, "⬇️ More stories")
+
 # ==================== FEATURE 2: AI STORY WRITER ====================
 st.markdown("## ✍️ AI Story Drafter")
 st.markdown("Struggling to write your story? Give us keywords, and AI will draft it for you!")
@@ -124,9 +148,12 @@ with st.container(border=True):
         user_q = st.text_input("Ask Coach Maya:", placeholder="e.g., How do I stay motivated when I fail?")
         
         if user_q:
-            with st.spinner("Coach Maya is thinking..."):
-                resp = chatbot_response(f"Answer this based on the themes of resilience and women empowerment: {user_q}", context="Life Coach")
-                st.info(f"💡 **Coach's Advice:** {resp}")
+            ai_response_stream(
+                f"Answer this based on the themes of resilience and women empowerment: {user_q}",
+                context="Life Coach",
+                title="Coach's Advice",
+                icon="💡"
+            )
 
 st.markdown("<br>", unsafe_allow_html=True)
 
@@ -8,7 +8,8 @@ sys.path.append(str(Path(__file__).parent))
 
 from utils.css_loader import load_css
 from components.cards import feature_card, stat_card
-from config.settings import APP_CONFIG, IMPACT_METRICS
+from config.settings import APP_CONFIG
+from utils.database import get_impact_metrics_cached
 
 # Page configuration - MUST BE FIRST
 st.set_page_config(
@@ -33,12 +34,15 @@ st.sidebar.markdown("""
     </div>
 """, unsafe_allow_html=True)
 
+# One cached read of the impact_metrics view, shared by the sidebar and the stat cards
+impact = get_impact_metrics_cached()
+
 st.sidebar.markdown("### 📊 Live Impact")
 metrics = [
-    ("Women Helped", f"{IMPACT_METRICS['women_helped']:,}+"),
-    ("Jobs Posted", f"{IMPACT_METRICS['jobs_posted']:,}+"),
-    ("Free Courses", f"{IMPACT_METRICS['courses_available']}+"),
-    ("Active Mentors", f"{IMPACT_METRICS['mentors_active']}+")
+    ("Women Helped", f"{impact['women_helped']:,}+"),
+    ("Jobs Posted", f"{impact['jobs_posted']:,}+"),
+    ("Free Courses", f"{impact['courses_available']}+"),
+    ("Active Mentors", f"{impact['mentors_active']}+")
 ]
 
 for label, value in metrics:
@@ -82,10 +86,10 @@ st.markdown(f"""
 st.markdown("## 📊 Our Impact")
 col1, col2, col3, col4 = st.columns(4)
 
-with col1: stat_card("👩", f"{IMPACT_METRICS['women_helped']:,}+", "Women Helped")
-with col2: stat_card("💼", f"{IMPACT_METRICS['jobs_posted']:,}+", "Jobs Posted", "#10b981")
-with col3: stat_card("📚", f"{IMPACT_METRICS['courses_available']:,}+", "Courses Available", "#f59e0b")
-with col4: stat_card("👥", f"{IMPACT_METRICS['mentors_active']:,}+", "Active Mentors", "#ef4444")
+with col1: stat_card("👩", f"{impact['women_helped']:,}+", "Women Helped")
+with col2: stat_card("💼", f"{impact['jobs_posted']:,}+", "Jobs Posted", "#10b981")
+with col3: stat_card("📚", f"{impact['courses_available']:,}+", "Courses Available", "#f59e0b")
+with col4: stat_card("👥", f"{impact['mentors_active']:,}+", "Active Mentors", "#ef4444")
 
 st.markdown("<br>", unsafe_allow_html=True)
 
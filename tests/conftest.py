@@ -0,0 +1,36 @@
+"""
+Shared fixtures
+
+Tests that need a real Postgres take ``scratch_database`` and are skipped
+unless TEST_DATABASE_URL points at a database they may migrate and write
+to (never the app's own):
+
+    TEST_DATABASE_URL=postgresql://localhost/women_empowerment_test python -m pytest tests/
+"""
+
+import os
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+os.environ.setdefault("GEMINI_WARM_UP", "false")
+
+import pytest
+
+from utils import database
+
+
+@pytest.fixture
+def scratch_database(monkeypatch):
+    """TEST_DATABASE_URL, migrated and behind a fresh connection pool"""
+    url = os.getenv("TEST_DATABASE_URL")
+    if not url:
+        pytest.skip("TEST_DATABASE_URL is not set")
+
+    monkeypatch.setenv("DATABASE_URL", url)
+    monkeypatch.setattr(database, "_pool_manager", None)
+    monkeypatch.setattr(database, "_table_versions", {})
+    if not database.init_database():
+        pytest.fail("Could not migrate TEST_DATABASE_URL")
+    yield url
+    database.close_pool()
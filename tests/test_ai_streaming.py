@@ -0,0 +1,53 @@
+"""
+Streaming AI answers (utils.helpers.chatbot_response_stream) against the
+offline FakeModel backend
+
+    python -m pytest tests/
+"""
+
+import os
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+os.environ.setdefault("GEMINI_WARM_UP", "false")
+
+import pytest
+
+from utils import helpers
+from utils.ai_cache import MemoryCacheBackend, ResponseCache
+from utils.llm_backends import FakeModel
+
+PROMPT = "How do I ask for a raise?"
+CONTEXT = "career guidance"
+
+
+@pytest.fixture
+def fake_model(monkeypatch):
+    model = FakeModel(chunk_delay_ms=5, chunk_chars=16)
+    monkeypatch.setattr(helpers, "_model", model)
+    monkeypatch.setattr(helpers, "_model_resolved", True)
+    return model
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = ResponseCache(MemoryCacheBackend())
+    monkeypatch.setattr(helpers, "get_response_cache", lambda: cache)
+    return cache
+
+
+def test_stream_yields_chunks_and_caches_the_answer(fake_model, cache):
+    chunks = list(helpers.chatbot_response_stream(PROMPT, CONTEXT))
+
+    expected = fake_model.generate_content(helpers._chat_prompt(PROMPT, CONTEXT)).text
+    assert len(chunks) > 1
+    assert "".join(chunks).strip() == expected.strip()
+    assert cache.get(CONTEXT, PROMPT) == expected.strip()
+
+
+def test_cached_answer_is_yielded_in_one_chunk(fake_model, cache):
+    answer = "".join(helpers.chatbot_response_stream(PROMPT, CONTEXT)).strip()
+
+    assert list(helpers.chatbot_response_stream(PROMPT, CONTEXT)) == [answer]
+    assert cache.hits == 1
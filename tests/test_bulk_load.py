@@ -0,0 +1,126 @@
+"""
+Catalog imports: the streaming JSON reader (utils.json_stream) and bulk
+inserts (utils.database._bulk_insert). The inserts need a scratch Postgres,
+see conftest.py
+
+    python -m pytest tests/
+"""
+
+import io
+import os
+import sys
+import uuid
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+os.environ.setdefault("GEMINI_WARM_UP", "false")
+
+import pytest
+
+from utils import database
+from utils.json_stream import iter_json_items
+
+
+def items(text, chunk_size=3):
+    return list(iter_json_items(io.StringIO(text), chunk_size=chunk_size))
+
+
+# ---------- iter_json_items ----------
+
+def test_array_items_across_chunk_boundaries():
+    text = '[{"title": "a, ] b", "tags": [1, 2]}, {"title": "c\\"}"}, 12345, null]'
+    assert items(text) == [{"title": "a, ] b", "tags": [1, 2]}, {"title": 'c"}'}, 12345, None]
+
+
+def test_number_split_by_a_chunk_is_read_whole():
+    assert items("[1234567]", chunk_size=4) == [1234567]
+    assert items("1234567", chunk_size=4) == [1234567]
+
+
+def test_ndjson_and_concatenated_values():
+    assert items('{"id": 1}\n{"id": 2}\n\n{"id": 3}{"id": 4}') == [{"id": n} for n in (1, 2, 3, 4)]
+
+
+def test_empty_inputs():
+    assert items("") == []
+    assert items("  \n") == []
+    assert items("[ ]") == []
+
+
+@pytest.mark.parametrize("text, message", [
+    ('[{"id": 1}', "Unterminated top-level array"),
+    ('[{"id": 1}] [', "Unexpected data after the top-level array"),
+    ('[{"id": 1} {"id": 2}]', "Expected ',' or ']'"),
+    ('[{"id": }]', "Invalid JSON"),
+])
+def test_malformed_input_raises(text, message):
+    with pytest.raises(ValueError, match=message):
+        items(text)
+
+
+# ---------- _bulk_rows ----------
+
+def test_bulk_rows_fill_defaults_and_drop_extra_keys():
+    rows = list(database._bulk_rows("mentors", [
+        {"name": "Ada", "email": "ada@example.com", "rating": None, "favourite_colour": "teal"},
+    ]))
+    assert rows == [{
+        "name": "Ada", "email": "ada@example.com", "expertise": None, "bio": None, "linkedin_url": None,
+        "available_slots": 5, "rating": 0.00, "total_mentees": 0,
+    }]
+
+
+@pytest.mark.parametrize("row, message", [
+    ({"name": "Ada"}, "mentors row 2 is missing 'email'"),
+    ({"name": "Ada", "email": None}, "mentors row 2 is missing 'email'"),
+    (["Ada", "ada@example.com"], "mentors row 2 is not an object"),
+])
+def test_bulk_rows_reject_bad_rows(row, message):
+    good = {"name": "Grace", "email": "grace@example.com"}
+    with pytest.raises(ValueError, match=message):
+        list(database._bulk_rows("mentors", [good, row]))
+
+
+# ---------- _bulk_insert (scratch database) ----------
+
+def count(table, column, pattern):
+    rows = database._fetch_all(f"SELECT COUNT(*) AS n FROM {table} WHERE {column} LIKE %s", (pattern,))
+    return rows[0]["n"]
+
+
+@pytest.fixture
+def marker(scratch_database):
+    """Unique prefix for this test's rows, deleted afterwards"""
+    marker = f"bulk-test-{uuid.uuid4().hex[:8]}"
+    yield marker
+    with database.get_db_connection() as conn:
+        with conn.cursor() as cursor:
+            cursor.execute("DELETE FROM courses WHERE title LIKE %s", (f"{marker}%",))
+            cursor.execute("DELETE FROM mentors WHERE email LIKE %s", (f"{marker}%",))
+        conn.commit()
+
+
+def test_bulk_insert_pages_a_generator(marker):
+    rows = ({"title": f"{marker} {n}", "category": "Tech"} for n in range(5))
+
+    assert database._bulk_insert("courses", rows, page_size=2) == 5
+    assert count("courses", "title", f"{marker}%") == 5
+    assert database.get_table_version("courses") == 1
+
+
+def test_bulk_insert_skips_existing_rows(marker):
+    mentors = [{"name": "Ada", "email": f"{marker}-ada@example.com"},
+               {"name": "Grace", "email": f"{marker}-grace@example.com"}]
+
+    assert database._bulk_insert("mentors", mentors) == 2
+    assert database._bulk_insert("mentors", mentors) == 0
+    assert count("mentors", "email", f"{marker}%") == 2
+
+
+def test_bad_row_rolls_back_the_whole_load(marker):
+    rows = [{"title": f"{marker} {n}"} for n in range(3)] + [{"category": "no title"}]
+
+    with pytest.raises(ValueError, match="courses row 4 is missing 'title'"):
+        database._bulk_insert("courses", iter(rows), page_size=2)
+    assert count("courses", "title", f"{marker}%") == 0
+    assert database.bulk_insert_courses(iter(rows)) is None
@@ -0,0 +1,193 @@
+"""
+LISTEN/NOTIFY cache invalidation (utils.cache_listener) driven by an
+in-process fake connection, no database needed
+
+    python -m pytest tests/
+"""
+
+import os
+import queue
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.append(str(Path(__file__).parent.parent))
+os.environ.setdefault("GEMINI_WARM_UP", "false")
+
+import psycopg2
+import pytest
+import streamlit as st
+
+from utils import database
+from utils.cache_listener import CacheInvalidationListener
+
+CHANNEL = "table_changes"
+
+
+class FakeConnection:
+    """
+    Just enough of a psycopg2 connection for the listener: select() waits on
+    a pipe that notify() writes to, and poll() moves notifications in.
+    """
+
+    def __init__(self):
+        self._read_fd, self._write_fd = os.pipe()
+        self._pending = []
+        self._broken = False
+        self.notifies = []
+        self.executed = []
+        self.autocommit = False
+        self.closed = False
+
+    def fileno(self):
+        return self._read_fd
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def notify(self, payload):
+        self._pending.append(SimpleNamespace(payload=payload))
+        os.write(self._write_fd, b"!")
+
+    def drop(self):
+        """Make the next poll() fail the way a lost server connection does"""
+        self._broken = True
+        os.write(self._write_fd, b"!")
+
+    def poll(self):
+        os.read(self._read_fd, 1024)
+        if self._broken:
+            raise psycopg2.OperationalError("server closed the connection unexpectedly")
+        self.notifies.extend(self._pending)
+        self._pending.clear()
+
+    def close(self):
+        self.closed = True
+        os.close(self._read_fd)
+        os.close(self._write_fd)
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self._conn = conn
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, query, params=None):
+        self._conn.executed.append(query)
+
+
+@pytest.fixture
+def table_state(monkeypatch):
+    """Fresh table versions and cache registry, restored after the test"""
+    monkeypatch.setattr(database, "_table_versions", {})
+    monkeypatch.setattr(database, "_table_caches", {})
+
+
+@pytest.fixture
+def cached_courses(table_state):
+    """A real st.cache_data reader registered under "courses"; returns (fn, calls)"""
+    calls = []
+
+    @st.cache_data
+    def read_courses():
+        calls.append(1)
+        return ["Python basics"]
+
+    read_courses.clear()
+    database._register_table_cache("courses", read_courses)
+    yield read_courses, calls
+    read_courses.clear()
+
+
+def start_listener(*connections, reconnect_delay=0.05):
+    """Listener feeding database._on_table_change; returns (listener, payloads seen)"""
+    remaining = list(connections)
+    payloads = queue.Queue()
+
+    def on_notify(payload):
+        database._on_table_change(payload)
+        payloads.put(payload)
+
+    listener = CacheInvalidationListener(
+        connect=lambda: remaining.pop(0) if remaining else None,
+        channel=CHANNEL,
+        on_notify=on_notify,
+        reconnect_delay=reconnect_delay,
+        poll_interval=0.05,
+    )
+    listener.start()
+    return listener, payloads
+
+
+def test_notification_bumps_version_and_evicts_cache(cached_courses):
+    read_courses, calls = cached_courses
+    conn = FakeConnection()
+    listener, payloads = start_listener(conn)
+    try:
+        read_courses()
+        read_courses()
+        assert len(calls) == 1
+
+        conn.notify("courses")
+        assert payloads.get(timeout=2) == "courses"
+
+        assert database.get_table_version("courses") == 1
+        assert database.get_table_version("jobs") == 0
+        read_courses()
+        assert len(calls) == 2
+        assert listener.notifications_received == 1
+        assert conn.autocommit
+        assert len(conn.executed) == 1
+    finally:
+        listener.stop()
+
+
+def test_unknown_table_leaves_known_caches_alone(cached_courses):
+    read_courses, calls = cached_courses
+    conn = FakeConnection()
+    listener, payloads = start_listener(conn)
+    try:
+        read_courses()
+        conn.notify("no_such_table")
+        conn.notify("")
+        assert payloads.get(timeout=2) == "no_such_table"
+        assert payloads.get(timeout=2) == ""
+
+        assert database.get_table_version("courses") == 0
+        read_courses()
+        assert len(calls) == 1
+
+        # Still listening afterwards
+        conn.notify("courses")
+        assert payloads.get(timeout=2) == "courses"
+        assert database.get_table_version("courses") == 1
+    finally:
+        listener.stop()
+
+
+def test_reconnect_after_error_invalidates_every_cached_table(cached_courses):
+    read_courses, calls = cached_courses
+    first, second = FakeConnection(), FakeConnection()
+    listener, payloads = start_listener(first, second)
+    try:
+        read_courses()
+        first.drop()
+
+        # Notifications sent while disconnected are lost, so the reconnect
+        # reports None and every cached table is invalidated
+        assert payloads.get(timeout=2) is None
+        assert first.closed
+        assert database.get_table_version("courses") == 1
+        read_courses()
+        assert len(calls) == 2
+
+        second.notify("courses")
+        assert payloads.get(timeout=2) == "courses"
+        assert database.get_table_version("courses") == 2
+    finally:
+        listener.stop()
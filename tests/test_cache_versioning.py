@@ -0,0 +1,109 @@
+"""
+Write-through invalidation of the st.cache_data readers in utils.database,
+with the database calls replaced by fakes
+
+    python -m pytest tests/
+"""
+
+import os
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+os.environ.setdefault("GEMINI_WARM_UP", "false")
+
+import pytest
+
+from utils import database
+
+
+class FakeConnection:
+    """Connection whose INSERT ... RETURNING id returns ``returned_id``"""
+
+    def __init__(self, returned_id):
+        self.returned_id = returned_id
+        self.commits = 0
+
+    def cursor(self):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, query, params=None):
+        pass
+
+    def fetchone(self):
+        return None if self.returned_id is None else (self.returned_id,)
+
+    def commit(self):
+        self.commits += 1
+
+
+@pytest.fixture
+def course_reads(monkeypatch):
+    """Counts the database reads behind get_courses_cached"""
+    reads = []
+
+    def get_all_courses(category=None, cursor=None, page_size=None, card=False, timeout_ms=None):
+        reads.append(category)
+        return [{"id": len(reads), "category": category}], None
+
+    monkeypatch.setattr(database, "get_all_courses", get_all_courses)
+    monkeypatch.setattr(database, "start_cache_listener", lambda: None)
+    monkeypatch.setattr(database, "_table_versions", {})
+    database._courses_cached.clear()
+    yield reads
+    database._courses_cached.clear()
+
+
+def use_connection(monkeypatch, conn):
+    @contextmanager
+    def get_db_connection(timeout_ms=None):
+        yield conn
+    monkeypatch.setattr(database, "get_db_connection", get_db_connection)
+
+
+def test_reads_are_cached_per_table_version(course_reads):
+    database.get_courses_cached("Tech")
+    database.get_courses_cached("Tech")
+    database.get_courses_cached("Career")
+    assert course_reads == ["Tech", "Career"]
+
+    database.invalidate_table("jobs")
+    database.get_courses_cached("Tech")
+    assert course_reads == ["Tech", "Career"]
+
+    assert database.invalidate_table("courses") == 1
+    database.get_courses_cached("Tech")
+    database.get_courses_cached("Career")
+    assert course_reads == ["Tech", "Career", "Tech", "Career"]
+
+
+def test_insert_invalidates_its_table(course_reads, monkeypatch):
+    conn = FakeConnection(returned_id=42)
+    use_connection(monkeypatch, conn)
+    database.get_courses_cached()
+
+    assert database.insert_course("SQL", "Tech", "Beginner", "2 weeks", "Joins", "Ada") == 42
+
+    assert conn.commits == 1
+    assert database.get_table_version("courses") == 1
+    assert database.get_table_version("jobs") == 0
+    database.get_courses_cached()
+    assert len(course_reads) == 2
+
+
+def test_insert_that_wrote_nothing_keeps_the_cache(course_reads, monkeypatch):
+    use_connection(monkeypatch, FakeConnection(returned_id=None))
+    database.get_courses_cached()
+
+    assert database.insert_course("SQL", "Tech", "Beginner", "2 weeks", "Joins", "Ada") is None
+
+    assert database.get_table_version("courses") == 0
+    database.get_courses_cached()
+    assert len(course_reads) == 1
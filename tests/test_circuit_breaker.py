@@ -0,0 +1,133 @@
+"""
+Circuit breaker (utils.circuit_breaker) and the AI helpers' fallback tiers
+behind it, with no network calls
+
+    python -m pytest tests/
+"""
+
+import os
+import sys
+import threading
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+os.environ.setdefault("GEMINI_WARM_UP", "false")
+
+import pytest
+
+from utils import helpers
+from utils.ai_cache import MemoryCacheBackend, ResponseCache
+from utils.circuit_breaker import CircuitBreaker
+from utils.llm_gateway import LLMGateway, CircuitOpenError
+
+
+def open_breaker(breaker):
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure(RuntimeError("503 Service Unavailable"))
+
+
+def test_opens_after_consecutive_failures_only():
+    breaker = CircuitBreaker("test", failure_threshold=3)
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+    breaker.record_failure()
+    breaker.record_failure(RuntimeError("503 Service Unavailable"))
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow_request()
+
+    stats = breaker.stats()
+    assert (stats["times_opened"], stats["rejected"]) == (1, 1)
+    assert stats["last_error"] == "503 Service Unavailable"
+
+
+def test_half_open_trial_without_probe():
+    breaker = CircuitBreaker("test", failure_threshold=1, recovery_timeout=30)
+    open_breaker(breaker)
+    assert not breaker.allow_request()
+
+    # As if recovery_timeout had passed: one trial request, no more
+    breaker._opened_at -= 30
+    assert breaker.allow_request()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert not breaker.allow_request()
+
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    breaker._opened_at -= 30
+    assert breaker.allow_request()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_background_probe_closes_the_breaker():
+    probed = threading.Event()
+    failures = [RuntimeError("still down")]
+
+    def probe():
+        if failures:
+            raise failures.pop()
+        probed.set()
+
+    breaker = CircuitBreaker("test", failure_threshold=1, recovery_timeout=0.02, probe=probe)
+    open_breaker(breaker)
+    # Requests are never the trial while a probe is scheduled
+    assert not breaker.allow_request()
+
+    assert probed.wait(5)
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.stats()["times_opened"] == 2
+
+
+def test_reset_closes_the_breaker():
+    breaker = CircuitBreaker("test", failure_threshold=1, recovery_timeout=60, probe=lambda: None)
+    open_breaker(breaker)
+    breaker.reset()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow_request()
+
+
+class BrokenModel:
+    def __init__(self):
+        self.calls = 0
+
+    def generate_content(self, prompt, **kwargs):
+        self.calls += 1
+        raise RuntimeError("503 Service Unavailable")
+
+
+@pytest.fixture
+def gateway():
+    gateway = LLMGateway(breaker=CircuitBreaker("gemini", failure_threshold=2, recovery_timeout=60))
+    yield gateway
+    gateway._executor.shutdown(wait=True)
+
+
+def test_open_breaker_rejects_without_charging(gateway):
+    open_breaker(gateway.breaker)
+
+    with pytest.raises(CircuitOpenError):
+        gateway.call(lambda: None, session_id="s1")
+    assert gateway._session_bucket("s1")._tokens == gateway.session_per_hour
+
+
+def test_chatbot_falls_back_from_busy_to_demo_to_cache(gateway, monkeypatch):
+    model = BrokenModel()
+    cache = ResponseCache(MemoryCacheBackend())
+    monkeypatch.setattr(helpers, "_model", model)
+    monkeypatch.setattr(helpers, "_model_resolved", True)
+    monkeypatch.setattr(helpers, "get_llm_gateway", lambda: gateway)
+    monkeypatch.setattr(helpers, "get_response_cache", lambda: cache)
+    cache.set("career", "cached question", "Cached answer")
+
+    # Failures reach the user as "busy" until the breaker opens...
+    for _ in range(gateway.breaker.failure_threshold):
+        assert helpers.chatbot_response("hi", "career").startswith("🤖 **AI Busy:**")
+    # ...then requests stop reaching the model and get the demo text
+    assert helpers.chatbot_response("hi", "career") == helpers.DEMO_CHAT_RESPONSE
+    assert model.calls == gateway.breaker.failure_threshold
+    # Cached answers are served whatever the breaker says
+    assert helpers.chatbot_response("cached question", "career") == "Cached answer"
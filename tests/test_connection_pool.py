@@ -0,0 +1,212 @@
+"""
+ConnectionPoolManager (utils.database) over a fake psycopg2 pool, no
+database needed
+
+    python -m pytest tests/
+"""
+
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+os.environ.setdefault("GEMINI_WARM_UP", "false")
+
+import psycopg2
+import pytest
+from psycopg2 import pool
+
+from utils import database
+from utils.database import ConnectionPoolManager, DatabaseUnavailableError, PoolExhaustedError
+
+
+class FakeConnection:
+    def __init__(self):
+        self.closed = 0
+        self.rollbacks = 0
+        self.executed = []
+        self.broken = False
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        self.rollbacks += 1
+
+    def close(self):
+        self.closed = 1
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self._conn = conn
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, query, params=None):
+        if self._conn.broken:
+            raise psycopg2.OperationalError("server closed the connection unexpectedly")
+        self._conn.executed.append((query, params))
+
+
+class FakePool:
+    """The parts of ThreadedConnectionPool that ConnectionPoolManager uses"""
+
+    def __init__(self, minconn, maxconn, dsn, **kwargs):
+        self.minconn = minconn
+        self.maxconn = maxconn
+        self.closed = False
+        self._lock = threading.Lock()
+        self._pool = [FakeConnection() for _ in range(minconn)]
+        self._used = {}
+
+    def getconn(self):
+        with self._lock:
+            if self.closed:
+                raise pool.PoolError("connection pool is closed")
+            conn = self._pool.pop() if self._pool else FakeConnection()
+            self._used[id(conn)] = conn
+            return conn
+
+    def putconn(self, conn, close=False):
+        with self._lock:
+            if self.closed:
+                raise pool.PoolError("connection pool is closed")
+            del self._used[id(conn)]
+            if close or conn.closed:
+                conn.close()
+            else:
+                self._pool.append(conn)
+
+    def closeall(self):
+        with self._lock:
+            for conn in self._pool + list(self._used.values()):
+                conn.close()
+            self.closed = True
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    monkeypatch.setattr(database, "_KeepWarmConnectionPool", FakePool)
+    manager = ConnectionPoolManager("dbname=fake", min_connections=1, max_connections=2, connection_timeout=0.1)
+    yield manager
+    manager.close()
+
+
+def test_release_after_close_closes_the_connection(manager):
+    borrowed = manager.connection()
+    conn = borrowed.__enter__()
+    manager.close()
+
+    # A worker thread finishing after shutdown hands its connection back
+    borrowed.__exit__(None, None, None)
+
+    assert conn.closed
+    assert manager.stats()["checked_out"] == 0
+
+
+def test_release_racing_close_closes_the_connection(manager):
+    borrowed = manager.connection()
+    conn = borrowed.__enter__()
+    # close() emptied the pool after _release read self._pool
+    manager._pool.closeall()
+    manager._closed = True
+
+    borrowed.__exit__(None, None, None)
+
+    assert conn.closed
+    assert manager.stats()["checked_out"] == 0
+
+
+def test_checkout_after_close_fails(manager):
+    with manager.connection():
+        pass
+    manager.close()
+
+    with pytest.raises(DatabaseUnavailableError):
+        with manager.connection():
+            pass
+    # The failed checkout gave its slot back
+    assert manager._slots.acquire(blocking=False)
+
+
+def test_connection_is_rolled_back_and_reused(manager):
+    with manager.connection() as first:
+        pass
+    with manager.connection() as second:
+        pass
+
+    assert second is first
+    assert first.rollbacks == 2
+    assert manager.stats() == {
+        "min_connections": 1, "max_connections": 2, "checked_out": 0, "idle": 1,
+        "recycled": 0, "health_check_failures": 0,
+    }
+
+
+def test_exhausted_pool_waits_then_raises(manager):
+    with manager.connection(), manager.connection():
+        started = time.monotonic()
+        with pytest.raises(PoolExhaustedError):
+            with manager.connection():
+                pass
+        assert time.monotonic() - started >= manager.connection_timeout
+
+    # Both slots came back
+    with manager.connection(), manager.connection():
+        pass
+
+
+def test_dropped_connection_is_discarded(manager):
+    with pytest.raises(psycopg2.OperationalError):
+        with manager.connection() as conn:
+            raise psycopg2.OperationalError("server closed the connection unexpectedly")
+
+    assert conn.closed
+    with manager.connection() as replacement:
+        assert replacement is not conn
+
+
+def test_connection_idle_past_max_idle_time_is_replaced(manager):
+    with manager.connection() as stale:
+        pass
+    manager._returned_at[id(stale)] -= manager.max_idle_time + 1
+
+    with manager.connection() as conn:
+        assert conn is not stale
+    assert stale.closed
+    assert manager.stats()["recycled"] == 1
+
+
+def test_failed_health_check_replaces_the_connection(manager):
+    with manager.connection() as stale:
+        pass
+    stale.broken = True
+    manager._returned_at[id(stale)] -= manager.health_check_interval + 1
+
+    with manager.connection() as conn:
+        assert conn is not stale
+    assert manager.stats()["health_check_failures"] == 1
+
+
+def test_session_settings_applied_once_per_connection(monkeypatch):
+    monkeypatch.setattr(database, "_KeepWarmConnectionPool", FakePool)
+    manager = ConnectionPoolManager("dbname=fake", session_settings={"statement_timeout": 5000})
+    try:
+        with manager.connection() as conn:
+            pass
+        with manager.connection():
+            pass
+    finally:
+        manager.close()
+
+    assert conn.executed == [("SELECT set_config(%s, %s, false)", ["statement_timeout", "5000"])]
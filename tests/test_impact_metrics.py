@@ -0,0 +1,59 @@
+"""
+Impact numbers for the home page and sidebar
+(utils.database.get_impact_metrics_cached), no database needed
+
+    python -m pytest tests/
+"""
+
+import os
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+os.environ.setdefault("GEMINI_WARM_UP", "false")
+
+import pytest
+
+from config.settings import IMPACT_METRICS
+from utils import database
+
+
+class FakeView:
+    """Stands in for the cached impact_metrics read; None = unreadable"""
+
+    def __init__(self, row):
+        self.row = row
+        self.reads = 0
+
+    def __call__(self):
+        self.reads += 1
+        return self.row
+
+    def clear(self):
+        pass
+
+
+@pytest.fixture
+def view(monkeypatch):
+    view = FakeView(None)
+    monkeypatch.setattr(database, "_impact_metrics_cached", view)
+    monkeypatch.setattr(database, "start_metrics_refresher", lambda: None)
+    monkeypatch.setattr(database, "_metrics_unavailable_until", 0.0)
+    return view
+
+
+def test_live_numbers_never_drop_below_the_static_figures(view):
+    view.row = {"women_helped": 0, "community_members": 3, "jobs_posted": IMPACT_METRICS["jobs_posted"] + 5}
+
+    metrics = database.get_impact_metrics_cached()
+
+    assert metrics["women_helped"] == IMPACT_METRICS["women_helped"]
+    assert metrics["community_members"] == IMPACT_METRICS["community_members"]
+    assert metrics["jobs_posted"] == IMPACT_METRICS["jobs_posted"] + 5
+    assert metrics["satisfaction_rate"] == IMPACT_METRICS["satisfaction_rate"]
+
+
+def test_unreadable_view_serves_the_fallback_without_rereading(view):
+    assert database.get_impact_metrics_cached() == IMPACT_METRICS
+    assert database.get_impact_metrics_cached() == IMPACT_METRICS
+    assert view.reads == 1
@@ -0,0 +1,132 @@
+"""
+LLMGateway admission control (utils.llm_gateway): token buckets, load
+shedding and timeouts, with plain functions standing in for model calls
+
+    python -m pytest tests/
+"""
+
+import sys
+import threading
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+import pytest
+
+from utils.llm_gateway import (
+    LLMGateway, TokenBucket, RateLimitedError, GatewayOverloadedError, LLMTimeoutError,
+)
+
+
+@pytest.fixture
+def make_gateway():
+    gateways = []
+
+    def make(**kwargs):
+        gateway = LLMGateway(**kwargs)
+        gateways.append(gateway)
+        return gateway
+
+    yield make
+    for gateway in gateways:
+        gateway._executor.shutdown(wait=True)
+
+
+def test_bucket_allows_a_burst_then_refills():
+    bucket = TokenBucket(capacity=2, rate=1.0)
+    assert bucket.try_acquire()
+    assert bucket.try_acquire()
+    assert not bucket.try_acquire()
+
+    # As if a second and a half had passed
+    bucket._updated -= 1.5
+    assert bucket.try_acquire()
+    assert not bucket.try_acquire()
+
+
+def test_bucket_refund_is_capped_at_capacity():
+    bucket = TokenBucket(capacity=1, rate=0.0)
+    bucket.refund(5)
+    assert bucket.try_acquire()
+    assert not bucket.try_acquire()
+
+
+def test_session_budget_is_per_session(make_gateway):
+    gateway = make_gateway(session_per_hour=2, global_per_minute=100)
+
+    assert gateway.call(lambda: "a", session_id="s1") == "a"
+    gateway.call(lambda: "b", session_id="s1")
+    with pytest.raises(RateLimitedError):
+        gateway.call(lambda: "c", session_id="s1")
+    assert gateway.call(lambda: "d", session_id="s2") == "d"
+
+    stats = gateway.stats()
+    assert stats["completed"] == 3
+    assert stats["rate_limited"] == 1
+    assert stats["tracked_sessions"] == 2
+
+
+def test_global_limit_refunds_the_session_budget(make_gateway):
+    gateway = make_gateway(session_per_hour=1, global_per_minute=1)
+    gateway.call(lambda: None, session_id="s1")
+
+    with pytest.raises(RateLimitedError):
+        gateway.call(lambda: None, session_id="s2")
+
+    # s2 was never charged for the request the site budget refused
+    gateway._global_bucket.refund()
+    gateway.call(lambda: None, session_id="s2")
+
+
+def test_full_queue_sheds_without_charging(make_gateway):
+    gateway = make_gateway(max_concurrent_requests=1, max_queue_depth=0, session_per_hour=2)
+    started, release = threading.Event(), threading.Event()
+
+    def slow():
+        started.set()
+        release.wait(5)
+
+    worker = threading.Thread(target=gateway.call, args=(slow,), kwargs={"session_id": "s1"})
+    worker.start()
+    try:
+        assert started.wait(5)
+        with pytest.raises(GatewayOverloadedError):
+            gateway.call(lambda: None, session_id="s1")
+        assert gateway.stats()["shed"] == 1
+    finally:
+        release.set()
+        worker.join(5)
+
+    # The shed request's token came back: s1 still has one left
+    gateway.call(lambda: None, session_id="s1")
+
+
+def test_timeout_holds_the_slot_until_the_call_ends(make_gateway):
+    gateway = make_gateway(max_concurrent_requests=1, max_queue_depth=0, request_timeout=0.05)
+    release = threading.Event()
+
+    with pytest.raises(LLMTimeoutError):
+        gateway.call(lambda: release.wait(5), session_id="s1")
+    assert gateway.stats()["timed_out"] == 1
+
+    # The abandoned call is still running, so there is no free slot
+    with pytest.raises(GatewayOverloadedError):
+        gateway.call(lambda: None, session_id="s1")
+
+    release.set()
+    assert gateway._slots.acquire(timeout=5)
+    gateway._slots.release()
+    assert gateway.call(lambda: "ok", session_id="s1") == "ok"
+
+
+def test_reserve_counts_work_done_on_the_caller_thread(make_gateway):
+    gateway = make_gateway()
+
+    with gateway.reserve(session_id="s1"):
+        assert gateway.stats()["running"] == 1
+    with pytest.raises(ValueError):
+        with gateway.reserve(session_id="s1"):
+            raise ValueError("stream broke")
+
+    stats = gateway.stats()
+    assert (stats["running"], stats["completed"], stats["failed"]) == (0, 1, 1)
@@ -0,0 +1,218 @@
+"""
+Schema migration engine (utils.migrations): file parsing without a
+database, and Migrator runs against a throwaway schema in TEST_DATABASE_URL
+(skipped when it is unset, see conftest.py)
+
+    python -m pytest tests/
+"""
+
+import os
+import sys
+import uuid
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+import psycopg2
+import pytest
+
+from utils.migrations import Migration, MigrationError, Migrator, discover, split_statements
+
+
+def write(directory, name, text):
+    path = directory / name
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+# ---------- parsing ----------
+
+def test_split_statements_respects_quotes_comments_and_dollar_bodies():
+    script = """
+        -- leading comment; not a statement
+        CREATE TABLE t (note TEXT DEFAULT 'a;b', "odd;name" INT);
+        /* block; comment */
+        INSERT INTO t (note) VALUES ('it''s; fine');
+        CREATE FUNCTION f() RETURNS INT AS $body$ SELECT 1; $body$ LANGUAGE sql;
+        DO $$ BEGIN PERFORM 1; END $$;
+        -- trailing comment only
+    """
+    statements = split_statements(script)
+
+    assert len(statements) == 4
+    assert statements[0].endswith('"odd;name" INT)')
+    assert statements[1] == "/* block; comment */\n        INSERT INTO t (note) VALUES ('it''s; fine')"
+    assert "$body$ SELECT 1; $body$" in statements[2]
+    assert statements[3] == "DO $$ BEGIN PERFORM 1; END $$"
+
+
+def test_sql_directives(tmp_path):
+    plain = Migration(write(tmp_path, "0001_plain.sql", "CREATE TABLE a (id INT);"))
+    online = Migration(write(tmp_path, "0002_online.sql",
+                             "-- Build without blocking writes\n"
+                             "-- migrate: no-transaction, optional\n"
+                             "CREATE INDEX CONCURRENTLY IF NOT EXISTS a_id ON a (id);"))
+    late = Migration(write(tmp_path, "0003_late.sql",
+                           "SELECT 1;\n-- migrate: no-transaction\n"))
+
+    assert (plain.version, plain.name, plain.label) == (1, "plain", "0001_plain")
+    assert (plain.no_transaction, plain.optional) == (False, False)
+    assert (online.no_transaction, online.optional) == (True, True)
+    # Directives only count in the header comment
+    assert late.no_transaction is False
+
+
+def test_python_migration(tmp_path):
+    migration = Migration(write(tmp_path, "0004_rendered.py",
+                                "NO_TRANSACTION = True\n"
+                                "def statements():\n"
+                                "    return ['  SELECT 1  ', 'SELECT 2']\n"))
+    assert migration.no_transaction
+    assert migration.render(conn=None) == ["SELECT 1", "SELECT 2"]
+
+    with pytest.raises(MigrationError, match="must define statements"):
+        Migration(write(tmp_path, "0005_empty.py", "X = 1\n"))
+
+
+def test_checksum_tracks_the_rendered_sql():
+    assert Migration.checksum(["SELECT 1", "SELECT 2"]) == Migration.checksum(["SELECT 1", "SELECT 2"])
+    assert Migration.checksum(["SELECT 1", "SELECT 2"]) != Migration.checksum(["SELECT 1; SELECT 2"])
+
+
+def test_discover_orders_by_version_and_rejects_duplicates(tmp_path):
+    write(tmp_path, "0010_ten.sql", "SELECT 10;")
+    write(tmp_path, "0002_two.sql", "SELECT 2;")
+    write(tmp_path, "README.md", "not a migration")
+    assert [m.label for m in discover(tmp_path)] == ["0002_two", "0010_ten"]
+
+    write(tmp_path, "0002_again.sql", "SELECT 2;")
+    with pytest.raises(MigrationError, match="Duplicate migration version 2"):
+        discover(tmp_path)
+
+
+def test_repo_migrations_parse():
+    migrations = discover()
+    assert [m.version for m in migrations] == list(range(1, len(migrations) + 1))
+
+
+# ---------- Migrator (throwaway schema) ----------
+
+@pytest.fixture
+def connect():
+    """Connection factory bound to a fresh schema, dropped afterwards"""
+    url = os.getenv("TEST_DATABASE_URL")
+    if not url:
+        pytest.skip("TEST_DATABASE_URL is not set")
+    schema = f"migtest_{uuid.uuid4().hex[:8]}"
+    admin = psycopg2.connect(url)
+    admin.autocommit = True
+    with admin.cursor() as cursor:
+        cursor.execute(f"CREATE SCHEMA {schema}")
+    try:
+        yield lambda: psycopg2.connect(url, options=f"-c search_path={schema}")
+    finally:
+        with admin.cursor() as cursor:
+            cursor.execute(f"DROP SCHEMA {schema} CASCADE")
+        admin.close()
+
+
+def make_migrator(connect, directory, log):
+    return Migrator(connect, directory=directory, lock_key=uuid.uuid4().int >> 65, log=log.append)
+
+
+def query(connect, statement):
+    conn = connect()
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute(statement)
+            return cursor.fetchall()
+    finally:
+        conn.close()
+
+
+def applied_versions(connect):
+    return [row[0] for row in query(connect, "SELECT version FROM schema_version ORDER BY version")]
+
+
+def test_applies_pending_migrations_once(connect, tmp_path):
+    write(tmp_path, "0001_items.sql", "CREATE TABLE items (id SERIAL PRIMARY KEY, name TEXT);")
+    write(tmp_path, "0002_seed.sql", "INSERT INTO items (name) VALUES ('a'); INSERT INTO items (name) VALUES ('b');")
+    log = []
+
+    assert make_migrator(connect, tmp_path, log).run()
+    assert applied_versions(connect) == [1, 2]
+
+    log.clear()
+    assert make_migrator(connect, tmp_path, log).run()
+    assert log == ["✅ Schema is up to date"]
+    assert query(connect, "SELECT COUNT(*) FROM items") == [(2,)]
+
+
+def test_dry_run_executes_nothing(connect, tmp_path):
+    write(tmp_path, "0001_items.sql", "CREATE TABLE items (id INT);")
+    write(tmp_path, "0002_index.sql", "-- migrate: no-transaction\nCREATE INDEX CONCURRENTLY items_id ON items (id);")
+    log = []
+
+    assert make_migrator(connect, tmp_path, log).run(dry_run=True)
+
+    assert "-- 0002_index (no transaction)" in log
+    assert "CREATE TABLE items (id INT);" in log
+    assert query(connect, "SELECT to_regclass('items'), to_regclass('schema_version')") == [(None, None)]
+
+
+def test_target_stops_at_a_version(connect, tmp_path):
+    write(tmp_path, "0001_a.sql", "CREATE TABLE a (id INT);")
+    write(tmp_path, "0002_b.sql", "CREATE TABLE b (id INT);")
+
+    assert make_migrator(connect, tmp_path, []).run(target=1)
+    assert applied_versions(connect) == [1]
+
+
+def test_edited_migration_only_warns(connect, tmp_path):
+    path = write(tmp_path, "0001_a.sql", "CREATE TABLE a (id INT);")
+    make_migrator(connect, tmp_path, []).run()
+    path.write_text("CREATE TABLE a (id BIGINT);", encoding="utf-8")
+    log = []
+
+    assert make_migrator(connect, tmp_path, log).run()
+    assert any("0001_a changed after it was applied" in line for line in log)
+    assert query(connect, "SELECT data_type FROM information_schema.columns WHERE table_name = 'a'") == [("integer",)]
+
+
+def test_failed_migration_rolls_back_and_stops(connect, tmp_path):
+    write(tmp_path, "0001_a.sql", "CREATE TABLE a (id INT);")
+    write(tmp_path, "0002_broken.sql", "CREATE TABLE b (id INT); SELECT * FROM no_such_table;")
+    write(tmp_path, "0003_c.sql", "CREATE TABLE c (id INT);")
+    log = []
+
+    assert not make_migrator(connect, tmp_path, log).run()
+    assert applied_versions(connect) == [1]
+    assert query(connect, "SELECT to_regclass('b'), to_regclass('c')") == [(None, None)]
+    assert any("0002_broken failed" in line for line in log)
+
+
+def test_no_transaction_migration_can_build_concurrently(connect, tmp_path):
+    write(tmp_path, "0001_a.sql", "CREATE TABLE a (id INT);")
+    write(tmp_path, "0002_index.sql",
+          "-- migrate: no-transaction\nCREATE INDEX CONCURRENTLY IF NOT EXISTS a_id ON a (id);")
+
+    assert make_migrator(connect, tmp_path, []).run()
+    assert query(connect, "SELECT indisvalid FROM pg_index WHERE indexrelid = 'a_id'::regclass") == [(True,)]
+
+
+def test_optional_failure_is_skipped_and_retried(connect, tmp_path):
+    write(tmp_path, "0001_needs.sql", "-- migrate: optional\nSELECT * FROM prerequisite;")
+    write(tmp_path, "0002_a.sql", "CREATE TABLE a (id INT);")
+    log = []
+
+    assert make_migrator(connect, tmp_path, log).run()
+    assert applied_versions(connect) == [2]
+    assert any("Skipped optional migration 0001_needs" in line for line in log)
+
+    conn = connect()
+    conn.autocommit = True
+    with conn.cursor() as cursor:
+        cursor.execute("CREATE TABLE prerequisite (id INT)")
+    conn.close()
+    assert make_migrator(connect, tmp_path, []).run()
+    assert applied_versions(connect) == [1, 2]
@@ -0,0 +1,145 @@
+"""
+Search indexes (utils.search.SearchIndex and the per-table indexes in
+utils.database), no database needed
+
+    python -m pytest tests/
+"""
+
+import os
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+os.environ.setdefault("GEMINI_WARM_UP", "false")
+
+import psycopg2
+import pytest
+
+from utils import database
+from utils.search import SearchIndex, build_index, tokenize
+
+COURSES = [
+    {"id": 3, "title": "Python for Data Science", "category": "Tech", "instructor": "Ada", "description": "pandas"},
+    {"id": 2, "title": "Salary Negotiation", "category": "Career", "instructor": "Grace", "description": "offers"},
+    {"id": 1, "title": "Public Speaking", "category": "Career", "instructor": "Maya", "description": "confidence"},
+]
+
+
+FIELDS = {"title": 3.0, "category": 2.0, "instructor": 1.0, "description": 1.0}
+
+
+def ids(rows):
+    return [row["id"] for row in rows]
+
+
+def test_tokenize_lowercases_words():
+    assert tokenize("Women-in-Tech: Python_101!") == ["women", "in", "tech", "python", "101"]
+    assert tokenize(None) == []
+
+
+def test_every_query_term_must_match():
+    index = build_index(COURSES, FIELDS)
+    assert ids(index.search("career salary")) == [2]
+    assert index.search("career pandas") == []
+    assert index.search("nosuchword") == []
+
+
+def test_prefixes_match_and_rank_below_whole_words():
+    rows = [
+        {"id": 1, "title": "Engineering leadership"},
+        {"id": 2, "title": "Eng"},
+    ]
+    index = build_index(rows, ["title"])
+    assert ids(index.search("eng")) == [2, 1]
+    assert ids(index.search("engin")) == [1]
+
+
+def test_field_weights_rank_title_hits_first():
+    index = build_index(COURSES, FIELDS)
+    rows = [{"id": 10, "title": "Intro", "description": "career"}, {"id": 11, "title": "Career", "description": "intro"}]
+    index.add_many(rows)
+    assert ids(index.search("career"))[0] == 11
+
+
+def test_ties_keep_display_order_and_at_front_wins():
+    index = SearchIndex(["title"])
+    index.add_many([{"id": 1, "title": "Mentoring"}, {"id": 2, "title": "Mentoring"}])
+    assert ids(index.search("mentoring")) == [1, 2]
+
+    index.add({"id": 3, "title": "Mentoring"}, at_front=True)
+    index.add({"id": 4, "title": "Mentoring"})
+    assert ids(index.search("mentoring")) == [3, 1, 2, 4]
+    assert ids(index.search("")) == [3, 1, 2, 4]
+    assert ids(index.search("", limit=2)) == [3, 1]
+
+
+def test_prefix_expansion_is_capped():
+    rows = [{"id": n, "title": f"python{n}"} for n in range(10)]
+    index = build_index(rows, ["title"], max_expansions=3)
+    assert len(index.search("python")) == 3
+    assert index.stats() == {"documents": 10, "terms": 10, "postings": 10}
+
+
+@pytest.fixture
+def index_state(monkeypatch):
+    """Empty index registry and a fixed courses table version"""
+    monkeypatch.setattr(database, "_search_indexes", {})
+    monkeypatch.setattr(database, "_search_index_build_locks", {})
+    monkeypatch.setattr(database, "_cache_version", lambda table: 7)
+
+
+def fake_pages(rows, fail_on_page=None):
+    """Stand-in for _keyset_page serving ``rows`` one per page"""
+    def keyset_page(table, sort_key, key_type, cursor, page_size, timeout_ms=None):
+        page = int(cursor or 0)
+        if page == fail_on_page:
+            raise psycopg2.OperationalError("server closed the connection unexpectedly")
+        next_cursor = str(page + 1) if page + 1 < len(rows) else None
+        return rows[page:page + 1], next_cursor
+    return keyset_page
+
+
+def test_courses_index_is_built_from_every_page(index_state, monkeypatch):
+    monkeypatch.setattr(database, "_keyset_page", fake_pages(COURSES))
+
+    index = database.get_courses_index()
+
+    assert len(index) == 3
+    assert [c["id"] for c in index.search("career")] == [2, 1]
+    assert database.get_courses_index() is index
+
+
+def test_failed_page_raises_and_caches_nothing(index_state, monkeypatch):
+    monkeypatch.setattr(database, "_keyset_page", fake_pages(COURSES, fail_on_page=1))
+
+    with pytest.raises(database.DatabaseError):
+        database.get_courses_index()
+    assert "courses" not in database._search_indexes
+
+    # The next search retries the build instead of reusing a partial index
+    monkeypatch.setattr(database, "_keyset_page", fake_pages(COURSES))
+    assert len(database.get_courses_index()) == 3
+
+
+def test_timeout_is_not_wrapped(index_state, monkeypatch):
+    def timed_out(*args, **kwargs):
+        raise database.QueryTimeoutError("canceling statement due to statement timeout")
+    monkeypatch.setattr(database, "_keyset_page", timed_out)
+
+    with pytest.raises(database.QueryTimeoutError):
+        database.get_courses_index()
+    assert "courses" not in database._search_indexes
+
+
+def test_row_inserted_here_is_added_in_place(index_state, monkeypatch):
+    monkeypatch.setattr(database, "_keyset_page", fake_pages(COURSES))
+    index = database.get_courses_index()
+    new_course = {"id": 4, "title": "Career Change", "category": "Career", "instructor": "Ada", "description": ""}
+    monkeypatch.setattr(database, "_select_list", lambda table: database.sql.SQL("*"))
+    monkeypatch.setattr(database, "_fetch_records", lambda query, params: [new_course])
+    monkeypatch.setattr(database, "_cache_version", lambda table: 8)
+
+    database._index_inserted_row("courses", 4, previous_version=7, new_version=8)
+
+    assert database.get_courses_index() is index
+    assert ids(index.search("career"))[0] == 4
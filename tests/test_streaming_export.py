@@ -0,0 +1,129 @@
+"""
+Streaming reads over server-side cursors (utils.database._stream_rows) and
+the CSV/NDJSON export writers (utils.export), no database needed
+
+    python -m pytest tests/
+"""
+
+import io
+import json
+import os
+import sys
+from contextlib import contextmanager
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+os.environ.setdefault("GEMINI_WARM_UP", "false")
+
+import pytest
+
+from config.database_config import QUERY_CONFIG
+from utils import database
+from utils.export import write_csv, write_ndjson
+
+ROWS = [
+    {"id": 1, "title": "Data Analyst", "salary": Decimal("55000.50"), "posted_date": datetime(2026, 1, 2, 9, 30)},
+    {"id": 2, "title": "Nurse, ICU", "salary": None, "posted_date": datetime(2026, 1, 3)},
+]
+
+
+class FakeCursor:
+    def __init__(self, conn, name):
+        self._conn = conn
+        self.name = name
+        self.itersize = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, query, params=None):
+        self._conn.executed.append((self.name, query, params))
+
+    def __iter__(self):
+        for row in self._conn.rows:
+            self._conn.rows_read += 1
+            yield row
+
+
+class FakeConnection:
+    def __init__(self, rows):
+        self.rows = rows
+        self.rows_read = 0
+        self.executed = []
+        self.cursors = []
+        self.released = False
+
+    def cursor(self, name=None, cursor_factory=None):
+        cursor = FakeCursor(self, name)
+        self.cursors.append(cursor)
+        return cursor
+
+
+@pytest.fixture
+def conn(monkeypatch):
+    conn = FakeConnection(ROWS)
+
+    @contextmanager
+    def get_db_connection(timeout_ms=None):
+        try:
+            yield conn
+        finally:
+            conn.released = True
+
+    monkeypatch.setattr(database, "get_db_connection", get_db_connection)
+    return conn
+
+
+def test_stream_reads_through_a_named_cursor(conn):
+    rows = list(database._stream_rows("SELECT * FROM jobs ORDER BY id", itersize=500))
+
+    assert rows == ROWS
+    settings, named = conn.cursors
+    assert settings.name is None
+    assert named.name.startswith("stream_")
+    assert named.itersize == 500
+    assert conn.executed[0][2] == (str(QUERY_CONFIG["stream_idle_timeout"]),)
+    assert conn.released
+
+
+def test_stream_is_lazy_and_releases_its_connection_when_closed(conn):
+    stream = database._stream_rows("SELECT * FROM jobs ORDER BY id")
+    assert conn.cursors == []
+
+    next(stream)
+    assert conn.cursors[1].itersize == QUERY_CONFIG["stream_itersize"]
+    assert not conn.released
+    stream.close()
+
+    assert conn.rows_read == 1
+    assert conn.released
+
+
+def test_write_csv():
+    out = io.StringIO(newline="")
+    assert write_csv(iter(ROWS), out, columns=["id", "title", "salary", "posted_date"]) == 2
+    assert out.getvalue().splitlines() == [
+        "id,title,salary,posted_date",
+        "1,Data Analyst,55000.50,2026-01-02T09:30:00",
+        '2,"Nurse, ICU",,2026-01-03T00:00:00',
+    ]
+
+
+def test_write_csv_without_rows_still_writes_the_header():
+    out = io.StringIO(newline="")
+    assert write_csv(iter([]), out, columns=["id", "title"]) == 0
+    assert out.getvalue().strip() == "id,title"
+
+
+def test_write_ndjson_round_trips_decimals_and_dates():
+    out = io.StringIO()
+    assert write_ndjson(iter(ROWS), out) == 2
+
+    first, second = (json.loads(line) for line in out.getvalue().splitlines())
+    assert first == {"id": 1, "title": "Data Analyst", "salary": "55000.50", "posted_date": "2026-01-02T09:30:00"}
+    assert second["salary"] is None
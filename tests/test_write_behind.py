@@ -0,0 +1,144 @@
+"""
+Write-behind counters (utils.write_behind.CounterBuffer) and the community
+likes buffer built on it; the likes test needs a scratch Postgres, see
+conftest.py
+
+    python -m pytest tests/
+"""
+
+import sys
+import threading
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+import pytest
+
+from utils import database
+from utils.write_behind import CounterBuffer
+
+
+class Store:
+    """Flush target standing in for community_posts.likes"""
+
+    def __init__(self):
+        self.likes = {}
+        self.fail = False
+        self.during_flush = None
+
+    def flush(self, deltas):
+        if self.during_flush:
+            self.during_flush()
+        if self.fail:
+            raise RuntimeError("database is down")
+        for key, delta in deltas.items():
+            self.likes[key] = self.likes.get(key, 0) + delta
+
+
+@pytest.fixture
+def store():
+    return Store()
+
+
+@pytest.fixture
+def buffer(store):
+    # Not started: the tests call flush() themselves
+    return CounterBuffer(store.flush, interval=60)
+
+
+def test_pending_stays_visible_until_the_write_succeeds(store, buffer):
+    buffer.add(1, 3)
+    seen = []
+    # A render during the flush: stored count (not written yet) + pending
+    store.during_flush = lambda: seen.append(store.likes.get(1, 0) + buffer.pending(1))
+
+    assert buffer.flush() == 1
+    assert seen == [3]
+    assert store.likes[1] + buffer.pending(1) == 3
+    assert buffer.pending(1) == 0
+
+
+def test_failed_flush_keeps_deltas_pending(store, buffer):
+    buffer.add(1, 2)
+    store.fail = True
+
+    assert buffer.flush() == 0
+    assert buffer.pending(1) == 2
+    assert buffer.failed_flushes == 1
+
+    store.fail = False
+    assert buffer.flush() == 1
+    assert store.likes == {1: 2}
+    assert buffer.pending(1) == 0
+
+
+def test_likes_added_during_a_flush_are_kept(store, buffer):
+    buffer.add(1)
+    store.during_flush = lambda: buffer.add(1, 4)
+
+    buffer.flush()
+
+    assert store.likes == {1: 1}
+    assert buffer.pending(1) == 4
+
+
+def test_increments_coalesce_per_key(store, buffer):
+    assert buffer.add(1) == 1
+    assert buffer.add(1) == 2
+    buffer.add(2, 5)
+
+    flushed = []
+    store.during_flush = lambda: flushed.append(dict(buffer._pending))
+    assert buffer.flush() == 2
+    assert flushed == [{1: 2, 2: 5}]
+    assert buffer.flush() == 0
+    assert buffer.flushes == 1
+
+
+def test_max_pending_wakes_the_thread_early(store):
+    flushed = threading.Event()
+    buffer = CounterBuffer(lambda deltas: flushed.set(), interval=60, max_pending=2)
+    buffer.start()
+    try:
+        buffer.add(1)
+        assert not flushed.wait(0.1)
+        buffer.add(2)
+        assert flushed.wait(5)
+    finally:
+        buffer.stop(timeout=5)
+
+
+def test_stop_flushes_what_is_left(store):
+    buffer = CounterBuffer(store.flush, interval=60)
+    buffer.start()
+    buffer.add(7, 3)
+
+    buffer.stop(timeout=5)
+
+    assert not buffer.is_alive()
+    assert store.likes == {7: 3}
+
+
+def test_post_likes_reach_the_database(scratch_database, monkeypatch):
+    monkeypatch.setattr(database, "_post_likes", None)
+    # Only the explicit flush below writes
+    monkeypatch.setitem(database.LIKES_CONFIG, "flush_interval", 60)
+    post_id = database.insert_community_post("Likes", "Write-behind test", "Support Group")
+    try:
+        database.increment_post_likes(post_id)
+        database.increment_post_likes(post_id, 2)
+        version = database.get_table_version("community_posts")
+        assert database.get_pending_post_likes(post_id) == 3
+
+        assert database.flush_post_likes() == 1
+
+        assert database.get_pending_post_likes(post_id) == 0
+        assert database.get_table_version("community_posts") == version + 1
+        rows = database._fetch_all("SELECT likes FROM community_posts WHERE id = %s", (post_id,))
+        assert rows[0]["likes"] == 3
+    finally:
+        database._post_likes.stop()
+        with database.get_db_connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute("DELETE FROM community_posts WHERE id = %s", (post_id,))
+            conn.commit()
@@ -14,7 +14,9 @@ from .helpers import (
     generate_job_recommendation,
     generate_course_recommendation,
     search_filter,
-    paginate
+    paginate,
+    fetch_pages,
+    load_more_button
 )
 
 from .css_loader import load_css
@@ -39,6 +41,8 @@ __all__ = [
     'generate_course_recommendation',
     'search_filter',
     'paginate',
+    'fetch_pages',
+    'load_more_button',
     'load_css',
     'fade_in',
     'slide_in',
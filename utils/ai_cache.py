@@ -0,0 +1,213 @@
+"""
+Response cache for the Gemini-backed helpers
+
+Many AI buttons send the exact same prompt for every user (salary and
+interview tips, "Generate New Tips", ...). Responses are cached per
+(context, normalised prompt) with a per-context TTL, so repeats are served
+locally instead of spending a round trip and quota. Contexts listed in
+AI_CACHE_CONFIG["excluded_contexts"] (e.g. "Mental Health Support") are
+never cached.
+"""
+
+import hashlib
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from config.settings import AI_CACHE_CONFIG
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalise_prompt(prompt):
+    """Collapse whitespace and case so cosmetic differences share an entry"""
+    return _WHITESPACE.sub(" ", str(prompt)).strip().casefold()
+
+
+class MemoryCacheBackend:
+    """Size-bounded in-process LRU"""
+
+    def __init__(self, max_entries=1000):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at < time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl):
+        with self._lock:
+            self._entries[key] = (value, time.time() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class SQLiteCacheBackend:
+    """On-disk LRU shared by every process on the host, survives restarts"""
+
+    def __init__(self, path, max_entries=1000):
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS ai_responses (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                expires_at REAL NOT NULL,
+                last_used REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS ai_responses_last_used ON ai_responses (last_used)")
+
+    def get(self, key):
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM ai_responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] < now:
+                self._conn.execute("DELETE FROM ai_responses WHERE key = ?", (key,))
+                return None
+            self._conn.execute("UPDATE ai_responses SET last_used = ? WHERE key = ?", (now, key))
+            return row[0]
+
+    def set(self, key, value, ttl):
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO ai_responses (key, value, expires_at, last_used) VALUES (?, ?, ?, ?)",
+                (key, value, now + ttl, now),
+            )
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM ai_responses").fetchone()
+            if count > self.max_entries:
+                self._conn.execute(
+                    """
+                    DELETE FROM ai_responses WHERE key IN (
+                        SELECT key FROM ai_responses ORDER BY last_used LIMIT ?
+                    )
+                    """,
+                    (count - self.max_entries,),
+                )
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM ai_responses")
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM ai_responses").fetchone()[0]
+
+
+class ResponseCache:
+    """
+    Cache of AI responses keyed on (context, normalised prompt).
+
+    Args:
+        backend: Object with get(key), set(key, value, ttl), clear() and len().
+        default_ttl: Seconds a response stays fresh unless its context overrides it.
+        context_ttl: Per-context TTL overrides; a TTL of 0 disables caching.
+        excluded_contexts: Contexts that always go to the model.
+    """
+
+    def __init__(self, backend, default_ttl=3600, context_ttl=None, excluded_contexts=()):
+        self.backend = backend
+        self.default_ttl = default_ttl
+        self.context_ttl = dict(context_ttl or {})
+        self.excluded_contexts = set(excluded_contexts)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.bypassed = 0
+
+    def _ttl_for(self, context):
+        if context in self.excluded_contexts:
+            return 0
+        return self.context_ttl.get(context, self.default_ttl)
+
+    @staticmethod
+    def make_key(context, prompt):
+        raw = f"{context}\x00{normalise_prompt(prompt)}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, context, prompt):
+        """Cached response, or None on a miss or for a non-cacheable context"""
+        if self._ttl_for(context) <= 0:
+            with self._lock:
+                self.bypassed += 1
+            return None
+
+        value = self.backend.get(self.make_key(context, prompt))
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def set(self, context, prompt, response):
+        ttl = self._ttl_for(context)
+        if ttl > 0 and response:
+            self.backend.set(self.make_key(context, prompt), response, ttl)
+
+    def clear(self):
+        self.backend.clear()
+
+    def stats(self):
+        """Hit/miss counters for monitoring"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "bypassed": self.bypassed,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": len(self.backend),
+            }
+
+
+_response_cache = None
+_response_cache_lock = threading.Lock()
+
+
+def get_response_cache():
+    """Process-wide ResponseCache built from AI_CACHE_CONFIG"""
+    global _response_cache
+    if _response_cache is None:
+        with _response_cache_lock:
+            if _response_cache is None:
+                if AI_CACHE_CONFIG["backend"] == "sqlite":
+                    backend = SQLiteCacheBackend(AI_CACHE_CONFIG["sqlite_path"], AI_CACHE_CONFIG["max_entries"])
+                else:
+                    backend = MemoryCacheBackend(AI_CACHE_CONFIG["max_entries"])
+                _response_cache = ResponseCache(
+                    backend,
+                    default_ttl=AI_CACHE_CONFIG["default_ttl"] if AI_CACHE_CONFIG["enabled"] else 0,
+                    context_ttl=AI_CACHE_CONFIG["context_ttl"] if AI_CACHE_CONFIG["enabled"] else {},
+                    excluded_contexts=AI_CACHE_CONFIG["excluded_contexts"],
+                )
+    return _response_cache
@@ -0,0 +1,88 @@
+"""
+Cross-process cache invalidation over Postgres LISTEN/NOTIFY
+
+Each Streamlit process keeps its own st.cache_data entries, so a write in
+one replica is invisible to the others until their TTL expires. The
+triggers from migrations/0002_notify_triggers.py send the changed table's
+name on a notification channel; this listener relays it to a callback (normally
+utils.database.invalidate_table) so every replica drops its stale entries
+as soon as the writing transaction commits.
+"""
+
+import select
+import threading
+
+from psycopg2 import sql
+
+
+class CacheInvalidationListener(threading.Thread):
+    """
+    Background thread that LISTENs on a channel and reports each payload.
+
+    Args:
+        connect: Callable returning a new, dedicated psycopg2 connection
+            (LISTEN needs a session of its own, not a pooled one).
+        channel: Notification channel to subscribe to.
+        on_notify: Called with the payload of every notification, or with
+            None after a reconnect, when notifications may have been missed.
+        reconnect_delay: Seconds to wait before reconnecting after an error.
+        poll_interval: Upper bound on how long stop() waits for the thread.
+    """
+
+    def __init__(self, connect, channel, on_notify, reconnect_delay=5, poll_interval=1.0):
+        super().__init__(name=f"cache-listener-{channel}", daemon=True)
+        self._connect = connect
+        self.channel = channel
+        self._on_notify = on_notify
+        self.reconnect_delay = reconnect_delay
+        self.poll_interval = poll_interval
+        self._stop_event = threading.Event()
+        self.notifications_received = 0
+
+    def run(self):
+        connected_before = False
+
+        while not self._stop_event.is_set():
+            conn = None
+            try:
+                conn = self._connect()
+                if conn is None:
+                    raise ConnectionError("no database connection")
+
+                conn.autocommit = True
+                with conn.cursor() as cursor:
+                    cursor.execute(sql.SQL("LISTEN {}").format(sql.Identifier(self.channel)))
+
+                if connected_before:
+                    # Anything committed while we were disconnected went unheard
+                    self._on_notify(None)
+                connected_before = True
+
+                self._listen(conn)
+            except Exception as e:
+                print(f"⚠️ Cache listener error on '{self.channel}': {e}")
+                self._stop_event.wait(self.reconnect_delay)
+            finally:
+                if conn is not None and not conn.closed:
+                    conn.close()
+
+    def _listen(self, conn):
+        while not self._stop_event.is_set():
+            readable, _, _ = select.select([conn], [], [], self.poll_interval)
+            if not readable:
+                continue
+
+            conn.poll()
+            while conn.notifies:
+                notification = conn.notifies.pop(0)
+                self.notifications_received += 1
+                try:
+                    self._on_notify(notification.payload)
+                except Exception as e:
+                    print(f"⚠️ Cache listener callback failed for '{notification.payload}': {e}")
+
+    def stop(self, timeout=None):
+        """Ask the thread to exit and wait for it"""
+        self._stop_event.set()
+        if self.is_alive():
+            self.join(timeout if timeout is not None else self.poll_interval * 2)
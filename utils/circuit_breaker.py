@@ -0,0 +1,136 @@
+"""
+Circuit breaker for calls to an external service
+
+After ``failure_threshold`` consecutive failures the breaker opens and
+callers get an immediate "no" instead of each waiting out its own network
+timeout. While open, a background probe is retried every
+``recovery_timeout`` seconds; the first successful probe closes the breaker.
+Without a probe function the breaker lets a single trial request through
+(half-open) once the timeout has passed.
+"""
+
+import threading
+import time
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker with background half-open probes.
+
+    Args:
+        name: Label shown on the ops page.
+        failure_threshold: Consecutive failures that open the breaker.
+        recovery_timeout: Seconds to stay open before probing again.
+        probe: Optional zero-argument callable that raises on failure.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name, failure_threshold=5, recovery_timeout=30, probe=None):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.probe = probe
+
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = None
+        self._times_opened = 0
+        self._rejected = 0
+        self._last_error = None
+        self._probe_timer = None
+
+    @property
+    def state(self):
+        return self._state
+
+    def allow_request(self):
+        """Whether a real request may be sent right now"""
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+
+            if (
+                self._state == self.OPEN
+                and self.probe is None
+                and time.monotonic() - self._opened_at >= self.recovery_timeout
+            ):
+                # No background probe: the next request is the trial
+                self._state = self.HALF_OPEN
+                return True
+
+            self._rejected += 1
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self._consecutive_failures = 0
+            if self._state != self.CLOSED:
+                self._close()
+
+    def record_failure(self, error=None):
+        with self._lock:
+            self._consecutive_failures += 1
+            if error is not None:
+                self._last_error = str(error)[:200]
+            if self._state == self.HALF_OPEN or (
+                self._state == self.CLOSED and self._consecutive_failures >= self.failure_threshold
+            ):
+                self._open()
+
+    def _open(self):
+        # Caller holds self._lock
+        self._state = self.OPEN
+        self._opened_at = time.monotonic()
+        self._times_opened += 1
+        if self.probe is not None:
+            self._probe_timer = threading.Timer(self.recovery_timeout, self._run_probe)
+            self._probe_timer.daemon = True
+            self._probe_timer.start()
+
+    def _close(self):
+        # Caller holds self._lock
+        self._state = self.CLOSED
+        self._opened_at = None
+        if self._probe_timer is not None:
+            self._probe_timer.cancel()
+            self._probe_timer = None
+
+    def _run_probe(self):
+        with self._lock:
+            if self._state != self.OPEN:
+                return
+            self._state = self.HALF_OPEN
+
+        try:
+            self.probe()
+        except Exception as e:
+            self.record_failure(e)
+        else:
+            self.record_success()
+
+    def reset(self):
+        """Force the breaker closed (e.g. from the ops page)"""
+        with self._lock:
+            self._consecutive_failures = 0
+            self._close()
+
+    def stats(self):
+        """Snapshot of breaker state for the ops page"""
+        with self._lock:
+            retry_in = None
+            if self._state == self.OPEN and self._opened_at is not None:
+                retry_in = max(self.recovery_timeout - (time.monotonic() - self._opened_at), 0.0)
+            return {
+                "name": self.name,
+                "state": self._state,
+                "consecutive_failures": self._consecutive_failures,
+                "failure_threshold": self.failure_threshold,
+                "times_opened": self._times_opened,
+                "rejected": self._rejected,
+                "retry_in": retry_in,
+                "last_error": self._last_error,
+            }
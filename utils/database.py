@@ -1,14 +1,56 @@
 import psycopg2
-from psycopg2 import pool
-from psycopg2.extras import RealDictCursor
+from psycopg2 import pool, errors, sql
+from psycopg2.extras import RealDictCursor, execute_values
 import streamlit as st
 import os
+import time
+import atexit
+import threading
+import weakref
+import base64
+import functools
+import itertools
+import json
 from dotenv import load_dotenv
 from contextlib import contextmanager
 
+from config.database_config import (
+    POOL_CONFIG, QUERY_CONFIG, NOTIFY_CONFIG, FULL_TEXT_SEARCH, MENTOR_SEARCH, CARD_PROJECTIONS,
+    MIGRATION_CONFIG, METRICS_CONFIG, LIKES_CONFIG,
+)
+from config.settings import CACHE_CONFIG, SEARCH_CONFIG, PAGINATION, IMPACT_METRICS, RATE_LIMITS
+from utils.cache_listener import CacheInvalidationListener
+from utils.migrations import Migrator
+from utils.records import make_records
+from utils.search import SearchIndex, tokenize
+from utils.write_behind import CounterBuffer
+
 load_dotenv()
 
-# Simple connection function (no pooling for now)
+
+# ==================== ERRORS ====================
+
+class DatabaseError(Exception):
+    """Base class for errors raised by the database layer"""
+
+
+class DatabaseUnavailableError(DatabaseError):
+    """Raised when no connection to Postgres can be opened"""
+
+
+class PoolExhaustedError(DatabaseError):
+    """Raised when no pooled connection frees up within connection_timeout"""
+
+
+class QueryTimeoutError(DatabaseError):
+    """Raised when a query is cancelled by statement_timeout or lock_timeout"""
+
+
+class PostLimitError(DatabaseError):
+    """Raised when an author has used up RATE_LIMITS["posts_per_day"]"""
+
+
+# Simple connection function (unpooled, for one-off scripts and dedicated sessions)
 def get_db_connection_simple():
     """Get a simple database connection"""
     try:
@@ -23,502 +65,1589 @@ def get_db_connection_simple():
         print(f"❌ Error connecting to database: {e}")
         return None
 
-# Database initialization
-def init_database():
-    """Create all necessary tables"""
-    
-    create_tables_queries = [
-        # Users table
-        """
-        CREATE TABLE IF NOT EXISTS users (
-            id SERIAL PRIMARY KEY,
-            email VARCHAR(255) UNIQUE NOT NULL,
-            name VARCHAR(255) NOT NULL,
-            phone VARCHAR(20),
-            location VARCHAR(255),
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-        """,
-        
-        # Jobs table
-        """
-        CREATE TABLE IF NOT EXISTS jobs (
-            id SERIAL PRIMARY KEY,
-            title VARCHAR(255) NOT NULL,
-            company VARCHAR(255) NOT NULL,
-            location VARCHAR(255),
-            job_type VARCHAR(50),
-            salary_range VARCHAR(100),
-            description TEXT,
-            requirements TEXT,
-            posted_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            is_active BOOLEAN DEFAULT TRUE,
-            apply_link VARCHAR(500)
-        )
-        """,
-        
-        # Courses table
-        """
-        CREATE TABLE IF NOT EXISTS courses (
-            id SERIAL PRIMARY KEY,
-            title VARCHAR(255) NOT NULL,
-            category VARCHAR(100),
-            level VARCHAR(50),
-            duration VARCHAR(100),
-            description TEXT,
-            instructor VARCHAR(255),
-            price DECIMAL(10, 2) DEFAULT 0.00,
-            is_free BOOLEAN DEFAULT TRUE,
-            enrollment_count INTEGER DEFAULT 0,
-            rating DECIMAL(3, 2) DEFAULT 0.00,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-        """,
-        
-        # Success Stories table
-        """
-        CREATE TABLE IF NOT EXISTS success_stories (
-            id SERIAL PRIMARY KEY,
-            name VARCHAR(255) NOT NULL,
-            title VARCHAR(255),
-            story TEXT NOT NULL,
-            image_url VARCHAR(500),
-            category VARCHAR(100),
-            date_posted TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            is_approved BOOLEAN DEFAULT TRUE
-        )
-        """,
-        
-        # Resources table
-        """
-        CREATE TABLE IF NOT EXISTS resources (
-            id SERIAL PRIMARY KEY,
-            title VARCHAR(255) NOT NULL,
-            category VARCHAR(100),
-            resource_type VARCHAR(50),
-            description TEXT,
-            url VARCHAR(500),
-            file_path VARCHAR(500),
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-        """,
-        
-        # Mentors table
-        """
-        CREATE TABLE IF NOT EXISTS mentors (
-            id SERIAL PRIMARY KEY,
-            name VARCHAR(255) NOT NULL,
-            email VARCHAR(255) UNIQUE NOT NULL,
-            expertise VARCHAR(255),
-            bio TEXT,
-            linkedin_url VARCHAR(500),
-            available_slots INTEGER DEFAULT 5,
-            rating DECIMAL(3, 2) DEFAULT 0.00,
-            total_mentees INTEGER DEFAULT 0,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-        """,
-        
-        # Community Posts table
-        """
-        CREATE TABLE IF NOT EXISTS community_posts (
-            id SERIAL PRIMARY KEY,
-            user_id INTEGER,
-            title VARCHAR(255) NOT NULL,
-            content TEXT NOT NULL,
-            category VARCHAR(100),
-            likes INTEGER DEFAULT 0,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-        """,
-        
-        # Emergency Contacts table
-        """
-        CREATE TABLE IF NOT EXISTS emergency_contacts (
-            id SERIAL PRIMARY KEY,
-            country VARCHAR(100),
-            service_name VARCHAR(255) NOT NULL,
-            phone_number VARCHAR(20) NOT NULL,
-            description TEXT,
-            is_active BOOLEAN DEFAULT TRUE
-        )
-        """,
-        
-        # Health Records table
-        """
-        CREATE TABLE IF NOT EXISTS health_records (
-            id SERIAL PRIMARY KEY,
-            user_id INTEGER,
-            record_type VARCHAR(100),
-            record_date DATE,
-            notes TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-        """,
-        
-        # Legal Rights Info table
-        """
-        CREATE TABLE IF NOT EXISTS legal_rights (
-            id SERIAL PRIMARY KEY,
-            title VARCHAR(255) NOT NULL,
-            category VARCHAR(100),
-            description TEXT NOT NULL,
-            country VARCHAR(100),
-            law_reference VARCHAR(255),
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-        """
-    ]
-    
-    conn = None
-    try:
-        conn = get_db_connection_simple()
-        
-        if conn is None:
-            print("❌ Failed to connect to database")
+
+# ==================== CONNECTION POOL ====================
+
+class _KeepWarmConnectionPool(pool.ThreadedConnectionPool):
+    """
+    ThreadedConnectionPool that keeps up to ``maxconn`` idle connections.
+
+    psycopg2 closes every connection handed back beyond ``minconn``, which
+    turns each burst of traffic into a fresh round of TLS handshakes.
+    Idle connections are trimmed by ConnectionPoolManager instead.
+    """
+
+    def _putconn(self, conn, key=None, close=False):
+        # putconn() already holds self._lock, so the swap is not observable
+        minconn, self.minconn = self.minconn, self.maxconn
+        try:
+            super()._putconn(conn, key, close)
+        finally:
+            self.minconn = minconn
+
+
+class ConnectionPoolManager:
+    """
+    Thread-safe wrapper around psycopg2's ThreadedConnectionPool.
+
+    Every Streamlit script thread borrows a connection through
+    ``connection()`` and hands it back when the block exits. Connections
+    that sat idle past ``health_check_interval`` are pinged before reuse,
+    and ones idle past ``max_idle_time`` are closed and replaced, so a
+    server-side idle timeout never surfaces as a failed query.
+
+    ``session_settings`` (e.g. QUERY_CONFIG) are applied with set_config()
+    the first time each physical connection is handed out.
+    """
+
+    def __init__(self, dsn, min_connections=1, max_connections=10, connection_timeout=30,
+                 health_check_interval=30, max_idle_time=300, session_settings=None):
+        self.dsn = dsn
+        self.min_connections = min_connections
+        self.max_connections = max_connections
+        self.connection_timeout = connection_timeout
+        self.health_check_interval = health_check_interval
+        self.max_idle_time = max_idle_time
+        self.session_settings = dict(session_settings or {})
+
+        self._pool = None
+        self._closed = False
+        self._lock = threading.Lock()
+        # ThreadedConnectionPool raises instead of waiting when exhausted,
+        # so callers queue on this semaphore for up to connection_timeout
+        self._slots = threading.BoundedSemaphore(max_connections)
+        self._returned_at = {}
+        self._configured = weakref.WeakSet()
+        self._checked_out = 0
+        self._recycled = 0
+        self._health_check_failures = 0
+
+    def _get_pool(self):
+        if self._pool is None:
+            with self._lock:
+                if self._closed:
+                    raise DatabaseUnavailableError("Connection pool is closed")
+                if self._pool is None:
+                    try:
+                        db_pool = _KeepWarmConnectionPool(
+                            self.min_connections,
+                            self.max_connections,
+                            self.dsn,
+                            connect_timeout=self.connection_timeout,
+                        )
+                    except psycopg2.Error as e:
+                        raise DatabaseUnavailableError(f"Could not open connection pool: {e}") from e
+
+                    now = time.monotonic()
+                    for conn in db_pool._pool:
+                        self._returned_at[id(conn)] = now
+                    self._pool = db_pool
+        return self._pool
+
+    def _is_usable(self, conn):
+        """Check a connection that is about to be handed out"""
+        if conn.closed:
             return False
-        
-        cursor = conn.cursor()
-        
-        print("🔧 Creating tables...")
-        for idx, query in enumerate(create_tables_queries, 1):
+
+        returned_at = self._returned_at.pop(id(conn), None)
+        if returned_at is None:
+            # Freshly opened by the pool
+            return True
+
+        idle_for = time.monotonic() - returned_at
+        if idle_for > self.max_idle_time:
+            with self._lock:
+                self._recycled += 1
+            return False
+
+        if idle_for > self.health_check_interval:
             try:
-                cursor.execute(query)
-                print(f"   ✅ Table {idx}/{len(create_tables_queries)} created")
-            except Exception as e:
-                print(f"   ⚠️ Table {idx} error (may already exist): {e}")
-        
-        conn.commit()
-        cursor.close()
-        
-        print("✅ All tables created successfully")
+                with conn.cursor() as cursor:
+                    cursor.execute("SELECT 1")
+                conn.rollback()
+            except psycopg2.Error:
+                with self._lock:
+                    self._health_check_failures += 1
+                return False
+
         return True
-        
+
+    def _configure(self, conn):
+        """Apply session_settings once per physical connection"""
+        if conn in self._configured:
+            return
+
+        if self.session_settings:
+            calls = ", ".join(["set_config(%s, %s, false)"] * len(self.session_settings))
+            params = []
+            for name, value in self.session_settings.items():
+                params.extend([name, str(value)])
+            with conn.cursor() as cursor:
+                cursor.execute(f"SELECT {calls}", params)
+            conn.commit()
+
+        self._configured.add(conn)
+
+    def _acquire(self):
+        if not self._slots.acquire(timeout=self.connection_timeout):
+            raise PoolExhaustedError(
+                f"No database connection available after {self.connection_timeout}s "
+                f"({self.max_connections} in use)"
+            )
+
+        try:
+            db_pool = self._get_pool()
+            # Each failed check closes one stale connection, so at most
+            # max_connections attempts can fail before a fresh one is opened
+            for _ in range(self.max_connections + 1):
+                try:
+                    conn = db_pool.getconn()
+                except psycopg2.Error as e:
+                    raise DatabaseUnavailableError(f"Could not open database connection: {e}") from e
+                if self._is_usable(conn):
+                    try:
+                        self._configure(conn)
+                        break
+                    except psycopg2.Error as e:
+                        db_pool.putconn(conn, close=True)
+                        raise DatabaseUnavailableError(f"Could not configure database session: {e}") from e
+                db_pool.putconn(conn, close=True)
+            else:
+                raise DatabaseUnavailableError("No healthy database connection could be obtained")
+        except BaseException:
+            self._slots.release()
+            raise
+
+        with self._lock:
+            self._checked_out += 1
+        return conn
+
+    def _release(self, conn, discard=False):
+        db_pool = self._pool
+        if db_pool is None or self._closed:
+            # Handed back after close(), e.g. by a worker thread at shutdown:
+            # there is no pool to return it to
+            discard = True
+
+        try:
+            if not discard and not conn.closed:
+                # Never hand the next borrower a connection mid-transaction
+                conn.rollback()
+        except psycopg2.Error:
+            discard = True
+
+        discard = discard or bool(conn.closed)
+        if not discard:
+            self._returned_at[id(conn)] = time.monotonic()
+
+        try:
+            if db_pool is None:
+                conn.close()
+            else:
+                try:
+                    db_pool.putconn(conn, close=discard)
+                except pool.PoolError:
+                    # close() ran after we read self._pool
+                    conn.close()
+        finally:
+            with self._lock:
+                self._checked_out -= 1
+            self._slots.release()
+
+        self._trim_idle()
+
+    def _trim_idle(self):
+        """Close connections idle past max_idle_time, keeping min_connections open"""
+        db_pool = self._pool
+        if db_pool is None:
+            return
+
+        now = time.monotonic()
+        with db_pool._lock:
+            # getconn() pops from the end, so the stalest connections sit at the front
+            while len(db_pool._pool) > self.min_connections:
+                conn = db_pool._pool[0]
+                if now - self._returned_at.get(id(conn), now) <= self.max_idle_time:
+                    break
+                db_pool._pool.pop(0)
+                self._returned_at.pop(id(conn), None)
+                conn.close()
+                with self._lock:
+                    self._recycled += 1
+
+    @contextmanager
+    def connection(self):
+        """Borrow a pooled connection for the duration of a ``with`` block"""
+        conn = self._acquire()
+        discard = False
+        try:
+            yield conn
+        except (psycopg2.OperationalError, psycopg2.InterfaceError) as e:
+            # Errors without a SQLSTATE come from the connection itself rather
+            # than the server (e.g. a dropped socket) - don't reuse it
+            if not e.pgcode:
+                discard = True
+            raise
+        finally:
+            self._release(conn, discard=discard)
+
+    def stats(self):
+        """Snapshot of pool usage for monitoring"""
+        with self._lock:
+            idle = len(self._pool._pool) if self._pool is not None else 0
+            return {
+                "min_connections": self.min_connections,
+                "max_connections": self.max_connections,
+                "checked_out": self._checked_out,
+                "idle": idle,
+                "recycled": self._recycled,
+                "health_check_failures": self._health_check_failures,
+            }
+
+    def close(self):
+        """Close every connection held by the pool; later checkouts fail"""
+        with self._lock:
+            self._closed = True
+            if self._pool is not None and not self._pool.closed:
+                self._pool.closeall()
+            self._pool = None
+            self._returned_at.clear()
+
+
+_pool_manager = None
+_pool_manager_lock = threading.Lock()
+
+
+def get_pool():
+    """Return the process-wide connection pool, creating it on first use"""
+    global _pool_manager
+    if _pool_manager is None:
+        with _pool_manager_lock:
+            if _pool_manager is None:
+                database_url = os.getenv("DATABASE_URL")
+                if not database_url:
+                    raise DatabaseUnavailableError("DATABASE_URL not found in environment variables!")
+                # Other threads wait on the lock until the schema is current
+                if MIGRATION_CONFIG["run_on_startup"]:
+                    init_database()
+                _pool_manager = ConnectionPoolManager(
+                    database_url,
+                    session_settings={
+                        name: QUERY_CONFIG[name]
+                        for name in ("statement_timeout", "lock_timeout", "idle_in_transaction_session_timeout")
+                    },
+                    **POOL_CONFIG,
+                )
+                atexit.register(close_pool)
+    return _pool_manager
+
+
+@contextmanager
+def get_db_connection(timeout_ms=None):
+    """
+    Borrow a pooled connection.
+
+    Usage:
+        with get_db_connection(timeout_ms=2000) as conn:
+            ...
+
+    ``timeout_ms`` overrides statement_timeout for this block only.
+    Uncommitted work is rolled back when the block exits, and queries
+    cancelled by statement_timeout or lock_timeout raise QueryTimeoutError.
+    """
+    try:
+        with get_pool().connection() as conn:
+            if timeout_ms is not None:
+                with conn.cursor() as cursor:
+                    # is_local=true: reverts at the end of this transaction
+                    cursor.execute("SELECT set_config('statement_timeout', %s, true)", (str(int(timeout_ms)),))
+            yield conn
+    except (errors.QueryCanceled, errors.LockNotAvailable) as e:
+        raise QueryTimeoutError(str(e).strip()) from e
+
+
+def get_pool_stats():
+    """Report how many pooled connections are checked out, idle and recycled"""
+    if _pool_manager is None:
+        return {
+            "min_connections": POOL_CONFIG["min_connections"],
+            "max_connections": POOL_CONFIG["max_connections"],
+            "checked_out": 0,
+            "idle": 0,
+            "recycled": 0,
+            "health_check_failures": 0,
+        }
+    return _pool_manager.stats()
+
+
+def close_pool():
+    """Close all pooled connections (called automatically at interpreter exit)"""
+    if _pool_manager is not None:
+        _pool_manager.close()
+
+
+def _fetch_all(query, params=None, timeout_ms=None):
+    """Run a read query on a pooled connection and return all rows as dicts"""
+    with get_db_connection(timeout_ms=timeout_ms) as conn:
+        with conn.cursor(cursor_factory=RealDictCursor) as cursor:
+            cursor.execute(query, params)
+            return cursor.fetchall()
+
+
+def _fetch_tuples(query, params=None, timeout_ms=None):
+    """Run a read query and return ``(column_names, value_tuples)``"""
+    with get_db_connection(timeout_ms=timeout_ms) as conn:
+        with conn.cursor() as cursor:
+            cursor.execute(query, params)
+            return [column.name for column in cursor.description], cursor.fetchall()
+
+
+def _fetch_records(query, params=None, timeout_ms=None):
+    """Run a read query and return its rows as compact records (utils.records)"""
+    return make_records(*_fetch_tuples(query, params, timeout_ms=timeout_ms))
+
+
+_table_columns = {}
+
+
+def _select_list(table):
+    """
+    Column list for ``SELECT ... FROM table`` without generated columns.
+
+    Keeps derived data such as the full-text ``search_vector`` out of page
+    rows and the Streamlit cache. Looked up once per process.
+    """
+    columns = _table_columns.get(table)
+    if columns is None:
+        rows = _fetch_all(
+            """
+            SELECT column_name FROM information_schema.columns
+            WHERE table_schema = current_schema() AND table_name = %s AND is_generated = 'NEVER'
+            ORDER BY ordinal_position
+            """,
+            (table,)
+        )
+        columns = [row["column_name"] for row in rows]
+        if columns:
+            _table_columns[table] = columns
+
+    if not columns:
+        return sql.SQL("*")
+    return sql.SQL(", ").join(sql.Identifier(column) for column in columns)
+
+
+def _card_select_list(table):
+    """Column list for ``table``'s listing cards: CARD_PROJECTIONS columns plus a SQL-cut snippet"""
+    projection = CARD_PROJECTIONS[table]
+    snippet_column, snippet_length = projection["snippet"]
+    return sql.SQL("{}, LEFT({}, {}) AS snippet").format(
+        sql.SQL(", ").join(sql.Identifier(column) for column in projection["columns"]),
+        sql.Identifier(snippet_column),
+        sql.Literal(snippet_length),
+    )
+
+
+def _insert_returning_id(query, params, table=None):
+    """
+    Run an INSERT ... RETURNING id on a pooled connection and commit it.
+
+    When a row was written, ``table``'s cached reads are invalidated.
+    """
+    with get_db_connection() as conn:
+        with conn.cursor() as cursor:
+            cursor.execute(query, params)
+            result = cursor.fetchone()
+        conn.commit()
+
+    if result is None:
+        return None
+    if table:
+        previous_version = get_table_version(table)
+        new_version = invalidate_table(table)
+        _index_inserted_row(table, result[0], previous_version, new_version)
+    return result[0]
+
+
+# ==================== KEYSET PAGINATION ====================
+# List helpers take ``(cursor, page_size)`` and return ``(rows, next_cursor)``.
+# Rows are compact records (utils.records); with ``card=True`` they carry
+# only the columns the listing card shows plus a precomputed ``snippet``.
+# Pass next_cursor back to get the following page; it is None on the last
+# page. The cursor carries the last row's sort key and id, so each page is
+# an index range scan that never skips or repeats rows the way OFFSET can.
+
+def _encode_cursor(values):
+    """Opaque, URL-safe page cursor for a row's sort key"""
+    return base64.urlsafe_b64encode(json.dumps(values, default=str).encode("utf-8")).decode("ascii")
+
+
+def _decode_cursor(cursor):
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except (ValueError, AttributeError) as e:
+        raise ValueError(f"Invalid page cursor: {cursor!r}") from e
+    if not isinstance(values, list) or len(values) != 2:
+        raise ValueError(f"Invalid page cursor: {cursor!r}")
+    return values
+
+
+def _keyset_page(table, sort_key, key_type, cursor, page_size, conditions=(), params=(),
+                 sort_params=(), columns=None, card=False, timeout_ms=None):
+    """
+    One page of ``table`` ordered by ``(sort_key DESC, id DESC)``.
+
+    ``sort_key`` is a column or expression (``sort_params`` fill its
+    placeholders) and ``key_type`` the SQL type its cursor value is cast
+    back to; it must never be NULL (migrations/0013_not_null_sort_keys.py),
+    as a NULL key would end the row comparison and the paging with it.
+    ``conditions`` are ANDed together with ``params`` as their
+    placeholders. ``card`` selects the table's card projection instead of
+    every column. Returns ``(rows, next_cursor)`` with rows as records.
+    """
+    conditions = list(conditions)
+    params = list(params)
+    if cursor:
+        last_key, last_id = _decode_cursor(cursor)
+        conditions.append(sql.SQL("({}, id) < (%s::{}, %s)").format(sort_key, sql.SQL(key_type)))
+        params.extend(list(sort_params) + [last_key, last_id])
+
+    statement = sql.SQL("""
+        SELECT {columns}, {sort_key} AS sort_key FROM {table}
+        {where}
+        ORDER BY sort_key DESC, id DESC
+        LIMIT %s
+    """).format(
+        columns=columns if columns is not None else _card_select_list(table) if card else _select_list(table),
+        sort_key=sort_key,
+        table=sql.Identifier(table),
+        where=sql.SQL("WHERE ") + sql.SQL(" AND ").join(conditions) if conditions else sql.SQL(""),
+    )
+    # One extra row tells us whether there is a next page
+    fields, rows = _fetch_tuples(statement, list(sort_params) + params + [page_size + 1], timeout_ms=timeout_ms)
+
+    next_cursor = None
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        next_cursor = _encode_cursor([rows[-1][-1], rows[-1][fields.index("id")]])
+    # sort_key is the last column and only feeds the cursor
+    return make_records(fields[:-1], (row[:-1] for row in rows)), next_cursor
+
+
+_stream_ids = itertools.count(1)
+
+
+def _stream_rows(query, params=None, itersize=None, timeout_ms=None):
+    """
+    Yield rows (as dicts) from a server-side cursor.
+
+    Only ``itersize`` rows are held in memory at a time, however many the
+    query returns, and the whole iteration reads one consistent snapshot.
+    The pooled connection is held until the generator is exhausted or
+    closed, so consume it promptly. Errors propagate rather than ending the
+    stream early, so an export is never silently truncated.
+    """
+    with get_db_connection(timeout_ms=timeout_ms) as conn:
+        # The transaction stays open between batches; give slow consumers
+        # (e.g. a writer on a slow disk) longer than the session default
+        with conn.cursor() as cursor:
+            cursor.execute(
+                "SELECT set_config('idle_in_transaction_session_timeout', %s, true)",
+                (str(QUERY_CONFIG["stream_idle_timeout"]),)
+            )
+        with conn.cursor(name=f"stream_{next(_stream_ids)}", cursor_factory=RealDictCursor) as cursor:
+            cursor.itersize = itersize or QUERY_CONFIG["stream_itersize"]
+            cursor.execute(query, params)
+            for row in cursor:
+                yield row
+
+
+def _iter_pages(fetch_page, page_size=500, **kwargs):
+    """Yield every row of a paginated list helper, one page at a time"""
+    cursor = None
+    while True:
+        rows, cursor = fetch_page(cursor=cursor, page_size=page_size, **kwargs)
+        yield from rows
+        if not cursor:
+            return
+
+
+# ==================== CACHE VERSIONING ====================
+# Every cached reader takes its table's version as the first cache-key
+# argument, so a write makes every entry for that table (whatever filter
+# arguments it was cached under) unreachable at once, while other tables'
+# caches - and unrelated st.cache_data users - stay warm.
+
+_table_versions = {}
+_table_versions_lock = threading.Lock()
+_table_caches = {}
+
+
+def get_table_version(table):
+    """Current cache version of a table"""
+    return _table_versions.get(table, 0)
+
+
+def invalidate_table(table):
+    """Bump a table's cache version and drop its cached entries"""
+    with _table_versions_lock:
+        version = _table_versions.get(table, 0) + 1
+        _table_versions[table] = version
+
+    for cached_fn in _table_caches.get(table, ()):
+        cached_fn.clear()
+    return version
+
+
+def _register_table_cache(table, cached_fn):
+    _table_caches.setdefault(table, []).append(cached_fn)
+    return cached_fn
+
+
+_cache_listener = None
+_cache_listener_lock = threading.Lock()
+
+
+def _on_table_change(table):
+    """Listener callback: ``None`` means notifications may have been missed"""
+    if table is None:
+        for known_table in list(_table_caches):
+            invalidate_table(known_table)
+    else:
+        invalidate_table(table)
+
+
+def start_cache_listener():
+    """
+    Start this process's LISTEN/NOTIFY invalidation thread (idempotent).
+
+    Does nothing unless NOTIFY_CONFIG["enabled"] is set, so single-process
+    deployments don't pay for the extra connection.
+    """
+    global _cache_listener
+    if not NOTIFY_CONFIG["enabled"] or _cache_listener is not None:
+        return _cache_listener
+
+    with _cache_listener_lock:
+        if _cache_listener is None:
+            _cache_listener = CacheInvalidationListener(
+                connect=get_db_connection_simple,
+                channel=NOTIFY_CONFIG["channel"],
+                on_notify=_on_table_change,
+                reconnect_delay=NOTIFY_CONFIG["reconnect_delay"],
+            )
+            _cache_listener.start()
+            atexit.register(_cache_listener.stop)
+    return _cache_listener
+
+
+def _cache_version(table):
+    """Version to key a cached read on; lazily starts the listener if enabled"""
+    start_cache_listener()
+    return get_table_version(table)
+
+
+# Database initialization
+def init_database(dry_run=False, target=None):
+    """
+    Bring the schema up to date by applying pending migrations (see
+    utils/migrations.py). Returns True on success.
+    """
+    try:
+        migrator = Migrator(
+            connect=get_db_connection_simple,
+            lock_key=MIGRATION_CONFIG["lock_key"],
+            lock_wait=MIGRATION_CONFIG["lock_wait"],
+            statement_timeout=MIGRATION_CONFIG["statement_timeout"],
+            lock_timeout=MIGRATION_CONFIG["lock_timeout"],
+        )
+        success = migrator.run(dry_run=dry_run, target=target)
     except Exception as e:
-        print(f"❌ Error creating tables: {e}")
-        if conn:
-            conn.rollback()
+        print(f"❌ Error running migrations: {e}")
         return False
-        
-    finally:
-        if conn:
-            conn.close()
+
+    if success and not dry_run:
+        _table_columns.clear()
+    return success
 
 # CRUD Operations
 
 def insert_user(email, name, phone=None, location=None):
     """Insert a new user"""
-    conn = None
     try:
-        conn = get_db_connection_simple()
-        if not conn:
-            return None
-        
-        cursor = conn.cursor()
-        cursor.execute(
+        return _insert_returning_id(
             """
             INSERT INTO users (email, name, phone, location)
             VALUES (%s, %s, %s, %s)
             ON CONFLICT (email) DO NOTHING
             RETURNING id
             """,
-            (email, name, phone, location)
+            (email, name, phone, location),
+            table="users"
         )
-        result = cursor.fetchone()
-        conn.commit()
-        cursor.close()
-        return result[0] if result else None
     except Exception as e:
         print(f"Error inserting user: {e}")
-        if conn:
-            conn.rollback()
         return None
-    finally:
-        if conn:
-            conn.close()
 
-def get_all_jobs(limit=50):
-    """Get all active jobs"""
-    conn = None
+def get_all_jobs(cursor=None, page_size=None, card=False, timeout_ms=None):
+    """Get active jobs, newest first; returns (rows, next_cursor)"""
     try:
-        conn = get_db_connection_simple()
-        if not conn:
-            return []
-        
-        cursor = conn.cursor(cursor_factory=RealDictCursor)
-        cursor.execute(
-            """
-            SELECT * FROM jobs 
-            WHERE is_active = TRUE 
-            ORDER BY posted_date DESC 
-            LIMIT %s
-            """,
-            (limit,)
+        return _keyset_page(
+            "jobs", sql.Identifier("posted_date"), "timestamp", cursor, page_size or PAGINATION["jobs_per_page"],
+            conditions=[sql.SQL("is_active = TRUE")],
+            card=card,
+            timeout_ms=timeout_ms
         )
-        results = cursor.fetchall()
-        cursor.close()
-        return results
+    except QueryTimeoutError:
+        raise
     except Exception as e:
         print(f"Error fetching jobs: {e}")
-        return []
-    finally:
-        if conn:
-            conn.close()
+        return [], None
 
 def insert_job(title, company, location, job_type, salary_range, description, requirements, apply_link):
     """Insert a new job posting"""
-    conn = None
     try:
-        conn = get_db_connection_simple()
-        if not conn:
-            return None
-        
-        cursor = conn.cursor()
-        cursor.execute(
+        return _insert_returning_id(
             """
             INSERT INTO jobs (title, company, location, job_type, salary_range, description, requirements, apply_link)
             VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
             RETURNING id
             """,
-            (title, company, location, job_type, salary_range, description, requirements, apply_link)
+            (title, company, location, job_type, salary_range, description, requirements, apply_link),
+            table="jobs"
         )
-        result = cursor.fetchone()
-        conn.commit()
-        cursor.close()
-        return result[0] if result else None
     except Exception as e:
         print(f"Error inserting job: {e}")
-        if conn:
-            conn.rollback()
         return None
-    finally:
-        if conn:
-            conn.close()
 
-def get_all_courses(category=None):
-    """Get all courses, optionally filtered by category"""
-    conn = None
+def get_all_courses(category=None, cursor=None, page_size=None, card=False, timeout_ms=None):
+    """Get courses, newest first, optionally filtered by category; returns (rows, next_cursor)"""
     try:
-        conn = get_db_connection_simple()
-        if not conn:
-            return []
-        
-        cursor = conn.cursor(cursor_factory=RealDictCursor)
-        if category:
-            cursor.execute(
-                "SELECT * FROM courses WHERE category = %s ORDER BY created_at DESC",
-                (category,)
-            )
-        else:
-            cursor.execute("SELECT * FROM courses ORDER BY created_at DESC")
-        
-        results = cursor.fetchall()
-        cursor.close()
-        return results
+        return _keyset_page(
+            "courses", sql.Identifier("created_at"), "timestamp", cursor, page_size or PAGINATION["courses_per_page"],
+            conditions=[sql.SQL("category = %s")] if category else [],
+            params=[category] if category else [],
+            card=card,
+            timeout_ms=timeout_ms
+        )
+    except QueryTimeoutError:
+        raise
     except Exception as e:
         print(f"Error fetching courses: {e}")
-        return []
-    finally:
-        if conn:
-            conn.close()
+        return [], None
 
 def insert_course(title, category, level, duration, description, instructor, price=0.00, is_free=True):
     """Insert a new course"""
-    conn = None
     try:
-        conn = get_db_connection_simple()
-        if not conn:
-            return None
-        
-        cursor = conn.cursor()
-        cursor.execute(
+        return _insert_returning_id(
             """
             INSERT INTO courses (title, category, level, duration, description, instructor, price, is_free)
             VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
             RETURNING id
             """,
-            (title, category, level, duration, description, instructor, price, is_free)
+            (title, category, level, duration, description, instructor, price, is_free),
+            table="courses"
         )
-        result = cursor.fetchone()
-        conn.commit()
-        cursor.close()
-        return result[0] if result else None
     except Exception as e:
         print(f"Error inserting course: {e}")
-        if conn:
-            conn.rollback()
         return None
-    finally:
-        if conn:
-            conn.close()
 
-def get_success_stories(limit=20):
-    """Get approved success stories"""
-    conn = None
+def get_success_stories(cursor=None, page_size=None, card=False, timeout_ms=None):
+    """Get approved success stories, newest first; returns (rows, next_cursor)"""
     try:
-        conn = get_db_connection_simple()
-        if not conn:
-            return []
-        
-        cursor = conn.cursor(cursor_factory=RealDictCursor)
-        cursor.execute(
-            """
-            SELECT * FROM success_stories 
-            WHERE is_approved = TRUE 
-            ORDER BY date_posted DESC 
-            LIMIT %s
-            """,
-            (limit,)
+        return _keyset_page(
+            "success_stories", sql.Identifier("date_posted"), "timestamp", cursor,
+            page_size or PAGINATION["stories_per_page"],
+            conditions=[sql.SQL("is_approved = TRUE")],
+            card=card,
+            timeout_ms=timeout_ms
         )
-        results = cursor.fetchall()
-        cursor.close()
-        return results
+    except QueryTimeoutError:
+        raise
     except Exception as e:
         print(f"Error fetching success stories: {e}")
-        return []
-    finally:
-        if conn:
-            conn.close()
+        return [], None
 
 def insert_success_story(name, title, story, category, image_url=None):
     """Insert a new success story"""
-    conn = None
     try:
-        conn = get_db_connection_simple()
-        if not conn:
-            return None
-        
-        cursor = conn.cursor()
-        cursor.execute(
+        return _insert_returning_id(
             """
             INSERT INTO success_stories (name, title, story, category, image_url)
             VALUES (%s, %s, %s, %s, %s)
             RETURNING id
             """,
-            (name, title, story, category, image_url)
+            (name, title, story, category, image_url),
+            table="success_stories"
         )
-        result = cursor.fetchone()
-        conn.commit()
-        cursor.close()
-        return result[0] if result else None
     except Exception as e:
         print(f"Error inserting success story: {e}")
-        if conn:
-            conn.rollback()
         return None
-    finally:
-        if conn:
-            conn.close()
 
-def get_mentors(expertise=None):
-    """Get all mentors, optionally filtered by expertise"""
-    conn = None
+def get_mentors(expertise=None, cursor=None, page_size=None, card=False, timeout_ms=None):
+    """Get mentors, best rated first, optionally filtered by expertise; returns (rows, next_cursor)"""
     try:
-        conn = get_db_connection_simple()
-        if not conn:
-            return []
-        
-        cursor = conn.cursor(cursor_factory=RealDictCursor)
-        if expertise:
-            cursor.execute(
-                "SELECT * FROM mentors WHERE expertise ILIKE %s ORDER BY rating DESC",
-                (f"%{expertise}%",)
-            )
-        else:
-            cursor.execute("SELECT * FROM mentors ORDER BY rating DESC")
-        
-        results = cursor.fetchall()
-        cursor.close()
-        return results
+        return _keyset_page(
+            "mentors", sql.Identifier("rating"), "numeric", cursor, page_size or PAGINATION["mentors_per_page"],
+            conditions=[sql.SQL("expertise ILIKE %s")] if expertise else [],
+            params=[f"%{expertise}%"] if expertise else [],
+            card=card,
+            timeout_ms=timeout_ms
+        )
+    except QueryTimeoutError:
+        raise
     except Exception as e:
         print(f"Error fetching mentors: {e}")
-        return []
-    finally:
-        if conn:
-            conn.close()
+        return [], None
 
-def get_community_posts(category=None, limit=50):
-    """Get community posts"""
-    conn = None
-    try:
-        conn = get_db_connection_simple()
-        if not conn:
-            return []
-        
-        cursor = conn.cursor(cursor_factory=RealDictCursor)
-        if category:
+# Cleared the first time a search finds pg_trgm missing
+_trigram_search_available = True
+
+
+def _search_mentors_trigram(term, limit, columns, timeout_ms):
+    with get_db_connection(timeout_ms=timeout_ms) as conn:
+        with conn.cursor() as cursor:
+            # Transaction-local, so pooled connections keep the default
             cursor.execute(
-                """
-                SELECT cp.*, 'Anonymous' as author_name 
-                FROM community_posts cp
-                WHERE cp.category = %s
-                ORDER BY cp.created_at DESC 
-                LIMIT %s
-                """,
-                (category, limit)
+                "SELECT set_config('pg_trgm.word_similarity_threshold', %s, true)",
+                (str(MENTOR_SEARCH["similarity_threshold"]),)
             )
-        else:
             cursor.execute(
-                """
-                SELECT cp.*, 'Anonymous' as author_name 
-                FROM community_posts cp
-                ORDER BY cp.created_at DESC 
-                LIMIT %s
-                """,
-                (limit,)
+                sql.SQL("""
+                SELECT {} FROM mentors
+                WHERE %(term)s <%% expertise OR %(term)s <%% name
+                ORDER BY GREATEST(word_similarity(%(term)s, expertise), word_similarity(%(term)s, name)) DESC,
+                         rating DESC, id
+                LIMIT %(limit)s
+                """).format(columns),
+                {"term": term, "limit": limit}
             )
-        
-        results = cursor.fetchall()
-        cursor.close()
-        return results
+            return make_records([column.name for column in cursor.description], cursor.fetchall())
+
+
+def search_mentors(term, limit=None, card=False, timeout_ms=None):
+    """
+    Fuzzy mentor search on expertise and name, best match first.
+
+    Tolerates typos via pg_trgm word similarity; without the extension it
+    falls back to a case-insensitive substring match ordered by rating.
+    """
+    global _trigram_search_available
+    if limit is None:
+        limit = MENTOR_SEARCH["limit"]
+    term = (term or "").strip()
+    columns = _card_select_list("mentors") if card else sql.SQL("*")
+    try:
+        if not term:
+            return _fetch_records(
+                sql.SQL("SELECT {} FROM mentors ORDER BY rating DESC, id DESC LIMIT %s").format(columns),
+                (limit,), timeout_ms=timeout_ms
+            )
+        if _trigram_search_available:
+            try:
+                return _search_mentors_trigram(term, limit, columns, timeout_ms)
+            except errors.UndefinedFunction:
+                print("pg_trgm is not installed; mentor search falls back to ILIKE")
+                _trigram_search_available = False
+        return _fetch_records(
+            sql.SQL("""
+            SELECT {} FROM mentors
+            WHERE expertise ILIKE %s OR name ILIKE %s
+            ORDER BY rating DESC, id DESC
+            LIMIT %s
+            """).format(columns),
+            (f"%{term}%", f"%{term}%", limit),
+            timeout_ms=timeout_ms
+        )
+    except QueryTimeoutError:
+        raise
     except Exception as e:
-        print(f"Error fetching community posts: {e}")
+        print(f"Error searching mentors: {e}")
         return []
-    finally:
-        if conn:
-            conn.close()
 
-def get_legal_rights(category=None):
-    """Get legal rights information"""
-    conn = None
+# Community post orderings: sort name -> (sort key, its SQL type). "hot" is
+# the trigger-maintained score from migrations/0009_hot_score.sql.
+POST_SORTS = {
+    "recent": (sql.Identifier("created_at"), "timestamp"),
+    "hot": (sql.Identifier("hot_score"), "double precision"),
+}
+
+def get_community_posts(category=None, cursor=None, page_size=None, sort="recent", timeout_ms=None):
+    """Get community posts, newest (or hottest) first; returns (rows, next_cursor)"""
+    if sort not in POST_SORTS:
+        raise ValueError(f"Unknown post sort {sort!r}; expected one of {sorted(POST_SORTS)}")
+    sort_key, key_type = POST_SORTS[sort]
     try:
-        conn = get_db_connection_simple()
-        if not conn:
-            return []
-        
-        cursor = conn.cursor(cursor_factory=RealDictCursor)
-        if category:
-            cursor.execute(
-                "SELECT * FROM legal_rights WHERE category = %s ORDER BY created_at DESC",
-                (category,)
-            )
-        else:
-            cursor.execute("SELECT * FROM legal_rights ORDER BY created_at DESC")
-        
-        results = cursor.fetchall()
-        cursor.close()
-        return results
+        return _keyset_page(
+            "community_posts", sort_key, key_type, cursor,
+            page_size or PAGINATION["posts_per_page"],
+            conditions=[sql.SQL("category = %s")] if category else [],
+            params=[category] if category else [],
+            columns=sql.SQL("*, 'Anonymous' as author_name"),
+            timeout_ms=timeout_ms
+        )
+    except QueryTimeoutError:
+        raise
+    except Exception as e:
+        print(f"Error fetching community posts: {e}")
+        return [], None
+
+def insert_community_post(title, content, category, user_id=None, limiter_key=None):
+    """
+    Publish a community post, at most RATE_LIMITS["posts_per_day"] per
+    author in any 24 hours.
+
+    The author is ``limiter_key`` (e.g. a session id for anonymous posters),
+    else ``user_id``; with neither, no limit applies. Their hourly counter
+    row is bumped in the same transaction as the insert, and its row lock
+    serializes concurrent submissions from one author across replicas.
+
+    Raises:
+        PostLimitError: If the author is over the limit; nothing is written
+    """
+    if limiter_key is None and user_id is not None:
+        limiter_key = f"user:{user_id}"
+
+    try:
+        with get_db_connection() as conn:
+            with conn.cursor() as cursor:
+                if limiter_key:
+                    cursor.execute(
+                        """
+                        INSERT INTO community_post_counters (limiter_key, bucket, posts)
+                        VALUES (%s, date_trunc('hour', LOCALTIMESTAMP), 1)
+                        ON CONFLICT (limiter_key, bucket)
+                        DO UPDATE SET posts = community_post_counters.posts + 1
+                        """,
+                        (limiter_key,)
+                    )
+                    cursor.execute(
+                        """
+                        SELECT SUM(posts) FROM community_post_counters
+                        WHERE limiter_key = %s AND bucket > date_trunc('hour', LOCALTIMESTAMP) - INTERVAL '1 day'
+                        """,
+                        (limiter_key,)
+                    )
+                    if cursor.fetchone()[0] > RATE_LIMITS["posts_per_day"]:
+                        # Leaving the block rolls the counter bump back
+                        raise PostLimitError(f"{limiter_key} reached {RATE_LIMITS['posts_per_day']} posts per day")
+                    cursor.execute(
+                        """
+                        DELETE FROM community_post_counters
+                        WHERE limiter_key = %s AND bucket <= date_trunc('hour', LOCALTIMESTAMP) - INTERVAL '1 day'
+                        """,
+                        (limiter_key,)
+                    )
+
+                cursor.execute(
+                    """
+                    INSERT INTO community_posts (user_id, title, content, category)
+                    VALUES (%s, %s, %s, %s)
+                    RETURNING id
+                    """,
+                    (user_id, title, content, category)
+                )
+                post_id = cursor.fetchone()[0]
+            conn.commit()
+    except PostLimitError:
+        raise
+    except Exception as e:
+        print(f"Error inserting community post: {e}")
+        return None
+
+    invalidate_table("community_posts")
+    return post_id
+
+def insert_reply(post_id, content, user_id=None):
+    """Reply to a community post; the post's reply_count follows via trigger"""
+    try:
+        reply_id = _insert_returning_id(
+            """
+            INSERT INTO community_replies (post_id, user_id, content)
+            VALUES (%s, %s, %s)
+            RETURNING id
+            """,
+            (post_id, user_id, content),
+            table="community_replies"
+        )
+        invalidate_table("community_posts")
+        return reply_id
+    except Exception as e:
+        print(f"Error inserting reply: {e}")
+        return None
+
+def get_replies(post_id, cursor=None, page_size=None, timeout_ms=None):
+    """Get a post's replies, newest first; returns (rows, next_cursor)"""
+    try:
+        return _keyset_page(
+            "community_replies", sql.Identifier("created_at"), "timestamp", cursor,
+            page_size or PAGINATION["replies_per_page"],
+            conditions=[sql.SQL("post_id = %s")],
+            params=[post_id],
+            columns=sql.SQL("*, 'Anonymous' as author_name"),
+            timeout_ms=timeout_ms
+        )
+    except QueryTimeoutError:
+        raise
+    except Exception as e:
+        print(f"Error fetching replies: {e}")
+        return [], None
+
+def get_legal_rights(category=None, cursor=None, page_size=None, timeout_ms=None):
+    """Get legal rights information, newest first; returns (rows, next_cursor)"""
+    try:
+        return _keyset_page(
+            "legal_rights", sql.Identifier("created_at"), "timestamp", cursor,
+            page_size or PAGINATION["legal_rights_per_page"],
+            conditions=[sql.SQL("category = %s")] if category else [],
+            params=[category] if category else [],
+            timeout_ms=timeout_ms
+        )
+    except QueryTimeoutError:
+        raise
     except Exception as e:
         print(f"Error fetching legal rights: {e}")
-        return []
-    finally:
-        if conn:
-            conn.close()
+        return [], None
+
+def _prefix_tsquery(query):
+    """'data anal' -> 'data:* & anal:*' so partially typed words still match"""
+    tokens = tokenize(query)
+    if not tokens:
+        return None
+    return " & ".join(f"{token}:*" for token in tokens)
+
+
+def _full_text_search(table, query, filters, cursor, page_size, timeout_ms, where=None, card=False):
+    """
+    Ranked, keyset-paginated search over ``table``'s search_vector.
+
+    ``filters`` maps column -> value; None values are ignored. ``where`` is
+    an extra fixed condition (e.g. only approved rows).
+    """
+    tsquery = _prefix_tsquery(query)
+
+    conditions = [where] if where is not None else []
+    params = []
+    for column, value in filters.items():
+        if value is not None:
+            conditions.append(sql.SQL("{} = %s").format(sql.Identifier(column)))
+            params.append(value)
+
+    if not tsquery:
+        order_column = sql.Identifier(FULL_TEXT_SEARCH["tables"][table]["order_by"])
+        return _keyset_page(
+            table, order_column, "timestamp", cursor, page_size,
+            conditions=conditions, params=params, card=card, timeout_ms=timeout_ms
+        )
+
+    language = sql.Literal(FULL_TEXT_SEARCH["language"])
+    # A query made only of stop words has no lexemes; match everything then
+    conditions.append(sql.SQL(
+        "(numnode(to_tsquery({0}, %s)) = 0 OR search_vector @@ to_tsquery({0}, %s))"
+    ).format(language))
+    params.extend([tsquery, tsquery])
+    return _keyset_page(
+        table, sql.SQL("ts_rank(search_vector, to_tsquery({}, %s))").format(language), "real", cursor, page_size,
+        conditions=conditions, params=params, sort_params=[tsquery], card=card, timeout_ms=timeout_ms
+    )
+
+
+def search_jobs(query=None, job_type=None, location=None, cursor=None, page_size=None, card=False, timeout_ms=None):
+    """Search active jobs; returns (rows, next_cursor)"""
+    try:
+        return _full_text_search(
+            "jobs", query, {"job_type": job_type, "location": location}, cursor, page_size or PAGINATION["jobs_per_page"], timeout_ms,
+            where=sql.SQL("is_active = TRUE"), card=card
+        )
+    except QueryTimeoutError:
+        raise
+    except Exception as e:
+        print(f"Error searching jobs: {e}")
+        return [], None
+
+def search_courses(query=None, category=None, level=None, cursor=None, page_size=None, card=False, timeout_ms=None):
+    """Search courses; returns (rows, next_cursor)"""
+    try:
+        return _full_text_search(
+            "courses", query, {"category": category, "level": level}, cursor, page_size or PAGINATION["courses_per_page"], timeout_ms,
+            card=card
+        )
+    except QueryTimeoutError:
+        raise
+    except Exception as e:
+        print(f"Error searching courses: {e}")
+        return [], None
+
+def search_stories(query=None, category=None, cursor=None, page_size=None, card=False, timeout_ms=None):
+    """Search approved success stories; returns (rows, next_cursor)"""
+    try:
+        return _full_text_search(
+            "success_stories", query, {"category": category}, cursor, page_size or PAGINATION["stories_per_page"], timeout_ms,
+            where=sql.SQL("is_approved = TRUE"), card=card
+        )
+    except QueryTimeoutError:
+        raise
+    except Exception as e:
+        print(f"Error searching success stories: {e}")
+        return [], None
+
+def search_legal_rights(query=None, category=None, country=None, cursor=None, page_size=None, timeout_ms=None):
+    """Search legal rights information; returns (rows, next_cursor)"""
+    try:
+        return _full_text_search(
+            "legal_rights", query, {"category": category, "country": country}, cursor, page_size or PAGINATION["legal_rights_per_page"], timeout_ms
+        )
+    except QueryTimeoutError:
+        raise
+    except Exception as e:
+        print(f"Error searching legal rights: {e}")
+        return [], None
+
+# ==================== BULK INSERTS ====================
+# Seeding and catalog imports insert many rows in one transaction, as
+# multi-row INSERTs of QUERY_CONFIG["bulk_page_size"] rows each. Rows are
+# dicts (extra keys are ignored) and may be any iterable, including a
+# generator: only one page is held at a time, so an import of any size runs
+# in bounded memory. A failure rolls the whole load back.
+
+_REQUIRED = object()
+
+# Insertable columns per table, with the value used when a row omits one
+_BULK_COLUMNS = {
+    "jobs": {
+        "title": _REQUIRED, "company": _REQUIRED, "location": None, "job_type": None,
+        "salary_range": None, "description": None, "requirements": None, "apply_link": None,
+    },
+    "courses": {
+        "title": _REQUIRED, "category": None, "level": None, "duration": None, "description": None,
+        "instructor": None, "price": 0.00, "is_free": True,
+    },
+    "success_stories": {
+        "name": _REQUIRED, "title": None, "story": _REQUIRED, "category": None, "image_url": None,
+    },
+    "mentors": {
+        "name": _REQUIRED, "email": _REQUIRED, "expertise": None, "bio": None, "linkedin_url": None,
+        "available_slots": 5, "rating": 0.00, "total_mentees": 0,
+    },
+    "legal_rights": {
+        "title": _REQUIRED, "category": None, "description": _REQUIRED, "country": None, "law_reference": None,
+    },
+    "community_posts": {
+        "user_id": None, "title": _REQUIRED, "content": _REQUIRED, "category": None, "likes": 0,
+    },
+}
+
+
+def _bulk_rows(table, rows):
+    columns = _BULK_COLUMNS[table]
+    for number, row in enumerate(rows, 1):
+        if not isinstance(row, dict):
+            raise ValueError(f"{table} row {number} is not an object")
+        values = {}
+        for column, default in columns.items():
+            value = row.get(column, default)
+            # An explicit null takes the default too, e.g. "rating": null -> 0.00
+            if value is None and default is not _REQUIRED:
+                value = default
+            if value is _REQUIRED or (value is None and default is _REQUIRED):
+                raise ValueError(f"{table} row {number} is missing {column!r}")
+            values[column] = value
+        yield values
+
+
+def _bulk_insert(table, rows, page_size=None):
+    """
+    Insert ``rows`` into ``table`` in one transaction.
+
+    Rows that hit a unique constraint (e.g. a mentor's email) are skipped,
+    so re-running an import is safe. Returns the number of rows inserted.
+    """
+    columns = list(_BULK_COLUMNS[table])
+    statement = sql.SQL("INSERT INTO {} ({}) VALUES %s ON CONFLICT DO NOTHING").format(
+        sql.Identifier(table),
+        sql.SQL(", ").join(sql.Identifier(column) for column in columns),
+    )
+    template = "(" + ", ".join(f"%({column})s" for column in columns) + ")"
+    page_size = page_size or QUERY_CONFIG["bulk_page_size"]
+
+    inserted = 0
+    pending = _bulk_rows(table, rows)
+    with get_db_connection() as conn:
+        with conn.cursor() as cursor:
+            query = statement.as_string(cursor)
+            while True:
+                page = list(itertools.islice(pending, page_size))
+                if not page:
+                    break
+                execute_values(cursor, query, page, template=template, page_size=page_size)
+                inserted += cursor.rowcount
+        conn.commit()
+
+    if inserted:
+        invalidate_table(table)
+    return inserted
+
+
+def bulk_insert_jobs(rows, page_size=None):
+    """Insert many job postings in one transaction; returns the number inserted"""
+    try:
+        return _bulk_insert("jobs", rows, page_size)
+    except Exception as e:
+        print(f"Error bulk inserting jobs: {e}")
+        return None
+
+def bulk_insert_courses(rows, page_size=None):
+    """Insert many courses in one transaction; returns the number inserted"""
+    try:
+        return _bulk_insert("courses", rows, page_size)
+    except Exception as e:
+        print(f"Error bulk inserting courses: {e}")
+        return None
+
+def bulk_insert_success_stories(rows, page_size=None):
+    """Insert many success stories in one transaction; returns the number inserted"""
+    try:
+        return _bulk_insert("success_stories", rows, page_size)
+    except Exception as e:
+        print(f"Error bulk inserting success stories: {e}")
+        return None
+
+def bulk_insert_mentors(rows, page_size=None):
+    """Insert many mentors in one transaction, skipping known emails; returns the number inserted"""
+    try:
+        return _bulk_insert("mentors", rows, page_size)
+    except Exception as e:
+        print(f"Error bulk inserting mentors: {e}")
+        return None
+
+def bulk_insert_legal_rights(rows, page_size=None):
+    """Insert many legal rights entries in one transaction; returns the number inserted"""
+    try:
+        return _bulk_insert("legal_rights", rows, page_size)
+    except Exception as e:
+        print(f"Error bulk inserting legal rights: {e}")
+        return None
+
+# Catalog file stem -> bulk loader, for `python init_database.py load`
+BULK_LOADERS = {
+    "jobs": bulk_insert_jobs,
+    "courses": bulk_insert_courses,
+    "success_stories": bulk_insert_success_stories,
+    "mentors": bulk_insert_mentors,
+    "legal_rights": bulk_insert_legal_rights,
+}
+
+# ==================== STREAMING READS ====================
+# Generator variants of the list helpers for exports and background jobs.
+# Rows come in id order from a server-side cursor, ``itersize`` per round
+# trip, so memory stays flat however large the table is.
+
+def _stream_table(table, conditions=(), params=(), columns=None, itersize=None, timeout_ms=None):
+    statement = sql.SQL("SELECT {columns} FROM {table} {where} ORDER BY id").format(
+        columns=columns if columns is not None else _select_list(table),
+        table=sql.Identifier(table),
+        where=sql.SQL("WHERE ") + sql.SQL(" AND ").join(conditions) if conditions else sql.SQL(""),
+    )
+    return _stream_rows(statement, list(params), itersize=itersize, timeout_ms=timeout_ms)
+
+def iter_all_jobs(itersize=None, timeout_ms=None):
+    """Stream every active job"""
+    yield from _stream_table("jobs", [sql.SQL("is_active = TRUE")], itersize=itersize, timeout_ms=timeout_ms)
+
+def iter_all_courses(category=None, itersize=None, timeout_ms=None):
+    """Stream every course, optionally filtered by category"""
+    yield from _stream_table(
+        "courses",
+        [sql.SQL("category = %s")] if category else [],
+        [category] if category else [],
+        itersize=itersize, timeout_ms=timeout_ms
+    )
+
+def iter_success_stories(itersize=None, timeout_ms=None):
+    """Stream every approved success story"""
+    yield from _stream_table(
+        "success_stories", [sql.SQL("is_approved = TRUE")], itersize=itersize, timeout_ms=timeout_ms
+    )
+
+def iter_mentors(expertise=None, itersize=None, timeout_ms=None):
+    """Stream every mentor, optionally filtered by expertise"""
+    yield from _stream_table(
+        "mentors",
+        [sql.SQL("expertise ILIKE %s")] if expertise else [],
+        [f"%{expertise}%"] if expertise else [],
+        itersize=itersize, timeout_ms=timeout_ms
+    )
+
+def iter_community_posts(category=None, itersize=None, timeout_ms=None):
+    """Stream every community post, optionally filtered by category"""
+    yield from _stream_table(
+        "community_posts",
+        [sql.SQL("category = %s")] if category else [],
+        [category] if category else [],
+        columns=sql.SQL("*, 'Anonymous' as author_name"),
+        itersize=itersize, timeout_ms=timeout_ms
+    )
+
+def iter_legal_rights(category=None, itersize=None, timeout_ms=None):
+    """Stream all legal rights information, optionally filtered by category"""
+    yield from _stream_table(
+        "legal_rights",
+        [sql.SQL("category = %s")] if category else [],
+        [category] if category else [],
+        itersize=itersize, timeout_ms=timeout_ms
+    )
+
+# Streaming readers by table name, for the export command in init_database.py
+STREAMING_READERS = {
+    "jobs": iter_all_jobs,
+    "courses": iter_all_courses,
+    "success_stories": iter_success_stories,
+    "mentors": iter_mentors,
+    "community_posts": iter_community_posts,
+    "legal_rights": iter_legal_rights,
+}
 
 # Cache database queries for better performance
-@st.cache_data(ttl=300)  # Cache for 5 minutes
-def get_jobs_cached():
-    return get_all_jobs()
+# Page reads use the shorter page_read_timeout so a slow query can't pin a script thread.
+# The leading ``version`` argument is the table's cache version (see invalidate_table).
+# They cache card projections (see CARD_PROJECTIONS), not full rows.
+
+@st.cache_data(ttl=CACHE_CONFIG["ttl"], max_entries=CACHE_CONFIG["max_entries"])
+def _jobs_cached(version, cursor, page_size):
+    return get_all_jobs(cursor, page_size, card=True, timeout_ms=QUERY_CONFIG["page_read_timeout"])
+
+@st.cache_data(ttl=CACHE_CONFIG["ttl"], max_entries=CACHE_CONFIG["max_entries"])
+def _courses_cached(version, category, cursor, page_size):
+    return get_all_courses(category, cursor, page_size, card=True, timeout_ms=QUERY_CONFIG["page_read_timeout"])
+
+@st.cache_data(ttl=CACHE_CONFIG["ttl"], max_entries=CACHE_CONFIG["max_entries"])
+def _stories_cached(version, cursor, page_size):
+    return get_success_stories(cursor, page_size, card=True, timeout_ms=QUERY_CONFIG["page_read_timeout"])
+
+@st.cache_data(ttl=CACHE_CONFIG["ttl"], max_entries=CACHE_CONFIG["max_entries"])
+def _mentors_cached(version, expertise, cursor, page_size):
+    return get_mentors(expertise, cursor, page_size, card=True, timeout_ms=QUERY_CONFIG["page_read_timeout"])
+
+@st.cache_data(ttl=CACHE_CONFIG["ttl"], max_entries=CACHE_CONFIG["max_entries"])
+def _jobs_search_cached(version, query, job_type, location, cursor, page_size):
+    return search_jobs(query, job_type, location, cursor, page_size, card=True, timeout_ms=QUERY_CONFIG["page_read_timeout"])
+
+@st.cache_data(ttl=CACHE_CONFIG["ttl"], max_entries=CACHE_CONFIG["max_entries"])
+def _stories_search_cached(version, query, category, cursor, page_size):
+    return search_stories(query, category, cursor, page_size, card=True, timeout_ms=QUERY_CONFIG["page_read_timeout"])
+
+_register_table_cache("jobs", _jobs_cached)
+_register_table_cache("jobs", _jobs_search_cached)
+_register_table_cache("success_stories", _stories_search_cached)
+
+@st.cache_data(ttl=CACHE_CONFIG["ttl"], max_entries=CACHE_CONFIG["max_entries"])
+def _mentors_search_cached(version, term, limit):
+    return search_mentors(term, limit, card=True, timeout_ms=QUERY_CONFIG["page_read_timeout"])
+
+_register_table_cache("mentors", _mentors_search_cached)
+_register_table_cache("courses", _courses_cached)
+_register_table_cache("success_stories", _stories_cached)
+_register_table_cache("mentors", _mentors_cached)
+
+def get_jobs_cached(cursor=None, page_size=None):
+    return _jobs_cached(_cache_version("jobs"), cursor, page_size)
+
+def get_courses_cached(category=None, cursor=None, page_size=None):
+    return _courses_cached(_cache_version("courses"), category, cursor, page_size)
+
+def get_stories_cached(cursor=None, page_size=None):
+    return _stories_cached(_cache_version("success_stories"), cursor, page_size)
+
+def get_mentors_cached(expertise=None, cursor=None, page_size=None):
+    return _mentors_cached(_cache_version("mentors"), expertise, cursor, page_size)
+
+def search_jobs_cached(query=None, job_type=None, location=None, cursor=None, page_size=None):
+    return _jobs_search_cached(_cache_version("jobs"), query, job_type, location, cursor, page_size)
+
+def search_stories_cached(query=None, category=None, cursor=None, page_size=None):
+    return _stories_search_cached(_cache_version("success_stories"), query, category, cursor, page_size)
+
+def search_mentors_cached(term, limit=None):
+    return _mentors_search_cached(_cache_version("mentors"), term, limit)
+
+
+# ==================== IMPACT METRICS ====================
+# Site-wide counts live in the impact_metrics materialized view, so a render
+# costs one cached primary-key lookup instead of a COUNT(*) per table. Each
+# process runs a refresher thread; replicas coordinate through an advisory
+# lock and the view's refreshed_at, so the counts are recomputed about once
+# per refresh_interval however many replicas there are.
+
+def refresh_impact_metrics(min_age=0):
+    """
+    Recompute the impact_metrics view without blocking readers.
+
+    Returns True once refreshed, False when skipped because another process
+    is refreshing it right now or it was refreshed less than ``min_age``
+    seconds ago, and None on error.
+    """
+    try:
+        with get_db_connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT pg_try_advisory_xact_lock(%s)", (METRICS_CONFIG["lock_key"],))
+                if not cursor.fetchone()[0]:
+                    return False
+                if min_age:
+                    cursor.execute(
+                        "SELECT refreshed_at > now() - make_interval(secs => %s) FROM impact_metrics WHERE id = 1",
+                        (min_age,)
+                    )
+                    fresh = cursor.fetchone()
+                    if fresh and fresh[0]:
+                        return False
+                cursor.execute("REFRESH MATERIALIZED VIEW CONCURRENTLY impact_metrics")
+            conn.commit()
+        return True
+    except Exception as e:
+        print(f"Error refreshing impact metrics: {e}")
+        return None
+
+
+class _MetricsRefresher(threading.Thread):
+    """Background thread calling refresh_impact_metrics every ``interval`` seconds"""
+
+    def __init__(self, interval):
+        super().__init__(name="impact-metrics-refresher", daemon=True)
+        self.interval = interval
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            refresh_impact_metrics(min_age=self.interval)
+
+    def stop(self):
+        self._stop_event.set()
+
+
+_metrics_refresher = None
+_metrics_refresher_lock = threading.Lock()
+
+
+def start_metrics_refresher():
+    """Start this process's impact-metrics refresher once, if enabled"""
+    global _metrics_refresher
+    if not METRICS_CONFIG["refresh_in_app"] or _metrics_refresher is not None:
+        return _metrics_refresher
+
+    with _metrics_refresher_lock:
+        if _metrics_refresher is None:
+            _metrics_refresher = _MetricsRefresher(METRICS_CONFIG["refresh_interval"])
+            _metrics_refresher.start()
+            atexit.register(_metrics_refresher.stop)
+    return _metrics_refresher
+
+
+def get_impact_metrics(timeout_ms=None):
+    """Live impact numbers from the materialized view, or None if unavailable"""
+    try:
+        rows = _fetch_records(
+            """
+            SELECT women_helped, jobs_posted, courses_available, mentors_active, success_stories,
+                   community_members, monthly_growth, refreshed_at
+            FROM impact_metrics WHERE id = 1
+            """,
+            timeout_ms=timeout_ms
+        )
+    except Exception as e:
+        print(f"Error fetching impact metrics: {e}")
+        return None
+    return rows[0]._asdict() if rows else None
+
+
+_metrics_unavailable_until = 0.0  # monotonic; fallback served without a read until then
+
+
+@st.cache_data(ttl=METRICS_CONFIG["refresh_interval"], max_entries=1)
+def _impact_metrics_cached():
+    return get_impact_metrics(timeout_ms=QUERY_CONFIG["page_read_timeout"])
+
+
+def get_impact_metrics_cached():
+    """
+    Impact numbers for the home page and sidebar, shared by every session.
+
+    Falls back to config.settings.IMPACT_METRICS when the view can't be
+    read, and keeps serving it for METRICS_CONFIG["retry_after"] seconds
+    without touching the database. Live numbers never go below those
+    figures, and keys the view doesn't compute (satisfaction_rate) always
+    come from there.
+    """
+    global _metrics_unavailable_until
+    if time.monotonic() < _metrics_unavailable_until:
+        return dict(IMPACT_METRICS)
+
+    start_metrics_refresher()
+    live = _impact_metrics_cached()
+    if live is None:
+        # Serve the fallback for a short while rather than making every
+        # render wait on the database again, or for a whole TTL once it's back
+        _impact_metrics_cached.clear()
+        _metrics_unavailable_until = time.monotonic() + METRICS_CONFIG["retry_after"]
+        return dict(IMPACT_METRICS)
+    return {
+        **IMPACT_METRICS,
+        **{key: max(value, IMPACT_METRICS[key]) if key in IMPACT_METRICS and value is not None else value
+           for key, value in live.items()},
+    }
+
+
+# ==================== COMMUNITY LIKES ====================
+# Likes go through a write-behind buffer (utils/write_behind.py): clicks are
+# coalesced per post in memory and written every LIKES_CONFIG["flush_interval"]
+# seconds by one UPDATE, so a viral post doesn't serialize every click on
+# its row lock. A crash loses at most one interval of likes; a clean exit
+# flushes the rest.
+
+def _flush_post_likes(deltas):
+    """Apply {post_id: delta} to community_posts.likes in one statement"""
+    with get_db_connection() as conn:
+        with conn.cursor() as cursor:
+            # Ascending ids, so replicas flushing overlapping posts lock rows in the same order
+            execute_values(
+                cursor,
+                """
+                UPDATE community_posts AS p SET likes = COALESCE(p.likes, 0) + v.delta
+                FROM (VALUES %s) AS v(id, delta)
+                WHERE p.id = v.id
+                """,
+                sorted(deltas.items()),
+                template="(%s::integer, %s::integer)",
+                page_size=len(deltas)
+            )
+        conn.commit()
+    invalidate_table("community_posts")
+
+
+_post_likes = None
+_post_likes_lock = threading.Lock()
+
+
+def _get_post_likes_buffer():
+    """This process's likes buffer, started on first use"""
+    global _post_likes
+    if _post_likes is None:
+        with _post_likes_lock:
+            if _post_likes is None:
+                _post_likes = CounterBuffer(
+                    _flush_post_likes,
+                    interval=LIKES_CONFIG["flush_interval"],
+                    max_pending=LIKES_CONFIG["max_pending"],
+                    name="post-likes",
+                )
+                _post_likes.start()
+                atexit.register(_post_likes.stop)
+    return _post_likes
+
+
+def increment_post_likes(post_id, delta=1):
+    """
+    Like a community post.
+
+    Returns immediately; the like reaches the database with the next flush.
+    Use get_pending_post_likes to show it before then.
+    """
+    return _get_post_likes_buffer().add(post_id, delta)
 
-@st.cache_data(ttl=300)
-def get_courses_cached():
-    return get_all_courses()
 
-@st.cache_data(ttl=300)
-def get_stories_cached():
-    return get_success_stories()
+def get_pending_post_likes(post_id):
+    """Likes this process has recorded for a post but not written yet"""
+    return _post_likes.pending(post_id) if _post_likes is not None else 0
+
+
+def flush_post_likes():
+    """Write buffered likes now; returns how many posts were updated"""
+    return _post_likes.flush() if _post_likes is not None else 0
+
+
+# ==================== SEARCH INDEXES ====================
+# One SearchIndex per table, built from every row of the table and tagged
+# with the table version it was built at. Rows inserted by this
+# process are added to the index in place; any other change (or a missed
+# insert) leaves the tag behind the table version and the next search
+# rebuilds it.
+
+_search_indexes = {}
+_search_indexes_lock = threading.Lock()
+_search_index_build_locks = {}
+
+
+def _new_search_index(table):
+    return SearchIndex(
+        SEARCH_CONFIG["fields"][table],
+        k1=SEARCH_CONFIG["k1"],
+        b=SEARCH_CONFIG["b"],
+        max_expansions=SEARCH_CONFIG["max_prefix_expansions"],
+    )
+
+
+def _get_search_index(table, load_rows):
+    version = _cache_version(table)
+    entry = _search_indexes.get(table)
+    if entry is not None and entry[0] == version:
+        return entry[1]
+
+    with _search_indexes_lock:
+        build_lock = _search_index_build_locks.setdefault(table, threading.Lock())
+
+    # One rebuild per table at a time; sessions that queued behind it reuse
+    # the index it built instead of each loading every row again
+    with build_lock:
+        version = _cache_version(table)
+        entry = _search_indexes.get(table)
+        if entry is not None and entry[0] == version:
+            return entry[1]
+
+        index = _new_search_index(table)
+        index.add_many(load_rows())
+        with _search_indexes_lock:
+            _search_indexes[table] = (version, index)
+    return index
+
+
+def _index_inserted_row(table, row_id, previous_version, new_version):
+    """Add a row this process just inserted to an index that was current"""
+    entry = _search_indexes.get(table)
+    if entry is None or entry[0] != previous_version or new_version != previous_version + 1:
+        return
+
+    try:
+        rows = _fetch_records(
+            sql.SQL("SELECT {} FROM {} WHERE id = %s").format(_select_list(table), sql.Identifier(table)),
+            (row_id,)
+        )
+    except Exception as e:
+        print(f"Error indexing new {table} row: {e}")
+        return
+
+    with _search_indexes_lock:
+        if _search_indexes.get(table) is entry and rows:
+            entry[1].add(rows[0], at_front=True)
+            _search_indexes[table] = (new_version, entry[1])
+
+
+def _load_all_rows(table, sort_column):
+    """
+    Every row of a table for an index build, or an exception.
+
+    Pages through _keyset_page itself rather than the list helper, which
+    turns errors into an empty page: a build must not cache a partial
+    index under the current table version.
+    """
+    try:
+        return list(_iter_pages(
+            functools.partial(_keyset_page, table, sql.Identifier(sort_column), "timestamp"),
+            timeout_ms=QUERY_CONFIG["page_read_timeout"]
+        ))
+    except QueryTimeoutError:
+        raise
+    except Exception as e:
+        raise DatabaseError(f"Could not load {table} for search: {e}") from e
+
 
-@st.cache_data(ttl=300)
-def get_mentors_cached():
-    return get_mentors()
+def get_courses_index():
+    """SearchIndex over every course; raises QueryTimeoutError or DatabaseError"""
+    return _get_search_index("courses", lambda: _load_all_rows("courses", "created_at"))
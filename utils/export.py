@@ -0,0 +1,79 @@
+"""
+Export writers for streamed rows
+
+Both writers consume any iterable of row dicts (typically one of the
+iter_* generators in utils.database) one row at a time, so an export of
+millions of rows never holds more than a single row in memory.
+"""
+
+import csv
+import json
+from datetime import date, datetime
+from decimal import Decimal
+
+
+def _json_default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    return str(value)
+
+
+def _csv_value(value):
+    if value is None:
+        return ""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+def write_csv(rows, fileobj, columns=None):
+    """
+    Write rows as CSV with a header line.
+
+    Args:
+        rows: Iterable of dicts
+        fileobj: Text file opened with newline=""
+        columns: Column order; defaults to the keys of the first row
+
+    Returns:
+        Number of rows written
+    """
+    writer = None
+    count = 0
+    for row in rows:
+        if writer is None:
+            columns = list(columns or row.keys())
+            writer = csv.writer(fileobj)
+            writer.writerow(columns)
+        writer.writerow([_csv_value(row.get(column)) for column in columns])
+        count += 1
+
+    if writer is None and columns:
+        csv.writer(fileobj).writerow(columns)
+    return count
+
+
+def write_ndjson(rows, fileobj):
+    """
+    Write rows as newline-delimited JSON, one object per line.
+
+    Datetimes become ISO 8601 strings and decimals strings, so values
+    round-trip without losing precision.
+
+    Returns:
+        Number of rows written
+    """
+    count = 0
+    for row in rows:
+        fileobj.write(json.dumps(row, default=_json_default, ensure_ascii=False))
+        fileobj.write("\n")
+        count += 1
+    return count
+
+
+EXPORT_WRITERS = {
+    "csv": write_csv,
+    "ndjson": write_ndjson,
+}
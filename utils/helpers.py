@@ -1,50 +1,179 @@
 import streamlit as st
 from datetime import datetime, timedelta
 import os
+import json
 import time
-import google.generativeai as genai
+import threading
+from pathlib import Path
 from dotenv import load_dotenv
 import re
 
+from config.settings import API_CONFIG
+from utils.ai_cache import get_response_cache
+from utils.llm_gateway import get_llm_gateway, GatewayRejectedError
+from utils.llm_backends import FakeModel, RecordingModel, ReplayModel
+
 # Load environment variables (Reads your .env file)
 load_dotenv()
 
 # ==================== GEMINI AI CONFIGURATION ====================
-# 1. Get API Key securely
-gemini_api_key = os.getenv("GEMINI_API_KEY") or st.secrets.get("GEMINI_API_KEY")
-model = None
+# Model selection is lazy: importing this module never touches the network.
+# The first AI call (or the background warm-up below) picks a model, and the
+# choice is remembered on disk so later processes skip the probe entirely.
+
+_model = None
+_model_resolved = False
+_model_retry_at = 0.0  # After a failed selection, don't try again before this (monotonic)
+_model_lock = threading.Lock()
+
 
-if gemini_api_key:
+def _get_api_key():
+    """Get API Key securely (.env first, then Streamlit secrets)"""
+    api_key = os.getenv("GEMINI_API_KEY")
+    if api_key:
+        return api_key
     try:
-        genai.configure(api_key=gemini_api_key)
-        
-        # ⚡ USE STANDARD STABLE MODELS (Dec 2025 Safe List)
-        # We try the most likely to work first
-        model_options = [
-            'gemini-2.5-flash',       # Most reliable (Free Tier Standard)
-            'gemini-2.5-pro',         # Standard Pro
-            'gemini-pro',             # Legacy Stable
-            'gemini-2.5-flash-exp'     # New lightweight
-        ]
-        
-        for m in model_options:
+        return st.secrets.get("GEMINI_API_KEY")
+    except Exception:
+        # No secrets.toml at all
+        return None
+
+
+def _model_cache_path():
+    return Path(API_CONFIG["gemini_model_cache_file"])
+
+
+def _read_cached_model_name():
+    """Return the remembered model name if it is still within its TTL"""
+    try:
+        cached = json.loads(_model_cache_path().read_text())
+    except (OSError, ValueError):
+        return None
+
+    if time.time() - cached.get("checked_at", 0) > API_CONFIG["gemini_model_cache_ttl"]:
+        return None
+    if cached.get("model") not in API_CONFIG["gemini_models"]:
+        return None
+    return cached["model"]
+
+
+def _write_cached_model_name(model_name):
+    try:
+        _model_cache_path().write_text(json.dumps({"model": model_name, "checked_at": time.time()}))
+    except OSError as e:
+        print(f"⚠️ Could not cache model choice: {e}")
+
+
+def _resolve_live_model():
+    """Configure Gemini and pick the first model that answers"""
+    api_key = _get_api_key()
+    if not api_key:
+        print("⚠️ Key Missing: GEMINI_API_KEY")
+        return None
+
+    try:
+        # Imported here: the SDK alone adds noticeably to cold start
+        import google.generativeai as genai
+        genai.configure(api_key=api_key)
+
+        cached_name = _read_cached_model_name()
+        if cached_name:
+            print(f"✅ USING CACHED MODEL: {cached_name}")
+            return genai.GenerativeModel(cached_name)
+
+        for m in API_CONFIG["gemini_models"]:
             try:
                 test_model = genai.GenerativeModel(m)
-                test_model.generate_content("Hi") # Test Pulse
-                model = test_model
+                test_model.generate_content("Hi", request_options={"timeout": API_CONFIG["request_timeout"]}) # Test Pulse
                 print(f"✅ CONNECTED TO: {m}")
-                break
+                _write_cached_model_name(m)
+                return test_model
             except Exception as e:
                 print(f"⚠️ {m} failed: {e}")
                 continue
 
-        if not model:
-            print("❌ CRITICAL: No working Gemini models found. Check Google AI Studio for valid model names.")
-            
+        print("❌ CRITICAL: No working Gemini models found. Check Google AI Studio for valid model names.")
     except Exception as e:
         print(f"❌ Connection Error: {e}")
-else:
-    print("⚠️ Key Missing: GEMINI_API_KEY")
+    return None
+
+
+def _resolve_model():
+    """Build the model for API_CONFIG["llm_backend"]"""
+    backend = API_CONFIG["llm_backend"]
+    fake = FakeModel(
+        latency_ms=API_CONFIG["llm_fake_latency_ms"],
+        chunk_delay_ms=API_CONFIG["llm_fake_chunk_delay_ms"],
+    )
+
+    if backend == "fake":
+        print("🧪 USING FAKE MODEL BACKEND")
+        return fake
+    if backend == "replay":
+        replay = ReplayModel(API_CONFIG["llm_cassette"], fallback=fake)
+        print(f"📼 REPLAYING {len(replay)} responses from {API_CONFIG['llm_cassette']}")
+        return replay
+
+    model = _resolve_live_model()
+    if model is not None and backend == "record":
+        print(f"⏺️ RECORDING responses to {API_CONFIG['llm_cassette']}")
+        return RecordingModel(model, API_CONFIG["llm_cassette"])
+    return model
+
+
+def get_model():
+    """
+    Return the Gemini model, selecting it on first use.
+
+    Concurrent first callers wait for a single selection instead of each
+    probing. Returns None when no key is configured or no model works; a
+    failed selection is retried after gemini_model_retry_after seconds, so
+    a network blip at boot doesn't leave the app in demo mode for good.
+    """
+    global _model, _model_resolved, _model_retry_at
+    if not _model_resolved and time.monotonic() >= _model_retry_at:
+        with _model_lock:
+            if not _model_resolved and time.monotonic() >= _model_retry_at:
+                _model = _resolve_model()
+                if _model is not None:
+                    _model_resolved = True
+                else:
+                    _model_retry_at = time.monotonic() + API_CONFIG["gemini_model_retry_after"]
+    return _model
+
+
+def reset_model():
+    """Forget the selected model (in memory and on disk) so the next call re-probes"""
+    global _model, _model_resolved, _model_retry_at
+    with _model_lock:
+        _model = None
+        _model_resolved = False
+        _model_retry_at = 0.0
+        try:
+            _model_cache_path().unlink()
+        except OSError:
+            pass
+
+
+def warm_up_model():
+    """Select the model in a background thread so the first AI request doesn't pay for it"""
+    thread = threading.Thread(target=get_model, name="gemini-warm-up", daemon=True)
+    thread.start()
+    return thread
+
+
+def _probe_model():
+    """Half-open probe for the gateway's circuit breaker; raises if Gemini is still down"""
+    model = get_model()
+    if not model:
+        raise RuntimeError("No Gemini model configured")
+    model.generate_content("Hi", request_options={"timeout": API_CONFIG["request_timeout"]})
+
+
+get_llm_gateway().breaker.probe = _probe_model
+
+if API_CONFIG["gemini_warm_up"]:
+    warm_up_model()
 
 
 # ==================== DATE & TIME UTILS ====================
@@ -138,43 +267,132 @@ def show_info_message(message):
 
 # ==================== AI FUNCTIONS (GEMINI POWERED) ====================
 
+DEMO_CHAT_RESPONSE = (
+    "💡 **Demo Mode (AI Unavailable):**\n\n"
+    "**Health:** Eat iron-rich foods & exercise 30 mins daily.\n"
+    "**Career:** Update LinkedIn & learn new skills.\n"
+    "**Mental:** Practice deep breathing & talk to friends.\n\n"
+    "*(Please check your .env file to ensure GEMINI_API_KEY is correct)*"
+)
+
+
+DEMO_JOB_RECOMMENDATION = "1. Frontend Developer (Match)\n2. Data Analyst (Analytics)\n3. Product Manager (Strategy) - [Demo Data]"
+
+DEMO_COURSE_RECOMMENDATION = "1. Python (Udemy)\n2. Web Dev (freeCodeCamp)\n3. Data Science (Coursera) - [Demo Data]"
+
+
+def _generate(model, prompt, **kwargs):
+    """Send one request through the process-wide LLM gateway"""
+    return get_llm_gateway().call(
+        model.generate_content,
+        prompt,
+        request_options={"timeout": API_CONFIG["request_timeout"]},
+        **kwargs
+    )
+
+
+def _chat_prompt(user_message, context):
+    return f"""
+        Role: Helpful, Empathetic Assistant for a Women Empowerment Platform.
+        Context: {context}
+        User Question: {user_message}
+        
+        Instructions: Answer in 2-3 short, helpful sentences. Be encouraging.
+        """
+
+
+def _ai_busy_message(error):
+    return f"🤖 **AI Busy:** I'm currently unavailable. Please try again in a moment.\n(Error: {str(error)[:50]})"
+
+
 def chatbot_response(user_message, context="women empowerment"):
     """Get AI-powered chatbot response"""
     
+    # 0. Identical questions in the same context are answered from cache
+    cache = get_response_cache()
+    cached = cache.get(context, user_message)
+    if cached is not None:
+        return cached
+    
+    model = get_model()
+    
     # 1. Fallback if API Key is missing or invalid
     if not model:
-        return (
-            "💡 **Demo Mode (AI Unavailable):**\n\n"
-            "**Health:** Eat iron-rich foods & exercise 30 mins daily.\n"
-            "**Career:** Update LinkedIn & learn new skills.\n"
-            "**Mental:** Practice deep breathing & talk to friends.\n\n"
-            "*(Please check your .env file to ensure GEMINI_API_KEY is correct)*"
-        )
+        return DEMO_CHAT_RESPONSE
     
     # 2. Try to get real AI response
     try:
-        prompt = f"""
-        Role: Helpful, Empathetic Assistant for a Women Empowerment Platform.
-        Context: {context}
-        User Question: {user_message}
-        
-        Instructions: Answer in 2-3 short, helpful sentences. Be encouraging.
-        """
-        response = model.generate_content(prompt)
-        return response.text.strip()
+        response = _generate(model, _chat_prompt(user_message, context))
+        answer = response.text.strip()
+        cache.set(context, user_message, answer)
+        return answer
         
+    except GatewayRejectedError:
+        # Over quota or overloaded: shed to demo text instead of queueing
+        return DEMO_CHAT_RESPONSE
     except Exception as e:
         # 3. Fallback if Internet/Quota fails
-        return f"🤖 **AI Busy:** I'm currently unavailable. Please try again in a moment.\n(Error: {str(e)[:50]})"
+        return _ai_busy_message(e)
+
+
+def chatbot_response_stream(user_message, context="women empowerment"):
+    """
+    Streaming variant of chatbot_response: yields the answer in chunks as
+    Gemini produces them (for st.write_stream).
+
+    Cached answers and the demo/busy fallbacks are yielded as one chunk.
+    If streaming fails before anything was sent, the non-streaming call is
+    tried once instead.
+    """
+    cache = get_response_cache()
+    cached = cache.get(context, user_message)
+    if cached is not None:
+        yield cached
+        return
+    
+    model = get_model()
+    if not model:
+        yield DEMO_CHAT_RESPONSE
+        return
+    
+    parts = []
+    try:
+        # The gateway slot is held for as long as the stream is being read
+        with get_llm_gateway().reserve():
+            stream = model.generate_content(
+                _chat_prompt(user_message, context),
+                stream=True,
+                request_options={"timeout": API_CONFIG["request_timeout"]}
+            )
+            for chunk in stream:
+                try:
+                    text = chunk.text
+                except ValueError:
+                    # Chunk without text parts (e.g. safety metadata only)
+                    continue
+                if text:
+                    parts.append(text)
+                    yield text
+    except GatewayRejectedError:
+        yield DEMO_CHAT_RESPONSE
+        return
+    except Exception as e:
+        if not parts:
+            yield chatbot_response(user_message, context)
+        else:
+            yield f"\n\n*(Response interrupted: {str(e)[:50]})*"
+        return
+    
+    answer = "".join(parts).strip()
+    if answer:
+        cache.set(context, user_message, answer)
+    else:
+        yield chatbot_response(user_message, context)
 
 
 def generate_job_recommendation(user_skills, user_experience):
     """Generate job recommendations"""
-    if not model:
-        return "1. Frontend Developer (Match)\n2. Data Analyst (Analytics)\n3. Product Manager (Strategy) - [Demo Data]"
-    
-    try:
-        prompt = f"""
+    prompt = f"""
         Suggest 3 job roles for:
         Skills: {user_skills}
         Experience: {user_experience}
@@ -182,19 +400,29 @@ def generate_job_recommendation(user_skills, user_experience):
         Format:
         1. [Job Title] - [One sentence reason]
         """
-        response = model.generate_content(prompt)
-        return response.text.strip()
+    cache = get_response_cache()
+    cached = cache.get("Job Recommendation", prompt)
+    if cached is not None:
+        return cached
+    
+    model = get_model()
+    if not model:
+        return DEMO_JOB_RECOMMENDATION
+    
+    try:
+        response = _generate(model, prompt)
+        answer = response.text.strip()
+        cache.set("Job Recommendation", prompt, answer)
+        return answer
+    except GatewayRejectedError:
+        return DEMO_JOB_RECOMMENDATION
     except Exception:
         return "1. Frontend Developer\n2. Data Analyst\n3. Product Manager (Fallback Data)"
 
 
 def generate_course_recommendation(interests, current_level):
     """Generate course recommendations"""
-    if not model:
-        return "1. Python (Udemy)\n2. Web Dev (freeCodeCamp)\n3. Data Science (Coursera) - [Demo Data]"
-    
-    try:
-        prompt = f"""
+    prompt = f"""
         Suggest 3 courses for:
         Interests: {interests}
         Level: {current_level}
@@ -202,8 +430,22 @@ def generate_course_recommendation(interests, current_level):
         Format:
         1. [Course Name] ([Platform]) - [Why good]
         """
-        response = model.generate_content(prompt)
-        return response.text.strip()
+    cache = get_response_cache()
+    cached = cache.get("Course Recommendation", prompt)
+    if cached is not None:
+        return cached
+    
+    model = get_model()
+    if not model:
+        return DEMO_COURSE_RECOMMENDATION
+    
+    try:
+        response = _generate(model, prompt)
+        answer = response.text.strip()
+        cache.set("Course Recommendation", prompt, answer)
+        return answer
+    except GatewayRejectedError:
+        return DEMO_COURSE_RECOMMENDATION
     except Exception:
         return "1. Python (Udemy)\n2. Web Dev (freeCodeCamp)\n3. Data Science (Coursera) (Fallback Data)"
 
@@ -234,6 +476,36 @@ def paginate(items, page=1, items_per_page=10):
     return items[start:end], len(items)
 
 
+def fetch_pages(state_key, fetch_page, **kwargs):
+    """
+    Rows of every page loaded so far from a cursor-paginated helper
+    
+    The cursors of loaded pages live in st.session_state[state_key] and are
+    reset whenever ``kwargs`` (the search/filter arguments) change.
+    
+    Returns:
+        (rows, next_cursor) - next_cursor is None when nothing is left
+    """
+    signature = repr(sorted(kwargs.items()))
+    state = st.session_state.get(state_key)
+    if state is None or state["signature"] != signature:
+        state = {"signature": signature, "cursors": [None]}
+        st.session_state[state_key] = state
+    
+    rows, next_cursor = [], None
+    for cursor in state["cursors"]:
+        page, next_cursor = fetch_page(cursor=cursor, **kwargs)
+        rows.extend(page)
+    return rows, next_cursor
+
+
+def load_more_button(state_key, next_cursor, label="⬇️ Load more"):
+    """Show a button that loads the next page for fetch_pages(state_key, ...)"""
+    if next_cursor and st.button(label, key=f"{state_key}_load_more", use_container_width=True):
+        st.session_state[state_key]["cursors"].append(next_cursor)
+        st.rerun()
+
+
 def get_sample_data_if_none(data, sample_data):
     """Return sample data if database is empty"""
     if data and len(data) > 0:
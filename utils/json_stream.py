@@ -0,0 +1,115 @@
+"""
+Streaming JSON reader for catalog imports
+
+Yields the items of a top-level JSON array (or of newline-delimited /
+concatenated JSON values) one at a time, reading the file in chunks, so a
+multi-GB catalog never has to fit in memory: only the item being decoded
+and one chunk of look-ahead are held at once. Empty files yield nothing.
+"""
+
+import json
+
+_WHITESPACE = " \t\r\n"
+
+
+class _Buffer:
+    """Text read so far that has not been decoded yet"""
+
+    def __init__(self, fileobj, chunk_size):
+        self.fileobj = fileobj
+        self.chunk_size = chunk_size
+        self.text = ""
+        self.pos = 0
+        self.consumed = 0  # Characters dropped from the front, for error offsets
+        self.eof = False
+
+    def fill(self):
+        """Read more text; grows geometrically so a huge item is decoded in O(n)"""
+        if self.eof:
+            return False
+        if self.pos:
+            self.consumed += self.pos
+            self.text = self.text[self.pos:]
+            self.pos = 0
+        chunk = self.fileobj.read(max(self.chunk_size, len(self.text)))
+        if not chunk:
+            self.eof = True
+            return False
+        self.text += chunk
+        return True
+
+    def peek(self, skip=_WHITESPACE):
+        """Next character that is not in ``skip`` (None at end of input)"""
+        while True:
+            while self.pos < len(self.text) and self.text[self.pos] in skip:
+                self.pos += 1
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+            if not self.fill():
+                return None
+
+    def error(self, message):
+        return ValueError(f"{message} at character {self.consumed + self.pos}")
+
+
+def iter_json_items(fileobj, chunk_size=1 << 16):
+    """
+    Yield each item of a JSON array, or each value of an NDJSON stream.
+
+    Args:
+        fileobj: Text file object
+        chunk_size: Characters read per call to ``fileobj.read``
+
+    Raises:
+        ValueError: If the input is not valid JSON
+    """
+    decoder = json.JSONDecoder()
+    buffer = _Buffer(fileobj, chunk_size)
+
+    first = buffer.peek()
+    if first is None:
+        return
+    in_array = first == "["
+    if in_array:
+        buffer.pos += 1
+        if buffer.peek() == "]":
+            buffer.pos += 1
+            if buffer.peek() is not None:
+                raise buffer.error("Unexpected data after the top-level array")
+            return
+
+    while True:
+        if buffer.peek() is None:
+            if in_array:
+                raise buffer.error("Unterminated top-level array")
+            return
+
+        while True:
+            try:
+                item, end = decoder.raw_decode(buffer.text, buffer.pos)
+            except json.JSONDecodeError as e:
+                if buffer.fill():
+                    continue
+                raise buffer.error(f"Invalid JSON ({e.msg})") from e
+            # A number (or literal) ending exactly at the buffer's end may
+            # continue in the next chunk; decode it again with more text
+            if end == len(buffer.text) and buffer.fill():
+                continue
+            break
+        buffer.pos = end
+        yield item
+
+        if not in_array:
+            continue
+        separator = buffer.peek()
+        if separator == ",":
+            buffer.pos += 1
+        elif separator == "]":
+            buffer.pos += 1
+            if buffer.peek() is not None:
+                raise buffer.error("Unexpected data after the top-level array")
+            return
+        elif separator is None:
+            raise buffer.error("Unterminated top-level array")
+        else:
+            raise buffer.error("Expected ',' or ']' in the top-level array")
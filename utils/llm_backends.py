@@ -0,0 +1,226 @@
+"""
+Pluggable model backends for the AI helpers
+
+utils.helpers.get_model() returns one of these depending on
+API_CONFIG["llm_backend"] (env LLM_BACKEND):
+
+- "live":   the real Gemini model
+- "record": the real Gemini model, with every prompt/response pair appended
+            to a JSONL cassette
+- "replay": answers served from a cassette with the recorded latency;
+            prompts missing from it fall back to the fake backend
+- "fake":   deterministic template answers with configurable latency
+
+All backends expose the subset of google.generativeai.GenerativeModel the
+helpers use: generate_content(prompt, stream=False, **kwargs), returning an
+object with ``.text`` or, when streaming, an iterable of such chunks. That
+lets pages, benchmarks and load tests exercise the AI paths offline.
+"""
+
+import hashlib
+import json
+import re
+import threading
+import time
+from pathlib import Path
+
+_WHITESPACE = re.compile(r"\s+")
+_CONTEXT_LINE = re.compile(r"Context:\s*(.+)")
+
+
+def prompt_key(prompt):
+    """Whitespace-insensitive cassette key for a prompt"""
+    return _WHITESPACE.sub(" ", str(prompt)).strip()
+
+
+class TextResponse:
+    """Minimal stand-in for a GenerateContentResponse (or one streamed chunk)"""
+
+    __slots__ = ("text",)
+
+    def __init__(self, text):
+        self.text = text
+
+
+def _split_chunks(text, chunk_chars):
+    return [text[i:i + chunk_chars] for i in range(0, len(text), chunk_chars)] or [""]
+
+
+class FakeModel:
+    """
+    Deterministic offline model.
+
+    The same prompt always produces the same answer. Timing mimics a real
+    call: ``latency_ms`` before the first chunk, then ``chunk_delay_ms``
+    between streamed chunks of ``chunk_chars`` characters.
+    """
+
+    model_name = "fake"
+
+    TEMPLATES = [
+        ("valid json object", json.dumps({
+            "question": "Which Act covers sexual harassment at the workplace in India?",
+            "options": ["POSH Act, 2013", "Domestic Violence Act, 2005", "Factories Act, 1948", "IT Act, 2000"],
+            "answer_index": 0,
+        })),
+        ("suggest 3 job roles", "1. Frontend Developer - Builds on your current skills\n"
+                                "2. Data Analyst - Strong demand for analytical profiles\n"
+                                "3. Product Manager - Leverages your domain experience"),
+        ("suggest 3 courses", "1. Python for Everybody (Coursera) - Gentle, practical start\n"
+                              "2. Responsive Web Design (freeCodeCamp) - Free and project-based\n"
+                              "3. Google Data Analytics (Coursera) - Job-ready certificate"),
+        ("interview questions", "1. Tell me about a time you disagreed with a decision and how you handled it.\n"
+                                "2. Walk me through the most complex problem you solved recently.\n"
+                                "3. How do you prioritise when everything is urgent?"),
+    ]
+
+    DEFAULT_ANSWERS = [
+        "You're asking exactly the right question. Start with one small, concrete step today, "
+        "and lean on the community here for support as you go.",
+        "That's a really common challenge, and you're not alone in it. Break it into smaller goals, "
+        "celebrate progress, and reach out to a mentor for guidance.",
+        "Great thinking! Focus on what you can control, build the skill a little every day, "
+        "and remember that steady effort compounds quickly.",
+    ]
+
+    def __init__(self, latency_ms=0, chunk_delay_ms=0, chunk_chars=24, templates=None):
+        self.latency_ms = latency_ms
+        self.chunk_delay_ms = chunk_delay_ms
+        self.chunk_chars = chunk_chars
+        self.templates = templates if templates is not None else self.TEMPLATES
+
+    def answer_for(self, prompt):
+        lowered = str(prompt).lower()
+        for keyword, answer in self.templates:
+            if keyword in lowered:
+                return answer
+
+        digest = int(hashlib.sha256(prompt_key(prompt).encode("utf-8")).hexdigest(), 16)
+        answer = self.DEFAULT_ANSWERS[digest % len(self.DEFAULT_ANSWERS)]
+        context = _CONTEXT_LINE.search(str(prompt))
+        if context:
+            answer = f"({context.group(1).strip()}) {answer}"
+        return answer
+
+    def generate_content(self, prompt, stream=False, **kwargs):
+        text = self.answer_for(prompt)
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000.0)
+        if not stream:
+            return TextResponse(text)
+        return self._stream(text)
+
+    def _stream(self, text):
+        for idx, chunk in enumerate(_split_chunks(text, self.chunk_chars)):
+            if idx and self.chunk_delay_ms:
+                time.sleep(self.chunk_delay_ms / 1000.0)
+            yield TextResponse(chunk)
+
+
+class RecordingModel:
+    """Wrap a real model and append each exchange to a JSONL cassette"""
+
+    def __init__(self, inner, cassette_path):
+        self.inner = inner
+        self.cassette_path = Path(cassette_path)
+        self.model_name = getattr(inner, "model_name", "unknown")
+        self._lock = threading.Lock()
+
+    def _append(self, prompt, text, first_chunk_ms, total_ms, chunks=None):
+        record = {
+            "prompt": prompt_key(prompt),
+            "response": text,
+            "latency_ms": round(first_chunk_ms, 1),
+            "total_ms": round(total_ms, 1),
+            "model": self.model_name,
+            "recorded_at": time.time(),
+        }
+        if chunks is not None:
+            record["chunks"] = chunks
+        line = json.dumps(record, ensure_ascii=False)
+        with self._lock:
+            with self.cassette_path.open("a", encoding="utf-8") as f:
+                f.write(line + "\n")
+
+    def generate_content(self, prompt, stream=False, **kwargs):
+        start = time.perf_counter()
+        if not stream:
+            response = self.inner.generate_content(prompt, **kwargs)
+            elapsed = (time.perf_counter() - start) * 1000
+            self._append(prompt, response.text, elapsed, elapsed)
+            return response
+        return self._record_stream(prompt, start, self.inner.generate_content(prompt, stream=True, **kwargs))
+
+    def _record_stream(self, prompt, start, stream):
+        chunks = []
+        first_chunk_ms = None
+        for chunk in stream:
+            try:
+                text = chunk.text
+            except ValueError:
+                text = ""
+            if first_chunk_ms is None:
+                first_chunk_ms = (time.perf_counter() - start) * 1000
+            chunks.append(text)
+            yield chunk
+        total_ms = (time.perf_counter() - start) * 1000
+        self._append(prompt, "".join(chunks), first_chunk_ms or total_ms, total_ms, chunks=chunks)
+
+
+class ReplayModel:
+    """
+    Serve responses from a JSONL cassette.
+
+    Prompts that are not in the cassette go to ``fallback`` (a FakeModel by
+    default); with ``strict=True`` they raise KeyError instead. When
+    ``simulate_latency`` is set the recorded timings are replayed.
+    """
+
+    model_name = "replay"
+
+    def __init__(self, cassette_path, fallback=None, strict=False, simulate_latency=True):
+        self.cassette_path = Path(cassette_path)
+        self.fallback = fallback if fallback is not None else FakeModel()
+        self.strict = strict
+        self.simulate_latency = simulate_latency
+        self.hits = 0
+        self.misses = 0
+        self._records = {}
+        if self.cassette_path.exists():
+            with self.cassette_path.open(encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if line:
+                        record = json.loads(line)
+                        # Later recordings of the same prompt win
+                        self._records[record["prompt"]] = record
+
+    def __len__(self):
+        return len(self._records)
+
+    def generate_content(self, prompt, stream=False, **kwargs):
+        record = self._records.get(prompt_key(prompt))
+        if record is None:
+            self.misses += 1
+            if self.strict:
+                raise KeyError(f"Prompt not in cassette {self.cassette_path}")
+            return self.fallback.generate_content(prompt, stream=stream, **kwargs)
+
+        self.hits += 1
+        if self.simulate_latency:
+            time.sleep(record.get("latency_ms", 0) / 1000.0)
+        if not stream:
+            if self.simulate_latency:
+                time.sleep(max(record.get("total_ms", 0) - record.get("latency_ms", 0), 0) / 1000.0)
+            return TextResponse(record["response"])
+        return self._stream(record)
+
+    def _stream(self, record):
+        chunks = record.get("chunks") or [record["response"]]
+        gap_ms = 0
+        if self.simulate_latency and len(chunks) > 1:
+            gap_ms = max(record.get("total_ms", 0) - record.get("latency_ms", 0), 0) / (len(chunks) - 1)
+        for idx, chunk in enumerate(chunks):
+            if idx and gap_ms:
+                time.sleep(gap_ms / 1000.0)
+            yield TextResponse(chunk)
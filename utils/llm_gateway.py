@@ -0,0 +1,288 @@
+"""
+Process-wide gateway for every Gemini call
+
+All AI helpers funnel through one LLMGateway so the whole process, not
+each Streamlit session, decides how hard we hit the API:
+
+- at most ``max_concurrent_requests`` calls run at once on a worker pool,
+  with up to ``max_queue_depth`` more waiting; beyond that requests are shed
+- a global token bucket caps requests per minute across all sessions, and a
+  per-session bucket enforces RATE_LIMITS["ai_chatbot_per_hour"]
+- every call is bounded by API_CONFIG["request_timeout"]
+- a circuit breaker stops sending requests after repeated failures until
+  a background probe succeeds
+
+Rejected requests raise GatewayRejectedError so callers can fall back to
+their demo-mode text instead of stalling.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from contextlib import contextmanager
+
+from config.settings import API_CONFIG, LLM_GATEWAY_CONFIG, RATE_LIMITS, CIRCUIT_BREAKER_CONFIG
+from utils.circuit_breaker import CircuitBreaker
+
+
+class GatewayRejectedError(Exception):
+    """Base class for requests the gateway refused to send"""
+
+
+class GatewayOverloadedError(GatewayRejectedError):
+    """Raised when the worker pool and its queue are full"""
+
+
+class RateLimitedError(GatewayRejectedError):
+    """Raised when the session or global request budget is spent"""
+
+
+class CircuitOpenError(GatewayRejectedError):
+    """Raised while the circuit breaker is open"""
+
+
+class LLMTimeoutError(Exception):
+    """Raised when a call does not finish within request_timeout"""
+
+
+class TokenBucket:
+    """Classic token bucket: ``capacity`` burst, refilled at ``rate`` tokens per second"""
+
+    def __init__(self, capacity, rate):
+        self.capacity = capacity
+        self.rate = rate
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def try_acquire(self, tokens=1):
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return True
+            return False
+
+    def refund(self, tokens=1):
+        with self._lock:
+            self._tokens = min(self.capacity, self._tokens + tokens)
+
+
+def current_session_id():
+    """Streamlit session id of the calling script thread, or None outside a session"""
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+        ctx = get_script_run_ctx(suppress_warning=True)
+    except Exception:
+        return None
+    return ctx.session_id if ctx else None
+
+
+class LLMGateway:
+    """
+    Bounded-concurrency, rate-limited executor for model calls.
+
+    Args:
+        max_concurrent_requests: Worker threads making model calls.
+        max_queue_depth: Admitted requests allowed to wait for a worker.
+        request_timeout: Seconds a caller waits for its result.
+        session_per_hour: Requests per Streamlit session per hour.
+        global_per_minute: Requests per minute for the whole process.
+        max_tracked_sessions: Session buckets kept before the oldest is dropped.
+        breaker: Optional CircuitBreaker consulted before every request.
+    """
+
+    def __init__(self, max_concurrent_requests=8, max_queue_depth=32, request_timeout=30,
+                 session_per_hour=50, global_per_minute=60, max_tracked_sessions=10000, breaker=None):
+        self.max_concurrent_requests = max_concurrent_requests
+        self.max_queue_depth = max_queue_depth
+        self.request_timeout = request_timeout
+        self.session_per_hour = session_per_hour
+        self.max_tracked_sessions = max_tracked_sessions
+        self.breaker = breaker
+
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrent_requests, thread_name_prefix="llm-gateway")
+        # One slot per admitted request, whether running or queued
+        self._slots = threading.BoundedSemaphore(max_concurrent_requests + max_queue_depth)
+        self._global_bucket = TokenBucket(global_per_minute, global_per_minute / 60.0)
+        self._session_buckets = OrderedDict()
+        self._lock = threading.Lock()
+
+        self._admitted = 0
+        self._running = 0
+        self._counters = {"completed": 0, "failed": 0, "timed_out": 0, "shed": 0, "rate_limited": 0}
+
+    def _count(self, name):
+        with self._lock:
+            self._counters[name] += 1
+
+    def _session_bucket(self, session_id):
+        with self._lock:
+            bucket = self._session_buckets.get(session_id)
+            if bucket is None:
+                bucket = TokenBucket(self.session_per_hour, self.session_per_hour / 3600.0)
+                self._session_buckets[session_id] = bucket
+                while len(self._session_buckets) > self.max_tracked_sessions:
+                    self._session_buckets.popitem(last=False)
+            else:
+                self._session_buckets.move_to_end(session_id)
+            return bucket
+
+    def _admit(self, session_id):
+        """Charge the rate limits and take a slot, or raise GatewayRejectedError"""
+        session_bucket = self._session_bucket(session_id) if session_id else None
+        if session_bucket and not session_bucket.try_acquire():
+            self._count("rate_limited")
+            raise RateLimitedError("AI request limit reached for this session")
+
+        if not self._global_bucket.try_acquire():
+            if session_bucket:
+                session_bucket.refund()
+            self._count("rate_limited")
+            raise RateLimitedError("AI request limit reached for the site")
+
+        if not self._slots.acquire(blocking=False):
+            # Nothing was sent, so the shed request shouldn't cost budget
+            if session_bucket:
+                session_bucket.refund()
+            self._global_bucket.refund()
+            self._count("shed")
+            raise GatewayOverloadedError("AI request queue is full")
+
+        # Checked last: a half-open breaker grants exactly one trial, which
+        # must not be lost to a rate-limit rejection afterwards
+        if self.breaker is not None and not self.breaker.allow_request():
+            self._slots.release()
+            if session_bucket:
+                session_bucket.refund()
+            self._global_bucket.refund()
+            raise CircuitOpenError("AI service is unavailable; serving fallback")
+
+        with self._lock:
+            self._admitted += 1
+
+    def _release(self):
+        with self._lock:
+            self._admitted -= 1
+        self._slots.release()
+
+    def call(self, fn, *args, session_id=None, **kwargs):
+        """
+        Run ``fn(*args, **kwargs)`` on the worker pool and return its result.
+
+        Raises GatewayRejectedError if the request was not admitted and
+        LLMTimeoutError if it did not finish within request_timeout.
+        """
+        if session_id is None:
+            session_id = current_session_id()
+        self._admit(session_id)
+
+        def run():
+            with self._lock:
+                self._running += 1
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                with self._lock:
+                    self._running -= 1
+                # The slot is held until the call really ends, even if the
+                # caller stopped waiting, so timed-out work still counts
+                self._release()
+
+        try:
+            future = self._executor.submit(run)
+        except BaseException:
+            self._release()
+            raise
+
+        try:
+            result = future.result(timeout=self.request_timeout)
+        except FutureTimeoutError:
+            if future.cancel():
+                # Never started, so run() won't release its slot
+                self._release()
+            self._count("timed_out")
+            error = LLMTimeoutError(f"AI request timed out after {self.request_timeout}s")
+            self._record_failure(error)
+            raise error
+        except Exception as e:
+            self._count("failed")
+            self._record_failure(e)
+            raise
+
+        self._count("completed")
+        self._record_success()
+        return result
+
+    def _record_success(self):
+        if self.breaker is not None:
+            self.breaker.record_success()
+
+    def _record_failure(self, error):
+        if self.breaker is not None:
+            self.breaker.record_failure(error)
+
+    @contextmanager
+    def reserve(self, session_id=None):
+        """
+        Hold an admitted slot for work done on the calling thread (e.g. while
+        a streamed response is consumed).
+        """
+        if session_id is None:
+            session_id = current_session_id()
+        self._admit(session_id)
+        with self._lock:
+            self._running += 1
+        try:
+            yield
+        except Exception as e:
+            self._count("failed")
+            self._record_failure(e)
+            raise
+        else:
+            self._count("completed")
+            self._record_success()
+        finally:
+            with self._lock:
+                self._running -= 1
+            self._release()
+
+    def stats(self):
+        """Queue depth and outcome counters for monitoring"""
+        with self._lock:
+            return {
+                "running": self._running,
+                "queue_depth": max(self._admitted - self._running, 0),
+                "max_concurrent_requests": self.max_concurrent_requests,
+                "max_queue_depth": self.max_queue_depth,
+                "tracked_sessions": len(self._session_buckets),
+                **self._counters,
+            }
+
+
+_gateway = None
+_gateway_lock = threading.Lock()
+
+
+def get_llm_gateway():
+    """Process-wide LLMGateway built from LLM_GATEWAY_CONFIG and RATE_LIMITS"""
+    global _gateway
+    if _gateway is None:
+        with _gateway_lock:
+            if _gateway is None:
+                _gateway = LLMGateway(
+                    max_concurrent_requests=LLM_GATEWAY_CONFIG["max_concurrent_requests"],
+                    max_queue_depth=LLM_GATEWAY_CONFIG["max_queue_depth"],
+                    request_timeout=API_CONFIG["request_timeout"],
+                    session_per_hour=RATE_LIMITS["ai_chatbot_per_hour"],
+                    global_per_minute=LLM_GATEWAY_CONFIG["global_requests_per_minute"],
+                    breaker=CircuitBreaker(
+                        "gemini",
+                        failure_threshold=CIRCUIT_BREAKER_CONFIG["failure_threshold"],
+                        recovery_timeout=CIRCUIT_BREAKER_CONFIG["recovery_timeout"],
+                    ),
+                )
+    return _gateway
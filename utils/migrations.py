@@ -0,0 +1,373 @@
+"""
+Versioned schema migrations
+
+Migrations live in ``migrations/`` as numbered files applied in order:
+
+    0001_create_tables.sql      plain SQL, any number of statements
+    0003_full_text_search.py    a module whose ``statements()`` returns SQL
+                                (strings or psycopg2.sql objects), for DDL
+                                rendered from config
+
+Each applied migration is recorded in ``schema_version`` with a checksum of
+its SQL, so it runs exactly once; editing an applied file only produces a
+warning; ship a new migration instead. A session advisory lock serializes
+concurrent runs (several app instances starting at once): the others wait,
+then find nothing left to do.
+
+Every migration runs in its own transaction unless its SQL file starts with
+``-- migrate: no-transaction`` (``NO_TRANSACTION = True`` in a module). That
+is required for CREATE INDEX CONCURRENTLY and other online operations, which
+build without blocking writes; the statements then run one at a time in
+autocommit mode. ``-- migrate: optional`` (``OPTIONAL = True``) marks a
+migration whose failure is reported and skipped rather than stopping the
+run, e.g. one needing an extension the host may not allow; it is retried on
+the next run.
+"""
+
+import hashlib
+import importlib.util
+import re
+import time
+from pathlib import Path
+
+import psycopg2
+from psycopg2 import sql
+
+MIGRATIONS_DIR = Path(__file__).parent.parent / "migrations"
+
+_FILENAME = re.compile(r"^(\d+)_(\w+)\.(sql|py)$")
+_DIRECTIVE = re.compile(r"^--\s*migrate:\s*(.+)$")
+
+_CREATE_VERSION_TABLE = """
+    CREATE TABLE IF NOT EXISTS schema_version (
+        version INTEGER PRIMARY KEY,
+        name VARCHAR(255) NOT NULL,
+        checksum CHAR(64) NOT NULL,
+        applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        execution_ms INTEGER
+    )
+"""
+
+
+class MigrationError(Exception):
+    """Raised for malformed migration files"""
+
+
+def split_statements(text):
+    """
+    Split a SQL script into statements on top-level semicolons.
+
+    Semicolons inside quotes, dollar-quoted bodies and comments do not
+    split; comment-only fragments are dropped.
+    """
+    statements = []
+    start = 0
+    i = 0
+    n = len(text)
+    while i < n:
+        ch = text[i]
+        if ch == "-" and text.startswith("--", i):
+            end = text.find("\n", i)
+            i = n if end == -1 else end + 1
+        elif ch == "/" and text.startswith("/*", i):
+            end = text.find("*/", i + 2)
+            i = n if end == -1 else end + 2
+        elif ch in ("'", '"'):
+            end = i + 1
+            while True:
+                end = text.find(ch, end)
+                if end == -1:
+                    end = n
+                    break
+                # A doubled quote is an escaped quote
+                if text.startswith(ch * 2, end):
+                    end += 2
+                    continue
+                break
+            i = end + 1
+        elif ch == "$":
+            tag = re.match(r"\$[A-Za-z_]?\w*\$", text[i:])
+            if tag:
+                end = text.find(tag.group(), i + len(tag.group()))
+                i = n if end == -1 else end + len(tag.group())
+            else:
+                i += 1
+        elif ch == ";":
+            statements.append(text[start:i])
+            i += 1
+            start = i
+        else:
+            i += 1
+    statements.append(text[start:])
+
+    def has_code(statement):
+        code = re.sub(r"--[^\n]*|/\*.*?\*/", "", statement, flags=re.S)
+        return code.strip()
+
+    return [statement.strip() for statement in statements if has_code(statement)]
+
+
+class Migration:
+    """One numbered migration file"""
+
+    def __init__(self, path):
+        match = _FILENAME.match(path.name)
+        if not match:
+            raise MigrationError(f"Not a migration file name: {path.name}")
+        self.path = path
+        self.version = int(match.group(1))
+        self.name = match.group(2)
+        self.kind = match.group(3)
+        self.no_transaction = False
+        self.optional = False
+        self._module = None
+
+        if self.kind == "sql":
+            self._text = path.read_text(encoding="utf-8")
+            for line in self._text.splitlines():
+                line = line.strip()
+                if not line.startswith("--"):
+                    break
+                directive = _DIRECTIVE.match(line)
+                if directive:
+                    options = {option.strip() for option in directive.group(1).split(",")}
+                    self.no_transaction |= "no-transaction" in options
+                    self.optional |= "optional" in options
+        else:
+            spec = importlib.util.spec_from_file_location(f"migration_{self.version:04d}_{self.name}", path)
+            self._module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(self._module)
+            if not callable(getattr(self._module, "statements", None)):
+                raise MigrationError(f"{path.name} must define statements()")
+            self.no_transaction = bool(getattr(self._module, "NO_TRANSACTION", False))
+            self.optional = bool(getattr(self._module, "OPTIONAL", False))
+
+    @property
+    def label(self):
+        return f"{self.version:04d}_{self.name}"
+
+    def render(self, conn):
+        """The migration's SQL statements as strings"""
+        if self._module is None:
+            return split_statements(self._text)
+        rendered = []
+        for statement in self._module.statements():
+            if isinstance(statement, sql.Composable):
+                statement = statement.as_string(conn)
+            rendered.append(statement.strip())
+        return rendered
+
+    @staticmethod
+    def checksum(statements):
+        return hashlib.sha256("\n;\n".join(statements).encode("utf-8")).hexdigest()
+
+
+def discover(directory=MIGRATIONS_DIR):
+    """All migrations in ``directory``, by version"""
+    migrations = []
+    seen = {}
+    for path in sorted(Path(directory).iterdir()):
+        if not _FILENAME.match(path.name):
+            continue
+        migration = Migration(path)
+        if migration.version in seen:
+            raise MigrationError(f"Duplicate migration version {migration.version}: "
+                                 f"{seen[migration.version]} and {path.name}")
+        seen[migration.version] = path.name
+        migrations.append(migration)
+    return sorted(migrations, key=lambda migration: migration.version)
+
+
+class Migrator:
+    """
+    Applies pending migrations over a dedicated connection.
+
+    Args:
+        connect: Callable returning a new psycopg2 connection (a session of
+            its own: the advisory lock is held across transactions)
+        directory: Folder holding the migration files
+        lock_key: bigint key for pg_advisory_lock, shared by every instance
+        lock_wait: Seconds to wait for another instance's run to finish
+        statement_timeout: Milliseconds per statement (0 = no limit, for
+            index builds on large tables)
+        lock_timeout: Milliseconds a DDL statement may wait for a table lock
+            before failing, so it never queues app queries behind it for long
+        log: Called with each progress line
+    """
+
+    def __init__(self, connect, directory=MIGRATIONS_DIR, lock_key=0, lock_wait=300,
+                 statement_timeout=0, lock_timeout=5000, log=print):
+        self._connect = connect
+        self.directory = Path(directory)
+        self.lock_key = lock_key
+        self.lock_wait = lock_wait
+        self.statement_timeout = statement_timeout
+        self.lock_timeout = lock_timeout
+        self._log = log
+
+    def _open(self):
+        conn = self._connect()
+        if conn is None:
+            return None
+        conn.autocommit = True
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT set_config('statement_timeout', %s, false)", (str(self.statement_timeout),))
+            cursor.execute("SELECT set_config('lock_timeout', %s, false)", (str(self.lock_timeout),))
+        return conn
+
+    def _acquire_lock(self, conn):
+        deadline = time.monotonic() + self.lock_wait
+        waiting = False
+        with conn.cursor() as cursor:
+            while True:
+                cursor.execute("SELECT pg_try_advisory_lock(%s)", (self.lock_key,))
+                if cursor.fetchone()[0]:
+                    return True
+                if time.monotonic() >= deadline:
+                    return False
+                if not waiting:
+                    self._log("⏳ Another process is running migrations, waiting...")
+                    waiting = True
+                time.sleep(1)
+
+    @staticmethod
+    def _applied(conn):
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT to_regclass('schema_version') IS NOT NULL")
+            if not cursor.fetchone()[0]:
+                return {}
+            cursor.execute("SELECT version, checksum, applied_at FROM schema_version")
+            return {version: (checksum, applied_at) for version, checksum, applied_at in cursor.fetchall()}
+
+    def status(self):
+        """List of ``(migration, applied_at or None)``, or None without a database"""
+        conn = self._open()
+        if conn is None:
+            return None
+        try:
+            applied = self._applied(conn)
+            return [(migration, applied.get(migration.version, (None, None))[1])
+                    for migration in discover(self.directory)]
+        finally:
+            conn.close()
+
+    def run(self, dry_run=False, target=None):
+        """
+        Apply pending migrations up to ``target`` (default: all).
+
+        With ``dry_run`` nothing is executed: each pending migration's SQL
+        is logged instead. Returns True when the schema is up to date (or
+        the dry run succeeded).
+        """
+        migrations = [migration for migration in discover(self.directory)
+                      if target is None or migration.version <= target]
+        conn = self._open()
+        if conn is None:
+            return False
+
+        locked = False
+        try:
+            if not dry_run:
+                locked = self._acquire_lock(conn)
+                if not locked:
+                    self._log(f"❌ Timed out after {self.lock_wait}s waiting for the migration lock")
+                    return False
+                with conn.cursor() as cursor:
+                    cursor.execute(_CREATE_VERSION_TABLE)
+
+            # Read after taking the lock: another instance may just have
+            # applied what we were about to
+            applied = self._applied(conn)
+            pending = 0
+            for migration in migrations:
+                statements = migration.render(conn)
+                checksum = Migration.checksum(statements)
+
+                if migration.version in applied:
+                    if applied[migration.version][0] != checksum:
+                        self._log(f"⚠️ {migration.label} changed after it was applied; "
+                                  f"add a new migration instead of editing it")
+                    continue
+
+                pending += 1
+                if dry_run:
+                    self._log_plan(migration, statements)
+                    continue
+                if not self._apply(conn, migration, statements, checksum) and not migration.optional:
+                    return False
+
+            if pending == 0:
+                self._log("✅ Schema is up to date")
+            elif dry_run:
+                self._log(f"📝 {pending} pending migration(s); nothing was executed (dry run)")
+            return True
+        finally:
+            if locked:
+                with conn.cursor() as cursor:
+                    cursor.execute("SELECT pg_advisory_unlock(%s)", (self.lock_key,))
+            conn.close()
+
+    def _log_plan(self, migration, statements):
+        flags = [flag for flag, on in (("no transaction", migration.no_transaction),
+                                       ("optional", migration.optional)) if on]
+        self._log(f"-- {migration.label}" + (f" ({', '.join(flags)})" if flags else ""))
+        for statement in statements:
+            self._log(f"{statement};")
+        self._log("")
+
+    def _apply(self, conn, migration, statements, checksum):
+        self._log(f"🔧 Applying {migration.label}" + (" (no transaction)" if migration.no_transaction else ""))
+        record = (
+            "INSERT INTO schema_version (version, name, checksum, execution_ms) VALUES (%s, %s, %s, %s)"
+        )
+        start = time.perf_counter()
+        try:
+            if migration.no_transaction:
+                # Each statement commits on its own; a failure leaves the
+                # earlier ones in place, so these migrations use IF NOT EXISTS
+                # and can simply be re-run
+                with conn.cursor() as cursor:
+                    for statement in statements:
+                        cursor.execute(statement)
+                    elapsed = int((time.perf_counter() - start) * 1000)
+                    cursor.execute(record, (migration.version, migration.name, checksum, elapsed))
+            else:
+                conn.autocommit = False
+                try:
+                    with conn.cursor() as cursor:
+                        for statement in statements:
+                            cursor.execute(statement)
+                        elapsed = int((time.perf_counter() - start) * 1000)
+                        cursor.execute(record, (migration.version, migration.name, checksum, elapsed))
+                    conn.commit()
+                except Exception:
+                    conn.rollback()
+                    raise
+                finally:
+                    conn.autocommit = True
+        except psycopg2.Error as e:
+            message = str(e).strip().splitlines()[0] if str(e).strip() else type(e).__name__
+            if migration.optional:
+                self._log(f"   ⚠️ Skipped optional migration {migration.label}: {message}")
+            else:
+                self._log(f"   ❌ {migration.label} failed: {message}")
+                if migration.no_transaction:
+                    self._log_invalid_indexes(conn)
+            return False
+
+        self._log(f"   ✅ {migration.label} applied in {time.perf_counter() - start:.1f}s")
+        return True
+
+    def _log_invalid_indexes(self, conn):
+        # A failed CREATE INDEX CONCURRENTLY leaves an INVALID index behind,
+        # which IF NOT EXISTS would then skip on the next run
+        with conn.cursor() as cursor:
+            cursor.execute("""
+                SELECT indexrelid::regclass::text FROM pg_index
+                JOIN pg_class ON pg_class.oid = pg_index.indexrelid
+                JOIN pg_namespace ON pg_namespace.oid = pg_class.relnamespace
+                WHERE NOT indisvalid AND nspname = current_schema()
+            """)
+            invalid = [row[0] for row in cursor.fetchall()]
+        if invalid:
+            self._log(f"   ⚠️ Invalid indexes left behind, drop them before re-running: {', '.join(invalid)}")
@@ -0,0 +1,101 @@
+"""
+Compact row records
+
+List helpers return rows as ``__slots__`` records instead of RealDictRow
+dicts: one small fixed-size object per row rather than a hash table, and a
+pickle (what st.cache_data stores) that carries the column names once per
+result instead of once per row. Records keep the read-only mapping
+interface pages already use (``row["title"]``, ``row.get("rating", 0)``,
+``row.keys()``), so they are drop-in replacements for dict rows.
+"""
+
+_record_types = {}
+
+
+def _restore(fields, values):
+    return record_type(fields)(*values)
+
+
+class Record:
+    """Base class for row records; see record_type()"""
+
+    __slots__ = ()
+    _fields = ()
+
+    def __init__(self, *values):
+        for name, value in zip(self._fields, values):
+            setattr(self, name, value)
+
+    def __getitem__(self, key):
+        if key not in self._fields:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key, default=None):
+        if key not in self._fields:
+            return default
+        return getattr(self, key)
+
+    def __contains__(self, key):
+        return key in self._fields
+
+    def __iter__(self):
+        return iter(self._fields)
+
+    def __len__(self):
+        return len(self._fields)
+
+    def keys(self):
+        return self._fields
+
+    def values(self):
+        return tuple(getattr(self, name) for name in self._fields)
+
+    def items(self):
+        return tuple((name, getattr(self, name)) for name in self._fields)
+
+    def _asdict(self):
+        return dict(self.items())
+
+    def __eq__(self, other):
+        if isinstance(other, Record):
+            return self._fields == other._fields and self.values() == other.values()
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"{type(self).__name__}({', '.join(f'{k}={v!r}' for k, v in self.items())})"
+
+    def __reduce__(self):
+        # All records of a result share one _fields tuple, which pickle
+        # memoizes, so the column names are written once per result
+        return _restore, (self._fields, self.values())
+
+
+def record_type(fields):
+    """
+    Record class for rows with the given column names, created once per
+    distinct column list.
+
+    Args:
+        fields: Column names in result order
+
+    Returns:
+        A Record subclass whose instances take the column values positionally
+    """
+    fields = tuple(fields)
+    cls = _record_types.get(fields)
+    if cls is None:
+        clashes = [name for name in fields if name.startswith("_") or hasattr(Record, name)]
+        if clashes:
+            raise ValueError(f"Column names not usable as record fields: {clashes}")
+        cls = type("Row", (Record,), {"__slots__": fields, "_fields": fields})
+        _record_types[fields] = cls
+    return cls
+
+
+def make_records(fields, rows):
+    """Turn value tuples (e.g. from a plain cursor's fetchall) into records"""
+    cls = record_type(fields)
+    return [cls(*row) for row in rows]
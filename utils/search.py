@@ -0,0 +1,226 @@
+"""
+In-memory full-text search over lists of row dicts
+
+SearchIndex keeps an inverted index (term -> postings) over a few text
+fields so a query costs roughly the size of the postings it touches
+instead of a lower()+substring scan of every field of every row. Query
+terms match whole words or word prefixes ("eng" finds "engineer"), every
+query term must match, and results are ranked with BM25. Rows can be
+added one at a time after the initial build.
+
+Postings are kept in compact ``array`` buffers and scored with numpy, so
+even terms that occur in most rows cost a few vectorised passes rather
+than a Python loop per row.
+"""
+
+import bisect
+import re
+import threading
+from array import array
+
+import numpy as np
+
+_TOKEN = re.compile(r"[^\W_]+")
+
+
+def tokenize(text):
+    """Lower-cased word tokens of ``text``"""
+    if not text:
+        return []
+    return _TOKEN.findall(str(text).lower())
+
+
+class SearchIndex:
+    """
+    Inverted index with prefix matching and BM25 ranking.
+
+    Args:
+        fields: Field names to index, or a {field: weight} dict. A term's
+            frequency in a row is the weighted sum over fields, so e.g. a
+            title hit can count for more than a description hit.
+        k1: BM25 term-frequency saturation.
+        b: BM25 length normalisation.
+        max_expansions: Most frequent vocabulary terms a prefix may expand to.
+    """
+
+    def __init__(self, fields, k1=1.2, b=0.75, max_expansions=50):
+        if isinstance(fields, dict):
+            self.fields = dict(fields)
+        else:
+            self.fields = {field: 1.0 for field in fields}
+        self.k1 = k1
+        self.b = b
+        self.max_expansions = max_expansions
+
+        self._items = []
+        self._order = []              # display rank; lower comes first on ties
+        self._doc_lengths = array("f")
+        self._total_length = 0.0
+        # term -> (doc ids, weighted term frequencies); doc ids only grow,
+        # so every postings list stays sorted
+        self._postings = {}
+        self._sorted_terms = []
+        self._front = 0
+
+        # numpy copies of postings / length norms, rebuilt lazily after adds
+        self._frozen = {}
+        self._norms = None
+        self._order_array = None
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._items)
+
+    def add(self, item, at_front=False):
+        """
+        Index one row and return its doc id.
+
+        ``at_front`` ranks the row ahead of everything already indexed when
+        scores tie, e.g. for a newly inserted row in a newest-first feed.
+        """
+        with self._lock:
+            return self._add(item, at_front)
+
+    def _add(self, item, at_front):
+        doc_id = len(self._items)
+        self._items.append(item)
+        if at_front:
+            self._front -= 1
+            self._order.append(self._front)
+        else:
+            self._order.append(doc_id)
+
+        frequencies = {}
+        length = 0.0
+        for field, weight in self.fields.items():
+            for term in tokenize(item.get(field)):
+                frequencies[term] = frequencies.get(term, 0.0) + weight
+                length += weight
+
+        self._doc_lengths.append(length)
+        self._total_length += length
+        self._norms = None
+        self._order_array = None
+
+        for term, frequency in frequencies.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = (array("I"), array("f"))
+                self._postings[term] = postings
+                if self._sorted_terms is not None:
+                    bisect.insort(self._sorted_terms, term)
+            postings[0].append(doc_id)
+            postings[1].append(frequency)
+            self._frozen.pop(term, None)
+        return doc_id
+
+    def add_many(self, items):
+        """Index rows in order (display order on ties follows the input)"""
+        with self._lock:
+            # Sort the vocabulary once at the end rather than insort per new term
+            self._sorted_terms = None
+            for item in items:
+                self._add(item, False)
+            self._sorted_terms = sorted(self._postings)
+
+    def _expand(self, token):
+        """Vocabulary terms ``token`` matches: itself plus words it prefixes"""
+        start = bisect.bisect_left(self._sorted_terms, token)
+        end = bisect.bisect_left(self._sorted_terms, token + "\uffff", start)
+        terms = self._sorted_terms[start:end]
+        if len(terms) > self.max_expansions:
+            terms.sort(key=lambda term: len(self._postings[term][0]), reverse=True)
+            terms = terms[:self.max_expansions]
+            if token in self._postings and token not in terms:
+                terms.append(token)
+        return terms
+
+    def _postings_arrays(self, term):
+        frozen = self._frozen.get(term)
+        if frozen is None:
+            doc_ids, frequencies = self._postings[term]
+            frozen = (np.array(doc_ids, dtype=np.int64), np.array(frequencies, dtype=np.float64))
+            self._frozen[term] = frozen
+        return frozen
+
+    def _length_norms(self):
+        """Per-row BM25 length normalisation k1 * (1 - b + b * len / avg_len)"""
+        if self._norms is None:
+            lengths = np.array(self._doc_lengths, dtype=np.float64)
+            avg_length = self._total_length / len(lengths)
+            if avg_length:
+                self._norms = self.k1 * (1 - self.b + self.b * lengths / avg_length)
+            else:
+                self._norms = np.full(len(lengths), self.k1)
+        return self._norms
+
+    def _display_order(self):
+        if self._order_array is None:
+            self._order_array = np.array(self._order, dtype=np.int64)
+        return self._order_array
+
+    def _score_token(self, terms, token, norms):
+        """Dense per-row BM25 score of the best of ``terms`` (``token``'s expansions)"""
+        doc_count = len(self._items)
+        scores = np.zeros(doc_count)
+        for term in terms:
+            doc_ids, tf = self._postings_arrays(term)
+            df = len(doc_ids)
+            idf = np.log(1 + (doc_count - df + 0.5) / (df + 0.5))
+            # Prefix expansions rank just below an exact word match
+            if term != token:
+                idf *= 0.9
+            term_scores = idf * tf * (self.k1 + 1) / (tf + norms[doc_ids])
+            # doc ids are unique within one postings list
+            scores[doc_ids] = np.maximum(scores[doc_ids], term_scores)
+        return scores
+
+    def search(self, query, limit=None):
+        """
+        Rows matching every term of ``query``, best match first.
+
+        An empty query returns every row in display order.
+        """
+        tokens = list(dict.fromkeys(tokenize(query)))
+        with self._lock:
+            if not self._items:
+                return []
+            order = self._display_order()
+            if not tokens:
+                ranked = np.argsort(order, kind="stable")[:limit]
+                return [self._items[doc_id] for doc_id in ranked]
+
+            expansions = [self._expand(token) for token in tokens]
+            if not all(expansions):
+                return []
+
+            norms = self._length_norms()
+            totals = None
+            for token, terms in zip(tokens, expansions):
+                scores = self._score_token(terms, token, norms)
+                if totals is None:
+                    totals, matched = scores, scores > 0
+                else:
+                    totals += scores
+                    matched &= scores > 0
+                if not matched.any():
+                    return []
+
+            candidates = np.flatnonzero(matched)
+            ranked = candidates[np.lexsort((order[candidates], -totals[candidates]))][:limit]
+            return [self._items[doc_id] for doc_id in ranked]
+
+    def stats(self):
+        """Size figures for benchmarks"""
+        return {
+            "documents": len(self._items),
+            "terms": len(self._postings),
+            "postings": sum(len(doc_ids) for doc_ids, _ in self._postings.values()),
+        }
+
+
+def build_index(items, fields, **kwargs):
+    """Build a SearchIndex over ``items``"""
+    index = SearchIndex(fields, **kwargs)
+    index.add_many(items)
+    return index